@@ -151,6 +151,9 @@ class PipelineTuiApp(App):
         # Initialize pipeline executor
         self._executor = PipelineExecutor()
 
+        # Tab container, resolved once on mount for the tab switching actions
+        self._tabs: TabbedContent | None = None
+
         # Apply initial directories if provided
         if source_dir:
             self.state.config.source_path = source_dir
@@ -307,20 +310,32 @@ class PipelineTuiApp(App):
     # Tab switching actions
     # -------------------------------------------------------------------------
 
+    def on_mount(self) -> None:
+        """Cache the tab container used by the tab switching keybindings."""
+        self._tabs = self.query_one(TabbedContent)
+
+    def _switch_tab(self, tab_id: str) -> None:
+        """
+        Activate a tab by pane ID.
+
+        Args:
+            tab_id: ID of the TabPane to show
+        """
+        if self._tabs is None:
+            self._tabs = self.query_one(TabbedContent)
+        self._tabs.active = tab_id
+
     def action_tab_configure(self) -> None:
         """Switch to Configure tab."""
-        tabbed = self.query_one(TabbedContent)
-        tabbed.active = "configure"
+        self._switch_tab("configure")
 
     def action_tab_monitor(self) -> None:
         """Switch to Monitor tab."""
-        tabbed = self.query_one(TabbedContent)
-        tabbed.active = "monitor"
+        self._switch_tab("monitor")
 
     def action_tab_history(self) -> None:
         """Switch to History tab."""
-        tabbed = self.query_one(TabbedContent)
-        tabbed.active = "history"
+        self._switch_tab("history")
 
     # -------------------------------------------------------------------------
     # Pipeline actions
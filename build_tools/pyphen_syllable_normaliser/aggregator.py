@@ -8,8 +8,13 @@ and maintaining raw counts.
 
 from __future__ import annotations
 
+import os
+from collections.abc import Iterator
 from pathlib import Path
 
+# Characters that make a glob pattern more than a plain "*<suffix>" match
+_GLOB_SPECIAL_CHARS = frozenset("*?[")
+
 
 class FileAggregator:
     """
@@ -204,6 +209,13 @@ def discover_input_files(
     if not source_dir.is_dir():
         raise ValueError(f"Source path is not a directory: {source_dir}")
 
+    # Fast path: "*<suffix>" patterns (e.g. the default "*.txt") are matched
+    # with os.scandir and a plain suffix check, avoiding per-entry Path
+    # construction and fnmatch calls on large directories.
+    suffix = _simple_suffix(pattern)
+    if suffix is not None:
+        return sorted(_scan_suffix(str(source_dir), suffix, recursive))
+
     # Use glob or rglob depending on recursive flag
     if recursive:
         # Recursive: scan all subdirectories
@@ -217,3 +229,46 @@ def discover_input_files(
 
     # Sort for deterministic order
     return sorted(files)
+
+
+def _simple_suffix(pattern: str) -> str | None:
+    """
+    Return the literal suffix of a ``"*<suffix>"`` glob pattern.
+
+    Args:
+        pattern: Glob pattern passed to discover_input_files().
+
+    Returns:
+        The suffix (e.g. ``".txt"``) if the pattern is a single leading ``*``
+        followed by literal characters, otherwise None.
+    """
+    if not pattern.startswith("*"):
+        return None
+    suffix = pattern[1:]
+    if any(char in _GLOB_SPECIAL_CHARS for char in suffix) or "/" in suffix:
+        return None
+    return suffix
+
+
+def _scan_suffix(root: str, suffix: str, recursive: bool) -> Iterator[Path]:
+    """
+    Yield files under ``root`` whose name ends with ``suffix``.
+
+    Mirrors Path.glob/rglob semantics for simple patterns: files reached
+    through symlinks are included, but symlinked directories are not
+    descended into during recursive scans.
+
+    Args:
+        root: Directory to scan.
+        suffix: Literal filename suffix to match.
+        recursive: If True, descend into subdirectories.
+
+    Yields:
+        Path objects for each matching file (unordered).
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.name.endswith(suffix) and entry.is_file():
+                yield Path(entry.path)
+            elif recursive and entry.is_dir(follow_symlinks=False):
+                yield from _scan_suffix(entry.path, suffix, recursive)
@@ -17,6 +17,37 @@ from typing import cast
 
 from .models import FrequencyEntry
 
+# Optional fast JSON encoder (falls back to stdlib json if not installed)
+try:
+    import orjson  # type: ignore[import-not-found]
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+    ORJSON_AVAILABLE = False
+
+
+def _dump_json(obj: dict[str, int], output_path: Path) -> None:
+    """
+    Serialize a frequency dictionary to ``output_path`` in a single write.
+
+    Uses orjson when available (encodes straight to UTF-8 bytes), otherwise
+    the stdlib json encoder. Both paths produce byte-identical output:
+    2-space indentation, keys sorted, non-ASCII kept as-is, and a trailing
+    newline.
+
+    Args:
+        obj: Dictionary mapping syllable to occurrence count.
+        output_path: Path where the JSON file should be written.
+    """
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+        output_path.write_bytes(data + b"\n")
+        return
+
+    text = json.dumps(obj, indent=2, sort_keys=True, ensure_ascii=False)
+    output_path.write_text(text + "\n", encoding="utf-8")
+
 
 class FrequencyAnalyzer:
     """
@@ -175,14 +206,14 @@ class FrequencyAnalyzer:
         Note:
             The JSON is formatted with 2-space indentation and keys are
             sorted alphabetically for consistent diffs in version control.
+            If orjson is installed it is used for encoding; the output is
+            identical to the stdlib encoder.
         """
         # Ensure parent directory exists
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Write JSON with sorted keys and pretty formatting
-        with output_path.open("w", encoding="utf-8") as f:
-            json.dump(frequencies, f, indent=2, sort_keys=True, ensure_ascii=False)
-            f.write("\n")  # Trailing newline for POSIX compliance
+        # Write JSON with sorted keys, pretty formatting and trailing newline
+        _dump_json(frequencies, output_path)
 
     def save_unique_syllables(self, unique_syllables: list[str], output_path: Path) -> None:
         """
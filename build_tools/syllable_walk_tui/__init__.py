@@ -28,4 +28,22 @@ Design Philosophy:
     interactive parameter tweaking.
 """
 
-__version__ = "0.5.0"
+from typing import Any
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve ``__version__`` from the installed package metadata on first access.
+
+    Falls back to the in-tree ``pipeworks_name_generation.__version__`` when the
+    distribution is not installed (e.g. running from a source checkout).
+    """
+    if name == "__version__":
+        from importlib.metadata import PackageNotFoundError, version
+
+        try:
+            return version("pipeworks-name-generation")
+        except PackageNotFoundError:
+            from pipeworks_name_generation import __version__
+
+            return __version__
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -10,8 +10,6 @@ from __future__ import annotations
 
 import sys
 
-from build_tools.syllable_walk_tui.core import SyllableWalkerApp
-
 
 def main(args: list[str] | None = None) -> int:
     """
@@ -25,6 +23,9 @@ def main(args: list[str] | None = None) -> int:
         Exit code (0 for success, non-zero for error).
     """
     try:
+        # Import here so importing this module does not load Textual
+        from build_tools.syllable_walk_tui.core import SyllableWalkerApp
+
         app = SyllableWalkerApp()
         app.run()
         return 0
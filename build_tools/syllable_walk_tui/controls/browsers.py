@@ -29,7 +29,6 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from build_tools.syllable_walk_tui.services.corpus import validate_corpus_directory
 from build_tools.tui_common.controls import DirectoryBrowserScreen
 
 
@@ -58,72 +57,12 @@ class CorpusBrowserScreen(DirectoryBrowserScreen):
                 self.load_corpus(result)
     """
 
-    # CSS must be redeclared for subclass - Textual CSS selectors are class-name specific
+    # Root rule must be redeclared for subclass - Textual CSS selectors are class-name specific
     CSS = """
     CorpusBrowserScreen {
         align: center middle;
     }
-
-    #browser-container {
-        width: 80;
-        height: 30;
-        background: $panel;
-        border: thick $primary;
-        padding: 1;
-    }
-
-    #browser-header {
-        text-align: center;
-        text-style: bold;
-        color: $accent;
-        margin-bottom: 1;
-    }
-
-    #directory-tree {
-        width: 100%;
-        height: 1fr;
-        border: solid $primary;
-        margin-bottom: 1;
-    }
-
-    #help-text {
-        height: 2;
-        width: 100%;
-        color: $text-muted;
-        text-align: center;
-        margin-bottom: 1;
-    }
-
-    #validation-status {
-        height: 3;
-        width: 100%;
-        border: solid $primary;
-        padding: 0 1;
-        margin-bottom: 1;
-    }
-
-    .status-valid {
-        color: $success;
-    }
-
-    .status-invalid {
-        color: $error;
-    }
-
-    .status-none {
-        color: $text-muted;
-    }
-
-    #button-bar {
-        width: 100%;
-        height: auto;
-        align: center middle;
-    }
-
-    #button-bar Button {
-        margin: 0 1;
-    }
-    """
+    """ + DirectoryBrowserScreen.BROWSER_CSS
 
     def __init__(self, initial_dir: Path | None = None) -> None:
         """
@@ -132,6 +71,8 @@ class CorpusBrowserScreen(DirectoryBrowserScreen):
         Args:
             initial_dir: Starting directory for browser (defaults to home directory)
         """
+        from build_tools.syllable_walk_tui.services.corpus import validate_corpus_directory
+
         super().__init__(
             title="Select Corpus Directory",
             validator=validate_corpus_directory,
@@ -13,7 +13,9 @@ This module provides:
 - Panel update helpers (update_combiner_panel, update_selector_panel)
 """
 
+import logging
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -21,6 +23,12 @@ if TYPE_CHECKING:
     from build_tools.syllable_walk_tui.core.app import SyllableWalkerApp
     from build_tools.syllable_walk_tui.modules.oscillator import PatchState
 
+logger = logging.getLogger(__name__)
+
+# Default corpus location relative to the repository root (core/ -> syllable_walk_tui/
+# -> build_tools/ -> repo root).
+WORKING_OUTPUT_DIR = Path(__file__).resolve().parents[3] / "_working" / "output"
+
 
 @dataclass
 class PatchValidationResult:
@@ -71,7 +79,7 @@ def open_database_for_patch(
     """
     from build_tools.syllable_walk_tui.modules.database import DatabaseScreen
 
-    patch = app.state.patch_a if patch_name == "A" else app.state.patch_b
+    patch = app.get_patch(patch_name)
 
     if patch.corpus_dir:
         db_path = patch.corpus_dir / "data" / "corpus.db"
@@ -108,7 +116,7 @@ def get_initial_browse_dir(app: "SyllableWalkerApp", patch_name: str) -> Path:
     Returns:
         Path to start browsing from
     """
-    patch = app.state.patch_a if patch_name == "A" else app.state.patch_b
+    patch = app.get_patch(patch_name)
 
     # 1. Use patch's current corpus_dir if set
     if patch.corpus_dir and patch.corpus_dir.exists():
@@ -118,13 +126,23 @@ def get_initial_browse_dir(app: "SyllableWalkerApp", patch_name: str) -> Path:
     if app.state.last_browse_dir and app.state.last_browse_dir.exists():
         return app.state.last_browse_dir
 
-    # 3. Try _working/output/ if it exists
-    project_root = Path(__file__).parent.parent.parent
-    working_output = project_root / "_working" / "output"
-    if working_output.exists() and working_output.is_dir():
-        return working_output
+    # 3./4. Fixed fallbacks, probed once per session
+    return _default_browse_dir()
+
+
+@lru_cache(maxsize=1)
+def _default_browse_dir() -> Path:
+    """
+    Resolve the fallback browse directory once.
+
+    The ``_working/output`` location and the home directory do not move while the
+    TUI runs, so the stat calls are made on the first corpus browser open only.
 
-    # 4. Fall back to home directory
+    Returns:
+        ``WORKING_OUTPUT_DIR`` if it is a directory, otherwise the home directory
+    """
+    if WORKING_OUTPUT_DIR.is_dir():
+        return WORKING_OUTPUT_DIR
     return Path.home()
 
 
@@ -143,7 +161,7 @@ def validate_patch_ready(
         PatchValidationResult with is_valid=True and patch if ready,
         or is_valid=False with error_message if not ready.
     """
-    patch = app.state.patch_a if patch_name == "A" else app.state.patch_b
+    patch = app.get_patch(patch_name)
 
     if not patch.is_ready_for_generation():
         key_hint = 1 if patch_name == "A" else 2
@@ -173,7 +191,7 @@ def update_combiner_panel(
         panel = app.query_one(f"#combiner-panel-{patch_name.lower()}", CombinerPanel)
         panel.update_output(meta_output)
     except Exception as e:
-        print(f"Warning: Could not update combiner panel: {e}")
+        logger.debug("Could not update combiner panel: %s", e)
 
 
 def update_selector_panel(
@@ -197,4 +215,4 @@ def update_selector_panel(
         panel = app.query_one(f"#selector-panel-{patch_name.lower()}", SelectorPanel)
         panel.update_output(meta_output, selected_names)
     except Exception as e:
-        print(f"Warning: Could not update selector panel: {e}")
+        logger.debug("Could not update selector panel: %s", e)
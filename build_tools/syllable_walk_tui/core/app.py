@@ -10,13 +10,19 @@ Architecture:
 - Keyboard-first navigation with configurable keybindings
 """
 
+import asyncio
+import logging
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any
 
 from textual import on, work
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal, VerticalScroll
+from textual.timer import Timer
 from textual.widgets import Button, Footer, Header, Label, Select
+from textual.worker import Worker
 
 from build_tools.syllable_walk_tui.controls import (
     CorpusBrowserScreen,
@@ -29,22 +35,31 @@ from build_tools.syllable_walk_tui.core import actions, handlers, ui_updates
 from build_tools.syllable_walk_tui.core.state import AppState
 from build_tools.syllable_walk_tui.modules.analyzer import AnalysisScreen
 from build_tools.syllable_walk_tui.modules.blender import BlendedWalkScreen
-from build_tools.syllable_walk_tui.modules.generator import CombinerPanel, SelectorPanel
-from build_tools.syllable_walk_tui.modules.oscillator import OscillatorPanel
+from build_tools.syllable_walk_tui.modules.generator import (
+    CombinerPanel,
+    CombinerState,
+    SelectorPanel,
+    SelectorState,
+)
+from build_tools.syllable_walk_tui.modules.oscillator import OscillatorPanel, PatchState
 from build_tools.syllable_walk_tui.modules.packager import PackageScreen
 from build_tools.syllable_walk_tui.modules.renderer import RenderScreen
-from build_tools.syllable_walk_tui.services import (
-    get_corpus_info,
-    load_annotated_data,
-    load_corpus_data,
-    load_keybindings,
-    validate_corpus_directory,
-)
 from build_tools.syllable_walk_tui.services.combiner_runner import run_combiner
 from build_tools.syllable_walk_tui.services.exporter import export_names_to_txt
 from build_tools.syllable_walk_tui.services.generation import generate_walks_for_patch
 from build_tools.syllable_walk_tui.services.selector_runner import run_selector
 
+logger = logging.getLogger(__name__)
+
+# Corpus status updates arriving within this window are coalesced into one redraw
+STATUS_FLUSH_DELAY = 0.05
+
+# Parameter control changes arriving within one frame are applied to state together
+PARAM_FLUSH_DELAY = 0.016
+
+# The Phase 1 "loaded" toast is only shown if Phase 2 is still running after this delay
+LOAD_NOTICE_DELAY = 0.5
+
 
 class SyllableWalkerApp(App):
     """
@@ -86,11 +101,30 @@ class SyllableWalkerApp(App):
 
     CSS_PATH = "styles.tcss"
 
+    HELP_TEXT = (
+        "Syllable Walker TUI - Keybindings\n\n"
+        "[q] Quit\n"
+        "[?] Help\n\n"
+        "Tabs:\n"
+        "[p] Patch Config\n"
+        "[b] Blended Walk\n"
+        "[a] Analysis\n\n"
+        "Corpus:\n"
+        "[1] Select Corpus A\n"
+        "[2] Select Corpus B\n\n"
+        "Parameters:\n"
+        "[TAB] Navigate controls\n"
+        "[j/k or +/-] Adjust values\n"
+    )
+
     def __init__(self):
         """Initialize application with default state."""
         super().__init__()
         self.state = AppState()
-        self.keybindings = load_keybindings()
+        # Patch, combiner and selector state by patch name, for the "A"/"B" lookups
+        self._patches = {"A": self.state.patch_a, "B": self.state.patch_b}
+        self._combiners = {"A": self.state.combiner_a, "B": self.state.combiner_b}
+        self._selectors = {"A": self.state.selector_a, "B": self.state.selector_b}
         # Set theme (nord provides better contrast for highlighted areas)
         self.theme = "nord"
         # Note: Keybindings are now defined in BINDINGS class attribute
@@ -101,6 +135,54 @@ class SyllableWalkerApp(App):
         self._updating_from_profile = False
         # Counter to track pending parameter updates during profile change
         self._pending_profile_updates = 0
+        # Latest pending corpus status update per patch, applied by _flush_status
+        self._status_dirty: dict[
+            str, tuple[Callable[..., None], tuple[Any, ...], dict[str, Any]]
+        ] = {}
+        self._status_timer: Timer | None = None
+        # Corpus status labels by patch name, filled on first use by ui_updates
+        self._status_labels: dict[str, Label] = {}
+        # Latest pending parameter control value per widget, applied by _flush_params
+        self._param_dirty: dict[str, tuple[Callable[..., None], int | float]] = {}
+        self._param_timer: Timer | None = None
+        # Deferred Phase 1 load toasts by patch name
+        self._load_notices: dict[str, Timer] = {}
+
+    def get_patch(self, patch_name: str) -> PatchState:
+        """
+        Get the live walk state for a patch.
+
+        Args:
+            patch_name: "A" or "B"
+
+        Returns:
+            The patch's PatchState from app.state
+        """
+        return self._patches[patch_name]
+
+    def get_combiner(self, patch_name: str) -> CombinerState:
+        """
+        Get the live name_combiner settings for a patch.
+
+        Args:
+            patch_name: "A" or "B"
+
+        Returns:
+            The patch's CombinerState from app.state
+        """
+        return self._combiners[patch_name]
+
+    def get_selector(self, patch_name: str) -> SelectorState:
+        """
+        Get the live name_selector settings for a patch.
+
+        Args:
+            patch_name: "A" or "B"
+
+        Returns:
+            The patch's SelectorState from app.state
+        """
+        return self._selectors[patch_name]
 
     def compose(self) -> ComposeResult:
         """Create application layout."""
@@ -125,21 +207,6 @@ class SyllableWalkerApp(App):
 
         yield Footer()
 
-    def on_mount(self) -> None:
-        """
-        Handle app mount event.
-
-        NOTE: Previously disabled focus on ALL container widgets, but this broke tab order.
-        Now we only disable focus on the StatsPanel container since it has no focusable
-        children and shouldn't be in the tab navigation path.
-        """
-        # Disable focus on StatsPanel's VerticalScroll container only
-        # This prevents tab navigation from going through the empty stats panel
-        # between Patch A and Patch B
-        stats_containers = self.query(".stats-panel")
-        for container in stats_containers:
-            container.can_focus = False
-
     @on(Button.Pressed, "#select-corpus-A")
     def on_button_select_corpus_a(self) -> None:
         """Handle Patch A corpus selection button press."""
@@ -217,7 +284,8 @@ class SyllableWalkerApp(App):
         Args:
             patch_name: "A" or "B"
         """
-        patch = self.state.patch_a if patch_name == "A" else self.state.patch_b
+        self._flush_params()
+        patch = self._patches[patch_name]
 
         # Validate patch is ready
         if not patch.is_ready_for_generation():
@@ -260,6 +328,8 @@ class SyllableWalkerApp(App):
         Args:
             patch_name: "A" or "B" - which patch to use for generation
         """
+        self._flush_params()
+
         # Validate patch readiness
         validation = actions.validate_patch_ready(self, patch_name)
         if not validation.is_valid:
@@ -268,7 +338,7 @@ class SyllableWalkerApp(App):
         # Type narrowing: patch is guaranteed to be set when is_valid is True
         assert validation.patch is not None
 
-        comb = self.state.combiner_a if patch_name == "A" else self.state.combiner_b
+        comb = self._combiners[patch_name]
 
         if comb.syllable_mode == "all":
             message = f"Generating {comb.count:,} candidates for all syllable counts (2-4)..."
@@ -308,6 +378,8 @@ class SyllableWalkerApp(App):
         Args:
             patch_name: "A" or "B" - which patch to use for selection
         """
+        self._flush_params()
+
         # Validate patch readiness
         validation = actions.validate_patch_ready(self, patch_name)
         if not validation.is_valid:
@@ -316,8 +388,8 @@ class SyllableWalkerApp(App):
         # Type narrowing: patch is guaranteed to be set when is_valid is True
         assert validation.patch is not None
 
-        selector = self.state.selector_a if patch_name == "A" else self.state.selector_b
-        combiner = self.state.combiner_a if patch_name == "A" else self.state.combiner_b
+        selector = self._selectors[patch_name]
+        combiner = self._combiners[patch_name]
 
         # Apply count mode (manual vs unique)
         if selector.count_mode == "unique":
@@ -362,7 +434,7 @@ class SyllableWalkerApp(App):
         Args:
             patch_name: "A" or "B" - which patch's selections to export
         """
-        selector = self.state.selector_a if patch_name == "A" else self.state.selector_b
+        selector = self._selectors[patch_name]
 
         # Check if there are names to export
         if not selector.outputs:
@@ -474,6 +546,65 @@ class SyllableWalkerApp(App):
         """Action: Open database viewer for Patch B (keybinding: D)."""
         actions.open_database_for_patch(self, "B")
 
+    def _queue_status(
+        self, patch_name: str, update: Callable[..., None], *args: Any, **kwargs: Any
+    ) -> None:
+        """
+        Queue a corpus status label update, coalescing bursts into one redraw.
+
+        Only the most recent update per patch is kept; all pending updates are
+        applied together by _flush_status after STATUS_FLUSH_DELAY seconds.
+
+        Args:
+            patch_name: "A" or "B"
+            update: ui_updates function, called as update(app, patch_name, ...)
+            *args: Remaining positional arguments for the update function
+            **kwargs: Keyword arguments for the update function
+        """
+        self._status_dirty[patch_name] = (update, args, kwargs)
+        if self._status_timer is None:
+            self._status_timer = self.set_timer(STATUS_FLUSH_DELAY, self._flush_status)
+
+    def _flush_status(self) -> None:
+        """Apply the latest queued status update for each patch."""
+        self._status_timer = None
+        pending, self._status_dirty = self._status_dirty, {}
+        for patch_name, (update, args, kwargs) in pending.items():
+            update(self, patch_name, *args, **kwargs)
+
+    def _queue_param(
+        self, widget_id: str, handler: Callable[..., None], value: int | float
+    ) -> None:
+        """
+        Queue a parameter control change, coalescing key-repeat bursts per frame.
+
+        Only the most recent value per widget is kept; all pending changes are
+        routed to their handlers together by _flush_params after PARAM_FLUSH_DELAY
+        seconds.
+
+        Args:
+            widget_id: ID of the control that changed
+            handler: handlers function, called as handler(app, widget_id, value)
+            value: New control value
+        """
+        self._param_dirty[widget_id] = (handler, value)
+        if self._param_timer is None:
+            self._param_timer = self.set_timer(PARAM_FLUSH_DELAY, self._flush_params)
+
+    def _flush_params(self) -> None:
+        """
+        Apply all queued parameter changes to state.
+
+        Also called directly before anything reads parameters from state, so
+        actions never see values that are still waiting for the timer.
+        """
+        if self._param_timer is not None:
+            self._param_timer.stop()
+            self._param_timer = None
+        pending, self._param_dirty = self._param_dirty, {}
+        for widget_id, (handler, value) in pending.items():
+            handler(self, widget_id, value)
+
     @work
     async def _select_corpus_for_patch(self, patch_name: str) -> None:
         """
@@ -482,6 +613,13 @@ class SyllableWalkerApp(App):
         Args:
             patch_name: "A" or "B"
         """
+        # Corpus loaders are imported on first use to keep startup light
+        from build_tools.syllable_walk_tui.services.corpus import (
+            format_corpus_info,
+            load_corpus_data,
+            validate_corpus_directory,
+        )
+
         try:
             # Get smart initial directory
             initial_dir = actions.get_initial_browse_dir(self, patch_name)
@@ -490,43 +628,59 @@ class SyllableWalkerApp(App):
             result = await self.push_screen_wait(CorpusBrowserScreen(initial_dir))
 
             if result:
-                # Validate and store selection
-                is_valid, corpus_type, error = validate_corpus_directory(result)
+                # Validate and store selection; the stat calls run in a worker thread
+                # so a slow (e.g. network) filesystem cannot stall the event loop
+                is_valid, corpus_type, error = await asyncio.to_thread(
+                    validate_corpus_directory, result
+                )
 
                 if is_valid:
                     # Update patch state
-                    patch = self.state.patch_a if patch_name == "A" else self.state.patch_b
+                    patch = self._patches[patch_name]
                     patch.corpus_dir = result
                     patch.corpus_type = corpus_type
 
-                    # === PHASE 1: Load quick metadata (FAST - synchronous) ===
+                    # With a corpus.db, Phase 2 fills syllables and frequencies from the
+                    # same query pass, so the text/JSON parse of Phase 1 is skipped
+                    if await asyncio.to_thread((result / "data" / "corpus.db").exists):
+                        patch.syllables = None
+                        patch.frequencies = None
+                        patch.annotated_data = None
+                        self.state.last_browse_dir = result.parent
+                        ui_updates.update_center_corpus_label(
+                            self, patch_name, result.name, corpus_type
+                        )
+                        self._focus_first_profile(patch_name)
+                        self._load_annotated_data_background(patch_name)
+                        return
+
+                    # === PHASE 1: Load quick metadata (FAST - worker thread) ===
                     try:
-                        syllables, frequencies = load_corpus_data(result)
+                        # Parse off the event loop so input and redraws keep flowing
+                        syllables, frequencies = await asyncio.to_thread(load_corpus_data, result)
                         patch.syllables = syllables
                         patch.frequencies = frequencies
                         self.state.last_browse_dir = result.parent
 
                         # Update UI to show quick metadata loaded
-                        corpus_info = get_corpus_info(result)
-                        ui_updates.update_corpus_status_quick_load(
-                            self, patch_name, corpus_info, corpus_type
+                        corpus_info = format_corpus_info(result, corpus_type)
+                        self._queue_status(
+                            patch_name,
+                            ui_updates.update_corpus_status_quick_load,
+                            corpus_info,
+                            corpus_type,
                         )
                         ui_updates.update_center_corpus_label(
                             self, patch_name, result.name, corpus_type
                         )
 
-                        self.notify(
+                        self._defer_load_notice(
+                            patch_name,
                             f"Patch {patch_name}: Loaded {len(syllables):,} syllables "
                             f"from {corpus_type} corpus",
-                            timeout=2,
                         )
 
-                        # Set focus to first profile option for tab navigation
-                        try:
-                            first_profile = self.query_one(f"#profile-clerical-{patch_name}")
-                            first_profile.focus()
-                        except Exception:  # nosec B110 - Widget may not exist
-                            pass
+                        self._focus_first_profile(patch_name)
 
                         # === PHASE 2: Kick off background loading (SLOW - async) ===
                         self._load_annotated_data_background(patch_name)
@@ -547,22 +701,110 @@ class SyllableWalkerApp(App):
         except Exception as e:
             # Catch any errors to prevent silent failures
             self.notify(f"Error selecting corpus: {e}", severity="error", timeout=5)
-            import traceback
+            logger.exception("Error selecting corpus for patch %s", patch_name)
 
-            traceback.print_exc()
+    def _focus_first_profile(self, patch_name: str) -> None:
+        """
+        Focus the first walk profile option of a patch for tab navigation.
 
-    @work
-    async def _load_annotated_data_background(self, patch_name: str) -> None:
+        Args:
+            patch_name: "A" or "B"
+        """
+        try:
+            self.query_one(f"#profile-clerical-{patch_name}").focus()
+        except Exception:  # nosec B110 - Widget may not exist
+            pass
+
+    async def _restore_quick_load(self, patch_name: str) -> bool:
+        """
+        Load the Phase 1 syllables and frequencies after a failed corpus.db load.
+
+        Selecting a SQLite corpus skips Phase 1, so without this a failed load
+        would leave the patch with a corpus but no syllables to walk.
+
+        Args:
+            patch_name: "A" or "B"
+
+        Returns:
+            True if the patch now holds the quick-load data
+        """
+        from build_tools.syllable_walk_tui.services.corpus import load_corpus_data
+
+        patch = self._patches[patch_name]
+        if patch.corpus_dir is None:
+            return False
+        try:
+            patch.syllables, patch.frequencies = await asyncio.to_thread(
+                load_corpus_data, patch.corpus_dir
+            )
+        except Exception:
+            logger.exception("Error loading quick corpus data for patch %s", patch_name)
+            return False
+        return True
+
+    def _defer_load_notice(self, patch_name: str, message: str) -> None:
+        """
+        Schedule the Phase 1 load toast for a patch.
+
+        Fast Phase 2 loads cancel it, so a quick corpus load shows one toast
+        rather than two.
+
+        Args:
+            patch_name: "A" or "B"
+            message: Toast text
+        """
+        self._cancel_load_notice(patch_name)
+
+        def show() -> None:
+            self._load_notices.pop(patch_name, None)
+            self.notify(message, timeout=2)
+
+        self._load_notices[patch_name] = self.set_timer(LOAD_NOTICE_DELAY, show)
+
+    def _cancel_load_notice(self, patch_name: str) -> None:
+        """
+        Drop a pending Phase 1 load toast, if any.
+
+        Args:
+            patch_name: "A" or "B"
+        """
+        timer = self._load_notices.pop(patch_name, None)
+        if timer is not None:
+            timer.stop()
+
+    def _load_annotated_data_background(self, patch_name: str) -> Worker[None]:
         """
-        Load annotated phonetic data in background worker (non-blocking).
+        Start loading annotated phonetic data for a patch (non-blocking).
+
+        Each patch has its own exclusive worker group: loads for A and B run side
+        by side, while a new selection for the same patch cancels its older load.
 
         Args:
             patch_name: "A" or "B" to identify which patch to load for
 
-        Note:
-            Uses @work decorator to run in background thread, preventing UI freeze.
+        Returns:
+            The worker running the load
         """
-        patch = self.state.patch_a if patch_name == "A" else self.state.patch_b
+        return self.run_worker(
+            self._load_annotated_data(patch_name),
+            group=f"annotated-load-{patch_name}",
+            exclusive=True,
+        )
+
+    async def _load_annotated_data(self, patch_name: str) -> None:
+        """
+        Load annotated phonetic data, reading the corpus in a worker thread.
+
+        Args:
+            patch_name: "A" or "B" to identify which patch to load for
+        """
+        from build_tools.syllable_walk_tui.services.corpus import (
+            format_corpus_info,
+            load_annotated_data,
+            syllables_from_annotated,
+        )
+
+        patch = self._patches[patch_name]
 
         if not patch.corpus_dir:
             self.notify(
@@ -572,7 +814,10 @@ class SyllableWalkerApp(App):
             )
             return
 
-        corpus_info = get_corpus_info(patch.corpus_dir)
+        # corpus_type was set from validation when the corpus was selected
+        corpus_info = format_corpus_info(patch.corpus_dir, patch.corpus_type)
+        # Phase 1 is skipped for a SQLite corpus, so its files were never read
+        from_db = patch.syllables is None
 
         try:
             # Set loading state
@@ -580,84 +825,93 @@ class SyllableWalkerApp(App):
             patch.loading_error = None
 
             # Update UI to show loading state
-            ui_updates.update_corpus_status_loading(
-                self, patch_name, corpus_info, patch.corpus_type
-            )
-            self.notify(
-                f"Patch {patch_name}: Loading phonetic features...",
-                timeout=2,
-                severity="information",
+            self._queue_status(
+                patch_name,
+                ui_updates.update_corpus_status_loading,
+                corpus_info,
+                patch.corpus_type,
+                from_db=from_db,
             )
 
-            # Load annotated data (SLOW - 1-2 seconds)
-            annotated_data, load_metadata = load_annotated_data(patch.corpus_dir)
+            # Load annotated data (SLOW - 1-2 seconds) off the event loop. A cancelled
+            # (superseded) load leaves the newer selection's pending toast alone.
+            try:
+                annotated_data, load_metadata = await asyncio.to_thread(
+                    load_annotated_data, patch.corpus_dir
+                )
+            except Exception:
+                self._cancel_load_notice(patch_name)
+                raise
+            # The outcome toast below supersedes a Phase 1 toast not yet shown
+            self._cancel_load_notice(patch_name)
 
             # Update patch state
             patch.annotated_data = annotated_data
+            if patch.syllables is None:
+                # Phase 1 was skipped for a SQLite corpus
+                patch.syllables, patch.frequencies = syllables_from_annotated(annotated_data)
             patch.is_loading_annotated = False
 
-            # Update UI to show ready state
+            # Update UI to show ready state (label and toast share the resolved metadata)
             source = load_metadata.get("source", "unknown")
             load_time = load_metadata.get("load_time_ms", "?")
-            ui_updates.update_corpus_status_ready(
-                self,
+            syllable_count = len(annotated_data)
+            self._queue_status(
                 patch_name,
+                ui_updates.update_corpus_status_ready,
                 corpus_info,
                 patch.corpus_type,
-                syllable_count=len(annotated_data),
+                syllable_count=syllable_count,
                 source=source,
                 load_time=load_time,
                 file_name=load_metadata.get("file_name"),
+                from_db=from_db,
             )
 
             self.notify(
                 f"Patch {patch_name}: Loaded from {source.upper()} "
-                f"({len(annotated_data):,} syllables, {load_time}ms)",
+                f"({syllable_count:,} syllables, {load_time}ms)",
                 timeout=3,
                 severity="information",
             )
 
         except FileNotFoundError as e:
+            if from_db and await self._restore_quick_load(patch_name):
+                from_db = False
             patch.is_loading_annotated = False
             patch.loading_error = "Annotated data file not found"
-            ui_updates.update_corpus_status_not_annotated(
-                self, patch_name, corpus_info, patch.corpus_type
+            self._queue_status(
+                patch_name,
+                ui_updates.update_corpus_status_not_annotated,
+                corpus_info,
+                patch.corpus_type,
+                from_db=from_db,
             )
             self.notify(f"Patch {patch_name}: {str(e)}", severity="error", timeout=5)
 
         except Exception as e:
+            if from_db and await self._restore_quick_load(patch_name):
+                from_db = False
             patch.is_loading_annotated = False
             patch.loading_error = str(e)
-            ui_updates.update_corpus_status_error(
-                self, patch_name, corpus_info, patch.corpus_type, str(e)
+            self._queue_status(
+                patch_name,
+                ui_updates.update_corpus_status_error,
+                corpus_info,
+                patch.corpus_type,
+                str(e),
+                from_db=from_db,
             )
             self.notify(
                 f"Patch {patch_name}: Error loading annotated data: {e}",
                 severity="error",
                 timeout=5,
             )
-            import traceback
-
-            traceback.print_exc()
+            logger.exception("Error loading annotated data for patch %s", patch_name)
 
     def action_help(self) -> None:
         """Show help information."""
-        help_text = (
-            "Syllable Walker TUI - Keybindings\n\n"
-            "[q] Quit\n"
-            "[?] Help\n\n"
-            "Tabs:\n"
-            "[p] Patch Config\n"
-            "[b] Blended Walk\n"
-            "[a] Analysis\n\n"
-            "Corpus:\n"
-            "[1] Select Corpus A\n"
-            "[2] Select Corpus B\n\n"
-            "Parameters:\n"
-            "[TAB] Navigate controls\n"
-            "[j/k or +/-] Adjust values\n"
-        )
-        self.notify(help_text, timeout=10)
+        self.notify(self.HELP_TEXT, timeout=10)
 
     def action_quit(self) -> None:  # type: ignore[override]
         """Quit the application."""
@@ -665,25 +919,26 @@ class SyllableWalkerApp(App):
 
     # =========================================================================
     # Parameter Change Handlers - Delegate to handlers module
+    # Spinner, slider and seed changes are coalesced per frame by _queue_param
     # =========================================================================
 
     @on(IntSpinner.Changed)
     def on_int_spinner_changed(self, event: IntSpinner.Changed) -> None:
         """Handle integer spinner value changes."""
         if event.widget_id:
-            handlers.handle_int_spinner_changed(self, event.widget_id, event.value)
+            self._queue_param(event.widget_id, handlers.handle_int_spinner_changed, event.value)
 
     @on(FloatSlider.Changed)
     def on_float_slider_changed(self, event: FloatSlider.Changed) -> None:
         """Handle float slider value changes."""
         if event.widget_id:
-            handlers.handle_float_slider_changed(self, event.widget_id, event.value)
+            self._queue_param(event.widget_id, handlers.handle_float_slider_changed, event.value)
 
     @on(SeedInput.Changed)
     def on_seed_changed(self, event: SeedInput.Changed) -> None:
         """Handle seed input changes."""
         if event.widget_id:
-            handlers.handle_seed_changed(self, event.widget_id, event.value)
+            self._queue_param(event.widget_id, handlers.handle_seed_changed, event.value)
 
     @on(Select.Changed)
     def on_select_changed(self, event: Select.Changed) -> None:
@@ -697,4 +952,6 @@ class SyllableWalkerApp(App):
     def on_profile_selected(self, event: ProfileOption.Selected) -> None:
         """Handle profile option selection (radio button click)."""
         if event.widget_id:
+            # Apply queued manual edits first so the profile values win
+            self._flush_params()
             handlers.handle_profile_selected(self, event.widget_id, event.profile_name)
@@ -11,7 +11,9 @@ then route to appropriate state updates. This separation allows:
 - Easier maintenance and modification
 """
 
-import random
+import logging
+from functools import lru_cache
+from random import Random
 from typing import TYPE_CHECKING
 
 from build_tools.syllable_walk.profiles import WALK_PROFILES
@@ -21,6 +23,25 @@ if TYPE_CHECKING:
     from build_tools.syllable_walk_tui.modules.generator import CombinerState, SelectorState
     from build_tools.syllable_walk_tui.modules.oscillator import PatchState
 
+logger = logging.getLogger(__name__)
+
+# Patch widget id stem -> PatchState attribute, per control type
+_INT_PARAM_ATTRS = {
+    "min-length": "min_length",
+    "max-length": "max_length",
+    "walk-length": "walk_length",
+    "max-flips": "max_flips",
+    "neighbors": "neighbor_limit",
+    "walk-count": "walk_count",
+}
+_FLOAT_PARAM_ATTRS = {
+    "temperature": "temperature",
+    "freq-weight": "frequency_weight",
+}
+
+# Parameters that define walk profiles; manual edits switch the patch to custom
+_PROFILE_PARAMS = frozenset({"max-flips", "temperature", "freq-weight"})
+
 
 def switch_to_custom_mode(
     app: "SyllableWalkerApp",
@@ -64,7 +85,66 @@ def switch_to_custom_mode(
         custom_option.set_selected(True)
     except Exception as e:  # nosec B110 - Safe widget query failure
         # Widget not found or update failed - log but don't crash
-        print(f"Warning: Could not update profile selection to custom: {e}")
+        logger.debug("Could not update profile selection to custom: %s", e)
+
+
+@lru_cache(maxsize=64)
+def parse_patch_widget_id(widget_id: str) -> tuple[str, str] | None:
+    """
+    Split a patch widget ID into its parameter stem and patch name.
+
+    Widget IDs are fixed once composed, so results are cached and each ID is
+    only parsed the first time its widget fires.
+
+    Args:
+        widget_id: Widget ID in the form "<param>-<patch>" (e.g. "min-length-A")
+
+    Returns:
+        Tuple of (param_name, patch_name), or None if the ID does not end in
+        a patch suffix of "A" or "B"
+    """
+    param_name, sep, patch_name = widget_id.rpartition("-")
+    if not sep or patch_name not in ("A", "B"):
+        return None
+    return param_name, patch_name
+
+
+def _set_patch_param(
+    app: "SyllableWalkerApp",
+    attrs: dict[str, str],
+    param_name: str,
+    patch_name: str,
+    value: int | float,
+) -> None:
+    """
+    Store a patch parameter change, switching to custom mode for profile parameters.
+
+    Args:
+        app: Application instance for state access
+        attrs: Mapping of widget id stem to PatchState attribute for the control type
+        param_name: Widget id stem (e.g. "max-flips")
+        patch_name: "A" or "B"
+        value: New control value
+    """
+    attr = attrs.get(param_name)
+    if attr is None:
+        return
+
+    patch = app.get_patch(patch_name)
+    setattr(patch, attr, value)
+
+    if param_name not in _PROFILE_PARAMS:
+        return
+
+    # Profile parameters switch to custom mode UNLESS we're updating from a
+    # profile change (prevents feedback loop)
+    if app._updating_from_profile:
+        app._pending_profile_updates -= 1
+        if app._pending_profile_updates <= 0:
+            app._updating_from_profile = False
+            app._pending_profile_updates = 0
+    else:
+        switch_to_custom_mode(app, patch_name, patch)
 
 
 def handle_int_spinner_changed(
@@ -82,9 +162,8 @@ def handle_int_spinner_changed(
     """
     # Check for combiner panel widgets first (pattern: combiner-<param>-<patch>)
     if widget_id.startswith("combiner-"):
-        is_patch_a = widget_id.endswith("-a")
-        comb = app.state.combiner_a if is_patch_a else app.state.combiner_b
-        patch_name = "A" if is_patch_a else "B"
+        patch_name = widget_id[-1].upper()
+        comb = app.get_combiner(patch_name)
         if "syllables" in widget_id:
             comb.syllables = value
             # Changing the exact syllable count implies "exact" mode.
@@ -96,48 +175,21 @@ def handle_int_spinner_changed(
 
     # Check for selector panel widgets (pattern: selector-<param>-<patch>)
     if widget_id.startswith("selector-"):
-        sel = app.state.selector_a if widget_id.endswith("-a") else app.state.selector_b
+        patch_name = widget_id[-1].upper()
+        sel = app.get_selector(patch_name)
         if "count" in widget_id:
             sel.count = value
             # Manual change implies manual count mode
             if sel.count_mode != "manual":
-                set_selector_count_mode(app, widget_id[-1].upper(), sel, "manual")
-        return
-
-    # Parse widget ID to determine patch and parameter
-    # Format: "<param>-<patch>" e.g., "min-length-A"
-    parts = widget_id.rsplit("-", 1)
-    if len(parts) != 2:
+                set_selector_count_mode(app, patch_name, sel, "manual")
         return
 
-    param_name, patch_name = parts
-    if patch_name not in ("A", "B"):
+    parsed = parse_patch_widget_id(widget_id)
+    if parsed is None:
         return  # Not a patch widget
 
-    patch = app.state.patch_a if patch_name == "A" else app.state.patch_b
-
-    # Update the appropriate parameter in patch state
-    if param_name == "min-length":
-        patch.min_length = value
-    elif param_name == "max-length":
-        patch.max_length = value
-    elif param_name == "walk-length":
-        patch.walk_length = value
-    elif param_name == "max-flips":
-        patch.max_flips = value
-        # Max flips is a profile parameter - switch to custom mode
-        # UNLESS we're updating from a profile change (prevents feedback loop)
-        if app._updating_from_profile:
-            app._pending_profile_updates -= 1
-            if app._pending_profile_updates <= 0:
-                app._updating_from_profile = False
-                app._pending_profile_updates = 0
-        else:
-            switch_to_custom_mode(app, patch_name, patch)
-    elif param_name == "neighbors":
-        patch.neighbor_limit = value
-    elif param_name == "walk-count":
-        patch.walk_count = value
+    param_name, patch_name = parsed
+    _set_patch_param(app, _INT_PARAM_ATTRS, param_name, patch_name, value)
 
 
 def handle_float_slider_changed(
@@ -155,42 +207,16 @@ def handle_float_slider_changed(
     """
     # Check for combiner panel widgets first (pattern: combiner-<param>-<patch>)
     if widget_id.startswith("combiner-") and "freq-weight" in widget_id:
-        comb = app.state.combiner_a if widget_id.endswith("-a") else app.state.combiner_b
+        comb = app.get_combiner(widget_id[-1].upper())
         comb.frequency_weight = value
         return
 
-    # Parse widget ID to determine patch and parameter
-    parts = widget_id.rsplit("-", 1)
-    if len(parts) != 2:
-        return
-
-    param_name, patch_name = parts
-    if patch_name not in ("A", "B"):
+    parsed = parse_patch_widget_id(widget_id)
+    if parsed is None:
         return  # Not a patch widget
 
-    patch = app.state.patch_a if patch_name == "A" else app.state.patch_b
-
-    # Update the appropriate parameter in patch state
-    if param_name == "temperature":
-        patch.temperature = value
-        # Temperature is a profile parameter - switch to custom mode
-        if app._updating_from_profile:
-            app._pending_profile_updates -= 1
-            if app._pending_profile_updates <= 0:
-                app._updating_from_profile = False
-                app._pending_profile_updates = 0
-        else:
-            switch_to_custom_mode(app, patch_name, patch)
-    elif param_name == "freq-weight":
-        patch.frequency_weight = value
-        # Frequency weight is a profile parameter - switch to custom mode
-        if app._updating_from_profile:
-            app._pending_profile_updates -= 1
-            if app._pending_profile_updates <= 0:
-                app._updating_from_profile = False
-                app._pending_profile_updates = 0
-        else:
-            switch_to_custom_mode(app, patch_name, patch)
+    param_name, patch_name = parsed
+    _set_patch_param(app, _FLOAT_PARAM_ATTRS, param_name, patch_name, value)
 
 
 def handle_seed_changed(
@@ -208,25 +234,20 @@ def handle_seed_changed(
     """
     # Check for combiner panel seed widget (pattern: combiner-seed-<patch>)
     if widget_id.startswith("combiner-seed"):
-        comb = app.state.combiner_a if widget_id.endswith("-a") else app.state.combiner_b
+        comb = app.get_combiner(widget_id[-1].upper())
         comb.seed = value
         return
 
-    # Parse widget ID to determine patch
     # Format: "seed-<patch>" e.g., "seed-A"
-    parts = widget_id.rsplit("-", 1)
-    if len(parts) != 2 or parts[0] != "seed":
-        return
-
-    patch_name = parts[1]
-    if patch_name not in ("A", "B"):
-        return  # Not a patch widget
+    parsed = parse_patch_widget_id(widget_id)
+    if parsed is None or parsed[0] != "seed":
+        return  # Not a patch seed widget
 
-    patch = app.state.patch_a if patch_name == "A" else app.state.patch_b
+    patch = app.get_patch(parsed[1])
 
     # Update seed in patch state with new value
     patch.seed = value
-    patch.rng = random.Random(value)  # nosec B311 - Deterministic RNG for name generation
+    patch.rng = Random(value)  # nosec B311 - Deterministic RNG for name generation
 
 
 def handle_selector_mode_selected(
@@ -246,7 +267,7 @@ def handle_selector_mode_selected(
 
     # Extract patch from widget ID (last character)
     patch_name = widget_id[-1].upper()
-    selector = app.state.selector_a if patch_name == "A" else app.state.selector_b
+    selector = app.get_selector(patch_name)
 
     # Update selector state
     selector.mode = mode  # type: ignore[assignment]
@@ -317,7 +338,7 @@ def handle_selector_count_mode_selected(
         mode: Mode name ("manual" or "unique")
     """
     patch_name = widget_id[-1].upper()
-    selector = app.state.selector_a if patch_name == "A" else app.state.selector_b
+    selector = app.get_selector(patch_name)
     set_selector_count_mode(app, patch_name, selector, mode)
 
 
@@ -370,7 +391,7 @@ def handle_combiner_mode_selected(
         mode: Mode name ("exact" or "all")
     """
     patch_name = widget_id[-1].upper()
-    comb = app.state.combiner_a if patch_name == "A" else app.state.combiner_b
+    comb = app.get_combiner(patch_name)
     set_combiner_mode(app, patch_name, comb, mode)
 
 
@@ -391,7 +412,7 @@ def handle_selector_order_selected(
 
     # Extract patch from widget ID (last character)
     patch_name = widget_id[-1].upper()
-    selector = app.state.selector_a if patch_name == "A" else app.state.selector_b
+    selector = app.get_selector(patch_name)
 
     # Update selector state
     selector.order = order  # type: ignore[assignment]
@@ -428,7 +449,7 @@ def handle_selector_name_class_changed(
     """
     # Extract patch from widget ID (last character)
     patch_name = widget_id[-1].upper()
-    selector = app.state.selector_a if patch_name == "A" else app.state.selector_b
+    selector = app.get_selector(patch_name)
     selector.name_class = value
 
 
@@ -467,12 +488,12 @@ def handle_profile_selected(
         handle_selector_order_selected(app, widget_id, profile_name)
         return
 
-    parts = widget_id.rsplit("-", 1)
-    if len(parts) != 2:
+    parsed = parse_patch_widget_id(widget_id)
+    if parsed is None:
         return
 
-    patch_name = parts[1]
-    patch = app.state.patch_a if patch_name == "A" else app.state.patch_b
+    patch_name = parsed[1]
+    patch = app.get_patch(patch_name)
 
     # Deselect all other profile options for this patch
     for profile_key in ["clerical", "dialect", "goblin", "ritual", "custom"]:
@@ -516,6 +537,6 @@ def handle_profile_selected(
         freq_weight_widget.set_value(profile.frequency_weight)
 
     except Exception as e:  # nosec B110 - Safe widget query failure
-        print(f"Warning: Could not update parameter widgets for profile: {e}")
+        logger.debug("Could not update parameter widgets for profile: %s", e)
         app._updating_from_profile = False
         app._pending_profile_updates = 0
@@ -11,6 +11,8 @@ The status label shows:
 - Error states with actionable messages
 """
 
+import logging
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from textual.widgets import Label
@@ -18,12 +20,68 @@ from textual.widgets import Label
 if TYPE_CHECKING:
     from build_tools.syllable_walk_tui.core.app import SyllableWalkerApp
 
+logger = logging.getLogger(__name__)
+
+
+def _get_status_label(app: "SyllableWalkerApp", patch_name: str) -> Label:
+    """
+    Get the corpus status label for a patch, cached on the app after first lookup.
+
+    The oscillator panels (and their status labels) live for the app's lifetime,
+    so repeated loads reuse the widget reference instead of re-running the query.
+    """
+    label = app._status_labels.get(patch_name)
+    if label is None:
+        label = app.query_one(f"#corpus-status-{patch_name}", Label)
+        app._status_labels[patch_name] = label
+    return label
+
+
+SEPARATOR = "─────────────────"
+
 
 def _get_corpus_prefix(corpus_type: str | None) -> str:
     """Get the file prefix based on corpus type."""
     return corpus_type.lower() if corpus_type else "nltk"
 
 
+def _annotated_source_name(corpus_type: str | None, from_db: bool) -> str:
+    """Get the file the annotated data is read from (corpus.db or the JSON file)."""
+    if from_db:
+        return "corpus.db"
+    return f"{_get_corpus_prefix(corpus_type)}_syllables_annotated.json"
+
+
+@lru_cache(maxsize=8)
+def _status_header(corpus_info: str, corpus_type: str | None, from_db: bool = False) -> str:
+    """
+    Build the status lines shared by every load phase for one corpus.
+
+    The corpus name, separator, and the two quick-load files are identical in
+    the quick-load, loading, ready, and error states, so they are built once
+    per corpus and reused by each phase. A corpus loaded straight from
+    corpus.db never reads the quick-load files, so they are left out.
+    """
+    if from_db:
+        return "\n".join((corpus_info, SEPARATOR))
+    corpus_prefix = _get_corpus_prefix(corpus_type)
+    return "\n".join(
+        (
+            corpus_info,
+            SEPARATOR,
+            f"✓ {corpus_prefix}_syllables_unique.txt",
+            f"✓ {corpus_prefix}_syllables_frequencies.json",
+        )
+    )
+
+
+def _status_text(
+    corpus_info: str, corpus_type: str | None, *tail: str, from_db: bool = False
+) -> str:
+    """Append phase-specific lines to the shared status header."""
+    return "\n".join((_status_header(corpus_info, corpus_type, from_db), *tail))
+
+
 def update_corpus_status_quick_load(
     app: "SyllableWalkerApp",
     patch_name: str,
@@ -42,22 +100,18 @@ def update_corpus_status_quick_load(
         corpus_type: Corpus type (e.g., "pyphen", "nltk")
     """
     try:
-        status_label = app.query_one(f"#corpus-status-{patch_name}", Label)
+        status_label = _get_status_label(app, patch_name)
         corpus_prefix = _get_corpus_prefix(corpus_type)
 
-        files_loaded = (
-            f"{corpus_info}\n"
-            f"─────────────────\n"
-            f"✓ {corpus_prefix}_syllables_unique.txt\n"
-            f"✓ {corpus_prefix}_syllables_frequencies.json\n"
-            f"⏳ {corpus_prefix}_syllables_annotated.json"
+        files_loaded = _status_text(
+            corpus_info, corpus_type, f"⏳ {corpus_prefix}_syllables_annotated.json"
         )
         status_label.update(files_loaded)
         status_label.remove_class("corpus-status")
         status_label.add_class("corpus-status-valid")
     except Exception as e:
         # Log UI update errors but don't fail
-        print(f"Warning: Could not update status label: {e}")
+        logger.debug("Could not update status label: %s", e)
 
 
 def update_corpus_status_loading(
@@ -65,6 +119,7 @@ def update_corpus_status_loading(
     patch_name: str,
     corpus_info: str,
     corpus_type: str | None,
+    from_db: bool = False,
 ) -> None:
     """
     Update status label to show annotated data is loading.
@@ -74,23 +129,23 @@ def update_corpus_status_loading(
         patch_name: "A" or "B"
         corpus_info: Display string for corpus directory
         corpus_type: Corpus type (e.g., "pyphen", "nltk")
+        from_db: True if the corpus is read only from corpus.db (quick load skipped)
     """
     try:
-        status_label = app.query_one(f"#corpus-status-{patch_name}", Label)
-        corpus_prefix = _get_corpus_prefix(corpus_type)
-
-        files_loading = (
-            f"{corpus_info}\n"
-            f"─────────────────\n"
-            f"✓ {corpus_prefix}_syllables_unique.txt\n"
-            f"✓ {corpus_prefix}_syllables_frequencies.json\n"
-            f"⏳ {corpus_prefix}_syllables_annotated.json (loading...)"
+        status_label = _get_status_label(app, patch_name)
+        source_name = _annotated_source_name(corpus_type, from_db)
+
+        files_loading = _status_text(
+            corpus_info,
+            corpus_type,
+            f"⏳ {source_name} (loading...)",
+            from_db=from_db,
         )
         status_label.update(files_loading)
         status_label.remove_class("corpus-status")
         status_label.add_class("corpus-status-valid")
     except Exception as e:
-        print(f"Warning: Could not update status label (loading): {e}")
+        logger.debug("Could not update status label (loading): %s", e)
 
 
 def update_corpus_status_ready(
@@ -102,6 +157,7 @@ def update_corpus_status_ready(
     source: str,
     load_time: str | int,
     file_name: str | None = None,
+    from_db: bool = False,
 ) -> None:
     """
     Update status label to show corpus is ready.
@@ -115,37 +171,29 @@ def update_corpus_status_ready(
         source: Data source ("sqlite" or "json")
         load_time: Load time in milliseconds
         file_name: JSON filename if source is "json"
+        from_db: True if the corpus is read only from corpus.db (quick load skipped)
     """
     try:
-        status_label = app.query_one(f"#corpus-status-{patch_name}", Label)
-        corpus_prefix = _get_corpus_prefix(corpus_type)
+        status_label = _get_status_label(app, patch_name)
 
         if source == "sqlite":
-            files_ready = (
-                f"{corpus_info}\n"
-                f"─────────────────\n"
-                f"✓ {corpus_prefix}_syllables_unique.txt\n"
-                f"✓ {corpus_prefix}_syllables_frequencies.json\n"
-                f"✓ corpus.db ({load_time}ms, SQLite)\n"
-                f"─────────────────\n"
-                f"Ready: {syllable_count:,} syllables"
-            )
+            loaded_line = f"✓ corpus.db ({load_time}ms, SQLite)"
         else:
             display_name = file_name or "annotated.json"
-            files_ready = (
-                f"{corpus_info}\n"
-                f"─────────────────\n"
-                f"✓ {corpus_prefix}_syllables_unique.txt\n"
-                f"✓ {corpus_prefix}_syllables_frequencies.json\n"
-                f"✓ {display_name} ({load_time}ms, JSON)\n"
-                f"─────────────────\n"
-                f"Ready: {syllable_count:,} syllables"
-            )
+            loaded_line = f"✓ {display_name} ({load_time}ms, JSON)"
+        files_ready = _status_text(
+            corpus_info,
+            corpus_type,
+            loaded_line,
+            SEPARATOR,
+            f"Ready: {syllable_count:,} syllables",
+            from_db=from_db,
+        )
         status_label.update(files_ready)
         status_label.remove_class("corpus-status")
         status_label.add_class("corpus-status-valid")
     except Exception as e:
-        print(f"Warning: Could not update status label (complete): {e}")
+        logger.debug("Could not update status label (complete): %s", e)
 
 
 def update_corpus_status_error(
@@ -154,6 +202,7 @@ def update_corpus_status_error(
     corpus_info: str,
     corpus_type: str | None,
     error_msg: str,
+    from_db: bool = False,
 ) -> None:
     """
     Update status label to show an error occurred.
@@ -164,22 +213,22 @@ def update_corpus_status_error(
         corpus_info: Display string for corpus directory
         corpus_type: Corpus type (e.g., "pyphen", "nltk")
         error_msg: Error message to display (truncated to 30 chars)
+        from_db: True if the corpus is read only from corpus.db (quick load skipped)
     """
     try:
-        status_label = app.query_one(f"#corpus-status-{patch_name}", Label)
-        corpus_prefix = _get_corpus_prefix(corpus_type)
+        status_label = _get_status_label(app, patch_name)
+        source_name = _annotated_source_name(corpus_type, from_db)
 
         # Truncate long error messages
         display_error = error_msg[:30] + "..." if len(error_msg) > 30 else error_msg
 
-        files_error = (
-            f"{corpus_info}\n"
-            f"─────────────────\n"
-            f"✓ {corpus_prefix}_syllables_unique.txt\n"
-            f"✓ {corpus_prefix}_syllables_frequencies.json\n"
-            f"✗ {corpus_prefix}_syllables_annotated.json\n"
-            f"─────────────────\n"
-            f"Error: {display_error}"
+        files_error = _status_text(
+            corpus_info,
+            corpus_type,
+            f"✗ {source_name}",
+            SEPARATOR,
+            f"Error: {display_error}",
+            from_db=from_db,
         )
         status_label.update(files_error)
         status_label.remove_class("corpus-status-valid")
@@ -193,6 +242,7 @@ def update_corpus_status_not_annotated(
     patch_name: str,
     corpus_info: str,
     corpus_type: str | None,
+    from_db: bool = False,
 ) -> None:
     """
     Update status label when annotated data file is not found.
@@ -204,19 +254,19 @@ def update_corpus_status_not_annotated(
         patch_name: "A" or "B"
         corpus_info: Display string for corpus directory
         corpus_type: Corpus type (e.g., "pyphen", "nltk")
+        from_db: True if the corpus is read only from corpus.db (quick load skipped)
     """
     try:
-        status_label = app.query_one(f"#corpus-status-{patch_name}", Label)
-        corpus_prefix = _get_corpus_prefix(corpus_type)
-
-        files_error = (
-            f"{corpus_info}\n"
-            f"─────────────────\n"
-            f"✓ {corpus_prefix}_syllables_unique.txt\n"
-            f"✓ {corpus_prefix}_syllables_frequencies.json\n"
-            f"✗ {corpus_prefix}_syllables_annotated.json\n"
-            f"─────────────────\n"
-            f"Run syllable_feature_annotator"
+        status_label = _get_status_label(app, patch_name)
+        source_name = _annotated_source_name(corpus_type, from_db)
+
+        files_error = _status_text(
+            corpus_info,
+            corpus_type,
+            f"✗ {source_name}",
+            SEPARATOR,
+            "Run syllable_feature_annotator",
+            from_db=from_db,
         )
         status_label.update(files_error)
         status_label.remove_class("corpus-status-valid")
@@ -245,4 +295,4 @@ def update_center_corpus_label(
         corpus_label.update(f"{dir_name} ({corpus_type})")
         corpus_label.remove_class("output-placeholder")
     except Exception as e:
-        print(f"Warning: Could not update center corpus label: {e}")
+        logger.debug("Could not update center corpus label: %s", e)
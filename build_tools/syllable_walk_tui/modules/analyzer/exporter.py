@@ -9,6 +9,9 @@ Design Philosophy:
     - Mirror the screen display in text form
     - Include timestamps and corpus paths for provenance
     - Pure formatting functions (no side effects except final write)
+    - Private _format_* helpers append lines to a shared buffer, so the
+      export is joined exactly once in format_analysis_export; the public
+      format_* section functions wrap them and return the joined block
     - Percentages shown in parentheses for contextual understanding
 
 Percentage Display:
@@ -74,6 +77,57 @@ if TYPE_CHECKING:
         TerrainMetrics,
     )
 
+# Terrain bars are hi-fi resolution (30 chars); every possible bar is built once
+# so rendering a score is a single table lookup
+TERRAIN_BAR_WIDTH = 30
+_TERRAIN_BARS = tuple(
+    "█" * filled + "░" * (TERRAIN_BAR_WIDTH - filled) for filled in range(TERRAIN_BAR_WIDTH + 1)
+)
+
+# Feature saturation groups features by category, in display order (shared with
+# the AnalysisScreen so the export mirrors the screen)
+FEATURE_CATEGORIES: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("Onset", ("starts_with_vowel", "starts_with_cluster", "starts_with_heavy_cluster")),
+    ("Internal", ("contains_plosive", "contains_fricative", "contains_liquid", "contains_nasal")),
+    ("Nucleus", ("short_vowel", "long_vowel")),
+    ("Coda", ("ends_with_vowel", "ends_with_nasal", "ends_with_stop")),
+)
+
+# Feature names cleaned up for display (e.g., "starts_with_heavy_cluster" -> "heavy cluster")
+FEATURE_DISPLAY_NAMES = {
+    name: name.replace("starts_with_", "")
+    .replace("ends_with_", "")
+    .replace("contains_", "")
+    .replace("_", " ")
+    for _, feature_names in FEATURE_CATEGORIES
+    for name in feature_names
+}
+
+
+def _format_inventory_metrics(inv: InventoryMetrics, out: list[str]) -> None:
+    """Append the inventory block to ``out`` (see :func:`format_inventory_metrics`)."""
+    out.extend(
+        [
+            "INVENTORY",
+            f"  Total syllables:    {inv.total_count:,}",
+            f"  Length min:         {inv.length_min}",
+            f"  Length max:         {inv.length_max}",
+            f"  Length mean:        {inv.length_mean:.2f}",
+            f"  Length median:      {inv.length_median:.1f}",
+            f"  Length std:         {inv.length_std:.2f}",
+        ]
+    )
+
+    # Length distribution with percentages
+    # Each count shown as both raw value and percentage of total inventory
+    # (scale hoisted so each entry costs one multiply; empty inventories have no entries)
+    scale = 100.0 / inv.total_count if inv.total_count else 0.0
+    dist_parts = [
+        f"{length}:{count} ({count * scale:.1f}%)"
+        for length, count in inv.length_distribution.items()
+    ]
+    out.append(f"  Length dist:        {', '.join(dist_parts)}")
+
 
 def format_inventory_metrics(inv: InventoryMetrics) -> str:
     """
@@ -98,25 +152,49 @@ def format_inventory_metrics(inv: InventoryMetrics) -> str:
           Length std:         1.23
           Length dist:        2:120 (9.7%), 3:456 (37.0%), 4:389 (31.5%), ...
     """
-    lines = [
-        "INVENTORY",
-        f"  Total syllables:    {inv.total_count:,}",
-        f"  Length min:         {inv.length_min}",
-        f"  Length max:         {inv.length_max}",
-        f"  Length mean:        {inv.length_mean:.2f}",
-        f"  Length median:      {inv.length_median:.1f}",
-        f"  Length std:         {inv.length_std:.2f}",
-    ]
+    lines: list[str] = []
+    _format_inventory_metrics(inv, lines)
+    return "\n".join(lines)
 
-    # Length distribution with percentages
-    # Each count shown as both raw value and percentage of total inventory
-    dist_parts = [
-        f"{length}:{count} ({count / inv.total_count * 100:.1f}%)"
-        for length, count in sorted(inv.length_distribution.items())
-    ]
-    lines.append(f"  Length dist:        {', '.join(dist_parts)}")
 
-    return "\n".join(lines)
+def _format_frequency_metrics(
+    freq: FrequencyMetrics, out: list[str], total_syllables: int | None = None
+) -> None:
+    """Append the frequency block to ``out`` (see :func:`format_frequency_metrics`)."""
+    # Compute hapax rate if total_syllables provided
+    # Hapax rate shows vocabulary diversity - high rate = many unique rare syllables
+    if total_syllables and total_syllables > 0:
+        hapax_rate = freq.hapax_count / total_syllables * 100
+        hapax_line = f"  Hapax (freq=1):     {freq.hapax_count:,} ({hapax_rate:.1f}%)"
+    else:
+        hapax_line = f"  Hapax (freq=1):     {freq.hapax_count:,}"
+
+    out.extend(
+        [
+            "FREQUENCY",
+            f"  Total occurrences:  {freq.total_occurrences:,}",
+            f"  Freq min:           {freq.freq_min:,}",
+            f"  Freq max:           {freq.freq_max:,}",
+            f"  Freq mean:          {freq.freq_mean:.2f}",
+            f"  Freq median:        {freq.freq_median:.1f}",
+            f"  Freq std:           {freq.freq_std:.2f}",
+            f"  Unique freq values: {freq.unique_freq_count:,}",
+            hapax_line,
+            "",
+            "  Percentiles:",
+            f"    P10={freq.percentile_10:,}  P25={freq.percentile_25:,}  "
+            f"P50={freq.percentile_50:,}",
+            f"    P75={freq.percentile_75:,}  P90={freq.percentile_90:,}  "
+            f"P99={freq.percentile_99:,}",
+            "",
+            "  Top 5 by frequency:",
+        ]
+    )
+
+    # Top 5 with percentage of total occurrences
+    # Shows corpus concentration - how much the top syllables dominate
+    pct_scale = 100.0 / freq.total_occurrences if freq.total_occurrences > 0 else 0.0
+    out.extend(f"    {syl}: {count:,} ({count * pct_scale:.1f}%)" for syl, count in freq.top_10[:5])
 
 
 def format_frequency_metrics(freq: FrequencyMetrics, total_syllables: int | None = None) -> str:
@@ -133,7 +211,7 @@ def format_frequency_metrics(freq: FrequencyMetrics, total_syllables: int | None
             computing hapax rate percentage. If None, percentage is omitted.
 
     Returns:
-        Formatted text block with percentages in parentheses
+        Formatted text block with hapax rate and top-5 percentages
 
     Example output:
         FREQUENCY
@@ -150,41 +228,27 @@ def format_frequency_metrics(freq: FrequencyMetrics, total_syllables: int | None
             the: 500 (4.1%)
             and: 350 (2.8%)
     """
-    # Compute hapax rate if total_syllables provided
-    # Hapax rate shows vocabulary diversity - high rate = many unique rare syllables
-    if total_syllables and total_syllables > 0:
-        hapax_rate = freq.hapax_count / total_syllables * 100
-        hapax_line = f"  Hapax (freq=1):     {freq.hapax_count:,} ({hapax_rate:.1f}%)"
-    else:
-        hapax_line = f"  Hapax (freq=1):     {freq.hapax_count:,}"
+    lines: list[str] = []
+    _format_frequency_metrics(freq, lines, total_syllables)
+    return "\n".join(lines)
 
-    lines = [
-        "FREQUENCY",
-        f"  Total occurrences:  {freq.total_occurrences:,}",
-        f"  Freq min:           {freq.freq_min:,}",
-        f"  Freq max:           {freq.freq_max:,}",
-        f"  Freq mean:          {freq.freq_mean:.2f}",
-        f"  Freq median:        {freq.freq_median:.1f}",
-        f"  Freq std:           {freq.freq_std:.2f}",
-        f"  Unique freq values: {freq.unique_freq_count:,}",
-        hapax_line,
-        "",
-        "  Percentiles:",
-        f"    P10={freq.percentile_10:,}  P25={freq.percentile_25:,}  "
-        f"P50={freq.percentile_50:,}",
-        f"    P75={freq.percentile_75:,}  P90={freq.percentile_90:,}  "
-        f"P99={freq.percentile_99:,}",
-        "",
-        "  Top 5 by frequency:",
-    ]
 
-    # Top 5 with percentage of total occurrences
-    # Shows corpus concentration - how much the top syllables dominate
-    for syl, count in freq.top_10[:5]:
-        pct_of_total = (count / freq.total_occurrences * 100) if freq.total_occurrences > 0 else 0.0
-        lines.append(f"    {syl}: {count:,} ({pct_of_total:.1f}%)")
+def _format_feature_saturation(feat: FeatureSaturationMetrics, out: list[str]) -> None:
+    """Append the feature saturation block to ``out`` (see :func:`format_feature_saturation`)."""
+    out.extend(
+        [
+            "FEATURE SATURATION",
+            f"  Total analyzed:     {feat.total_syllables:,}",
+            "",
+        ]
+    )
 
-    return "\n".join(lines)
+    for category, feature_names in FEATURE_CATEGORIES:
+        out.append(f"  {category}:")
+        for name in feature_names:
+            fs = feat.by_name[name]
+            short_name = FEATURE_DISPLAY_NAMES[name]
+            out.append(f"    {short_name:18} {fs.true_count:>6,} ({fs.true_percentage:5.1f}%)")
 
 
 def format_feature_saturation(feat: FeatureSaturationMetrics) -> str:
@@ -197,33 +261,8 @@ def format_feature_saturation(feat: FeatureSaturationMetrics) -> str:
     Returns:
         Formatted text block
     """
-    lines = [
-        "FEATURE SATURATION",
-        f"  Total analyzed:     {feat.total_syllables:,}",
-        "",
-    ]
-
-    # Group features by category
-    categories = {
-        "Onset": ["starts_with_vowel", "starts_with_cluster", "starts_with_heavy_cluster"],
-        "Internal": ["contains_plosive", "contains_fricative", "contains_liquid", "contains_nasal"],
-        "Nucleus": ["short_vowel", "long_vowel"],
-        "Coda": ["ends_with_vowel", "ends_with_nasal", "ends_with_stop"],
-    }
-
-    for category, feature_names in categories.items():
-        lines.append(f"  {category}:")
-        for name in feature_names:
-            fs = feat.by_name[name]
-            # Clean up feature name for display
-            short_name = (
-                name.replace("starts_with_", "")
-                .replace("ends_with_", "")
-                .replace("contains_", "")
-                .replace("_", " ")
-            )
-            lines.append(f"    {short_name:18} {fs.true_count:>6,} ({fs.true_percentage:5.1f}%)")
-
+    lines: list[str] = []
+    _format_feature_saturation(feat, lines)
     return "\n".join(lines)
 
 
@@ -252,61 +291,109 @@ def _format_exemplars_line(
     return f"    {low_label}: {low_str}    {high_label}: {high_str}"
 
 
-def format_terrain_metrics(terrain: TerrainMetrics) -> str:
+def _format_terrain_delta(score: float) -> str:
     """
-    Format terrain metrics as text with ASCII bars.
+    Format a terrain score as a signed offset from the 0.5 center.
 
-    Hi-fi resolution (30 chars) with center marker and delta display.
+    Args:
+        score: Axis score (0.0-1.0)
+
+    Returns:
+        Delta string like "+0.125" or "-0.040"
+    """
+    return f"{score - 0.5:+.3f}"
+
+
+def _render_terrain_bar(score: float, label: str) -> str:
+    """
+    Render one terrain axis as a bar, label and center delta.
 
     Args:
-        terrain: Terrain metrics to format
+        score: Axis score (0.0-1.0); out-of-range scores are clamped for the bar
+        label: Position label (e.g., "JAGGED")
 
     Returns:
-        Formatted text block with visualization
+        Bar line without indentation
     """
-    bar_width = 30  # Hi-fi resolution
-    bar_filled = "█"
-    bar_empty = "░"
-
-    def format_delta(score: float) -> str:
-        delta = score - 0.5
-        sign = "+" if delta >= 0 else ""
-        return f"{sign}{delta:.3f}"
-
-    def render_bar(score: float, label: str) -> str:
-        filled_count = int(score * bar_width)
-        empty_count = bar_width - filled_count
-        bar = bar_filled * filled_count + bar_empty * empty_count
-        delta = format_delta(score)
-        return f"{bar} {label:8} {delta}"
-
-    lines = [
-        "TERRAIN",
-        "",
-        "  Shape: Round <-> Jagged (Bouba/Kiki)",
-        f"    {render_bar(terrain.shape_score, terrain.shape_label)}",
-    ]
+    filled_count = max(0, min(TERRAIN_BAR_WIDTH, int(score * TERRAIN_BAR_WIDTH)))
+    return f"{_TERRAIN_BARS[filled_count]} {label:8} {_format_terrain_delta(score)}"
+
+
+def _format_terrain_metrics(terrain: TerrainMetrics, out: list[str]) -> None:
+    """Append the terrain block to ``out`` (see :func:`format_terrain_metrics`)."""
+    out.extend(
+        [
+            "TERRAIN",
+            "",
+            "  Shape: Round <-> Jagged (Bouba/Kiki)",
+            f"    {_render_terrain_bar(terrain.shape_score, terrain.shape_label)}",
+        ]
+    )
     exemplar_line = _format_exemplars_line(terrain.shape_exemplars, "round", "jagged")
     if exemplar_line:
-        lines.append(exemplar_line)
-    lines.append("")
+        out.append(exemplar_line)
+    out.append("")
 
-    lines.append("  Craft: Flowing <-> Worked (Sung/Forged)")
-    lines.append(f"    {render_bar(terrain.craft_score, terrain.craft_label)}")
+    out.append("  Craft: Flowing <-> Worked (Sung/Forged)")
+    out.append(f"    {_render_terrain_bar(terrain.craft_score, terrain.craft_label)}")
     exemplar_line = _format_exemplars_line(terrain.craft_exemplars, "flowing", "worked")
     if exemplar_line:
-        lines.append(exemplar_line)
-    lines.append("")
+        out.append(exemplar_line)
+    out.append("")
 
-    lines.append("  Space: Open <-> Dense (Valley/Workshop)")
-    lines.append(f"    {render_bar(terrain.space_score, terrain.space_label)}")
+    out.append("  Space: Open <-> Dense (Valley/Workshop)")
+    out.append(f"    {_render_terrain_bar(terrain.space_score, terrain.space_label)}")
     exemplar_line = _format_exemplars_line(terrain.space_exemplars, "open", "dense")
     if exemplar_line:
-        lines.append(exemplar_line)
+        out.append(exemplar_line)
+
 
+def format_terrain_metrics(terrain: TerrainMetrics) -> str:
+    """
+    Format terrain metrics as text with ASCII bars.
+
+    Hi-fi resolution (30 chars) with center marker and delta display.
+
+    Args:
+        terrain: Terrain metrics to format
+
+    Returns:
+        Formatted text block with visualization
+    """
+    lines: list[str] = []
+    _format_terrain_metrics(terrain, lines)
     return "\n".join(lines)
 
 
+def _format_patch_metrics(
+    patch_name: str,
+    metrics: CorpusShapeMetrics | None,
+    out: list[str],
+    corpus_path: Path | None = None,
+) -> None:
+    """Append the block for one patch to ``out`` (see :func:`format_patch_metrics`)."""
+    separator = "=" * 50
+
+    out.extend([separator, f"PATCH {patch_name}", separator])
+
+    if corpus_path:
+        out.append(f"Corpus: {corpus_path.name}")
+        out.append("")
+
+    if metrics is None:
+        out.append("(no corpus loaded)")
+        return
+
+    _format_inventory_metrics(metrics.inventory, out)
+    out.append("")
+    # Pass total_syllables to enable hapax rate percentage computation
+    _format_frequency_metrics(metrics.frequency, out, metrics.inventory.total_count)
+    out.append("")
+    _format_feature_saturation(metrics.feature_saturation, out)
+    out.append("")
+    _format_terrain_metrics(metrics.terrain, out)
+
+
 def format_patch_metrics(
     patch_name: str,
     metrics: CorpusShapeMetrics | None,
@@ -327,28 +414,8 @@ def format_patch_metrics(
     Returns:
         Formatted text block for entire patch with all metrics and percentages
     """
-    header = f"PATCH {patch_name}"
-    separator = "=" * 50
-
-    lines = [separator, header, separator]
-
-    if corpus_path:
-        lines.append(f"Corpus: {corpus_path.name}")
-        lines.append("")
-
-    if metrics is None:
-        lines.append("(no corpus loaded)")
-        return "\n".join(lines)
-
-    lines.append(format_inventory_metrics(metrics.inventory))
-    lines.append("")
-    # Pass total_syllables to enable hapax rate percentage computation
-    lines.append(format_frequency_metrics(metrics.frequency, metrics.inventory.total_count))
-    lines.append("")
-    lines.append(format_feature_saturation(metrics.feature_saturation))
-    lines.append("")
-    lines.append(format_terrain_metrics(metrics.terrain))
-
+    lines: list[str] = []
+    _format_patch_metrics(patch_name, metrics, lines, corpus_path)
     return "\n".join(lines)
 
 
@@ -357,6 +424,7 @@ def format_analysis_export(
     metrics_b: CorpusShapeMetrics | None,
     corpus_path_a: Path | None = None,
     corpus_path_b: Path | None = None,
+    now: datetime | None = None,
 ) -> str:
     """
     Format complete analysis export for both patches.
@@ -366,29 +434,34 @@ def format_analysis_export(
         metrics_b: Metrics for Patch B, or None if not loaded
         corpus_path_a: Optional path to Patch A corpus
         corpus_path_b: Optional path to Patch B corpus
+        now: Time for the "Generated" header. If None, uses datetime.now()
 
     Returns:
         Complete formatted export text
     """
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    timestamp = (now or datetime.now()).strftime("%Y-%m-%d %H:%M:%S")
 
-    header = [
+    buf: list[str] = [
         "CORPUS SHAPE METRICS EXPORT",
         f"Generated: {timestamp}",
         "",
     ]
 
-    patch_a_text = format_patch_metrics("A", metrics_a, corpus_path_a)
-    patch_b_text = format_patch_metrics("B", metrics_b, corpus_path_b)
-
-    footer = [
-        "",
-        "=" * 50,
-        "Export generated by Syllable Walker TUI",
-        "https://github.com/aa-parky/pipeworks_name_generation",
-    ]
+    _format_patch_metrics("A", metrics_a, buf, corpus_path_a)
+    buf.append("")
+    _format_patch_metrics("B", metrics_b, buf, corpus_path_b)
+
+    buf.extend(
+        [
+            "",
+            "=" * 50,
+            "Export generated by Syllable Walker TUI",
+            "https://github.com/aa-parky/pipeworks_name_generation",
+        ]
+    )
 
-    return "\n".join(header + [patch_a_text, "", patch_b_text] + footer)
+    # Single join for the whole export - section formatters only append lines
+    return "\n".join(buf)
 
 
 def export_analysis_to_file(
@@ -397,6 +470,7 @@ def export_analysis_to_file(
     metrics_b: CorpusShapeMetrics | None,
     corpus_path_a: Path | None = None,
     corpus_path_b: Path | None = None,
+    now: datetime | None = None,
 ) -> Path:
     """
     Export analysis to a text file.
@@ -407,6 +481,8 @@ def export_analysis_to_file(
         metrics_b: Metrics for Patch B, or None if not loaded
         corpus_path_a: Optional path to Patch A corpus
         corpus_path_b: Optional path to Patch B corpus
+        now: Time for the "Generated" header. Pass the value used for
+            generate_export_filename() so the header matches the filename
 
     Returns:
         Path to the written file
@@ -419,18 +495,23 @@ def export_analysis_to_file(
         metrics_b=metrics_b,
         corpus_path_a=corpus_path_a,
         corpus_path_b=corpus_path_b,
+        now=now,
     )
 
-    filepath.write_text(content, encoding="utf-8")
+    # Encode once and skip the text-wrapper layer; exports always use "\n" line endings
+    filepath.write_bytes(content.encode("utf-8"))
     return filepath
 
 
-def generate_export_filename() -> str:
+def generate_export_filename(now: datetime | None = None) -> str:
     """
     Generate a timestamped filename for export.
 
+    Args:
+        now: Time to stamp the filename with. If None, uses datetime.now()
+
     Returns:
         Filename like "corpus_metrics_20260118_143022.txt"
     """
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = (now or datetime.now()).strftime("%Y%m%d_%H%M%S")
     return f"corpus_metrics_{timestamp}.txt"
@@ -8,6 +8,13 @@ from both patches in the center column.
 from textual.app import ComposeResult
 from textual.widgets import Label, Static
 
+# (patch name, header classes) for each section; Patch B's header carries the
+# blank rows that separate it from Patch A
+_PATCH_SECTIONS = (
+    ("A", "stats-header"),
+    ("B", "stats-header section-gap"),
+)
+
 
 class StatsPanel(Static):
     """
@@ -18,18 +25,22 @@ class StatsPanel(Static):
     """
 
     def compose(self) -> ComposeResult:
-        """Create child widgets for walk output panel."""
-        # Patch A section
-        yield Label("PATCH A", id="walks-header-A", classes="stats-header")
-        yield Label("(no corpus selected)", id="walks-corpus-A", classes="corpus-label")
-        yield Label("────────────────────", classes="divider")
-        yield Label("(generate to see walks)", id="walks-output-A", classes="output-placeholder")
-
-        yield Label("", classes="spacer")
-        yield Label("", classes="spacer")
-
-        # Patch B section
-        yield Label("PATCH B", id="walks-header-B", classes="stats-header")
-        yield Label("(no corpus selected)", id="walks-corpus-B", classes="corpus-label")
-        yield Label("────────────────────", classes="divider")
-        yield Label("(generate to see walks)", id="walks-output-B", classes="output-placeholder")
+        """
+        Create child widgets for walk output panel.
+
+        Both patch sections share one layout. The gap between them comes from
+        the section-gap class in styles.tcss rather than empty spacer labels.
+        """
+        for patch_name, header_classes in _PATCH_SECTIONS:
+            yield Label(
+                f"PATCH {patch_name}", id=f"walks-header-{patch_name}", classes=header_classes
+            )
+            yield Label(
+                "(no corpus selected)", id=f"walks-corpus-{patch_name}", classes="corpus-label"
+            )
+            yield Label("────────────────────", classes="divider")
+            yield Label(
+                "(generate to see walks)",
+                id=f"walks-output-{patch_name}",
+                classes="output-placeholder",
+            )
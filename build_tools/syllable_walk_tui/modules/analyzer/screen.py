@@ -35,6 +35,9 @@ from __future__ import annotations
 
 import random
 from collections.abc import Callable, Sequence
+from dataclasses import replace
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 from textual.app import ComposeResult
@@ -43,6 +46,8 @@ from textual.screen import Screen
 from textual.widgets import Label
 
 from build_tools.syllable_walk_tui.modules.analyzer.exporter import (
+    FEATURE_CATEGORIES,
+    FEATURE_DISPLAY_NAMES,
     export_analysis_to_file,
     generate_export_filename,
 )
@@ -53,6 +58,7 @@ from build_tools.syllable_walk_tui.services.metrics import (
     compute_terrain_metrics,
 )
 from build_tools.syllable_walk_tui.services.terrain_weights import (
+    DEFAULT_TERRAIN_WEIGHTS,
     AxisWeights,
     TerrainWeights,
     create_default_terrain_weights,
@@ -63,6 +69,11 @@ BAR_WIDTH = 30  # Doubled from 15 for better resolution
 BAR_FILLED = "█"
 BAR_EMPTY = "░"
 
+# Every possible bar (0..BAR_WIDTH filled cells), built once so a redraw is a lookup
+_BAR_TABLE = tuple(
+    BAR_FILLED * filled + BAR_EMPTY * (BAR_WIDTH - filled) for filled in range(BAR_WIDTH + 1)
+)
+
 # Short names for features (for compact weight display)
 FEATURE_SHORT_NAMES: dict[str, str] = {
     "contains_liquid": "liq",
@@ -103,15 +114,13 @@ def render_terrain_bar(score: float, label: str) -> str:
     is the key precision indicator.
 
     Args:
-        score: Value from 0.0 to 1.0
+        score: Value from 0.0 to 1.0 (out-of-range scores are clamped for the bar)
         label: Text label to show after the bar (e.g., "JAGGED")
 
     Returns:
         Formatted string with bar, label, and delta
     """
-    filled_count = int(score * BAR_WIDTH)
-    empty_count = BAR_WIDTH - filled_count
-    bar = BAR_FILLED * filled_count + BAR_EMPTY * empty_count
+    bar = _BAR_TABLE[min(max(int(score * BAR_WIDTH), 0), BAR_WIDTH)]
     delta = format_delta(score)
     return f"{bar} {label:8} {delta}"
 
@@ -141,6 +150,23 @@ def render_exemplars_line(
     return f"    {low_label}: {low_str}    {high_label}: {high_str}"
 
 
+# (attribute prefix, axis heading, low pole, high pole) for each terrain axis
+_TERRAIN_AXES = (
+    ("shape", "  Shape: Round ↔ Jagged (Bouba/Kiki)", "round", "jagged"),
+    ("craft", "  Craft: Flowing ↔ Worked (Sung/Forged)", "flowing", "worked"),
+    ("space", "  Space: Open ↔ Dense (Valley/Workshop)", "open", "dense"),
+)
+
+# Feature saturation group headings and padded row prefixes, built once at import
+_FEATURE_GROUPS = tuple(
+    (
+        f"  {category}:",
+        tuple((name, f"    {FEATURE_DISPLAY_NAMES[name]:18} ") for name in feature_names),
+    )
+    for category, feature_names in FEATURE_CATEGORIES
+)
+
+
 def format_weight_chip(feature: str, weight: float, selected: bool = False) -> str:
     """
     Format a weight as a compact chip for display.
@@ -178,10 +204,26 @@ def format_weights_row(
     Returns:
         Formatted string with all weight chips
     """
-    chips = []
-    for i, (feature, weight) in enumerate(axis_weights.items()):
-        is_selected = (axis_index == selected_axis) and (i == selected_weight)
-        chips.append(format_weight_chip(feature, weight, is_selected))
+    selected_index = selected_weight if axis_index == selected_axis else -1
+    return _render_weights_row(axis_weights.as_tuple(), selected_index)
+
+
+@lru_cache(maxsize=256)
+def _render_weights_row(weights: tuple[tuple[str, float], ...], selected_index: int) -> str:
+    """
+    Render a weights row from a hashable snapshot (cached across refreshes).
+
+    Args:
+        weights: Ordered (feature, weight) pairs from AxisWeights.as_tuple()
+        selected_index: Index of the highlighted chip, or -1 for none
+
+    Returns:
+        Formatted string with all weight chips
+    """
+    chips = [
+        format_weight_chip(feature, weight, i == selected_index)
+        for i, (feature, weight) in enumerate(weights)
+    ]
     return "    " + "  ".join(chips)
 
 
@@ -224,6 +266,18 @@ class TerrainDisplay(Vertical):
         super().__init__()
         self.terrain = terrain
 
+        # Per-axis (bar, exemplars) labels kept from compose for in-place updates
+        self._axis_labels: dict[str, tuple[Label, Label]] = {}
+
+    @staticmethod
+    def _axis_text(terrain: TerrainMetrics, axis: str, low: str, high: str) -> tuple[str, str]:
+        """Render the bar and exemplars lines for one axis."""
+        bar = render_terrain_bar(
+            getattr(terrain, f"{axis}_score"), getattr(terrain, f"{axis}_label")
+        )
+        exemplars = render_exemplars_line(getattr(terrain, f"{axis}_exemplars"), low, high)
+        return f"    {bar}", exemplars
+
     def compose(self) -> ComposeResult:
         """Create terrain display layout."""
         yield Label("TERRAIN", classes="terrain-header")
@@ -233,37 +287,39 @@ class TerrainDisplay(Vertical):
             yield Label("(no data)", classes="terrain-label")
             return
 
-        # Shape axis (Round ↔ Jagged) - Bouba/Kiki
-        yield Label("  Shape: Round ↔ Jagged (Bouba/Kiki)", classes="terrain-label")
-        yield Label(
-            f"    {render_terrain_bar(self.terrain.shape_score, self.terrain.shape_label)}",
-            classes="terrain-row",
-        )
-        exemplars_line = render_exemplars_line(self.terrain.shape_exemplars, "round", "jagged")
-        if exemplars_line:
-            yield Label(exemplars_line, classes="terrain-exemplars")
-        yield Label("", classes="terrain-row")
+        for i, (axis, heading, low, high) in enumerate(_TERRAIN_AXES):
+            if i:
+                yield Label("", classes="terrain-row")
+            bar_text, exemplars_text = self._axis_text(self.terrain, axis, low, high)
+            bar = Label(bar_text, classes="terrain-row")
+            # Always composed so updates never change the widget tree; hidden when empty
+            exemplars = Label(exemplars_text, classes="terrain-exemplars")
+            exemplars.display = bool(exemplars_text)
+            self._axis_labels[axis] = (bar, exemplars)
+
+            yield Label(heading, classes="terrain-label")
+            yield bar
+            yield exemplars
+
+    def update_terrain(self, terrain: TerrainMetrics) -> None:
+        """
+        Show new terrain metrics by rewriting only the bar and exemplar labels.
 
-        # Craft axis (Flowing ↔ Worked) - Sung/Forged
-        yield Label("  Craft: Flowing ↔ Worked (Sung/Forged)", classes="terrain-label")
-        yield Label(
-            f"    {render_terrain_bar(self.terrain.craft_score, self.terrain.craft_label)}",
-            classes="terrain-row",
-        )
-        exemplars_line = render_exemplars_line(self.terrain.craft_exemplars, "flowing", "worked")
-        if exemplars_line:
-            yield Label(exemplars_line, classes="terrain-exemplars")
-        yield Label("", classes="terrain-row")
+        Args:
+            terrain: Recomputed terrain metrics
+        """
+        self.terrain = terrain
+        if not self._axis_labels:
+            # Composed without data - nothing to update in place
+            self.refresh(recompose=True)
+            return
 
-        # Space axis (Open ↔ Dense) - Valley/Workshop
-        yield Label("  Space: Open ↔ Dense (Valley/Workshop)", classes="terrain-label")
-        yield Label(
-            f"    {render_terrain_bar(self.terrain.space_score, self.terrain.space_label)}",
-            classes="terrain-row",
-        )
-        exemplars_line = render_exemplars_line(self.terrain.space_exemplars, "open", "dense")
-        if exemplars_line:
-            yield Label(exemplars_line, classes="terrain-exemplars")
+        for axis, _, low, high in _TERRAIN_AXES:
+            bar_text, exemplars_text = self._axis_text(terrain, axis, low, high)
+            bar, exemplars = self._axis_labels[axis]
+            bar.update(bar_text)
+            exemplars.update(exemplars_text)
+            exemplars.display = bool(exemplars_text)
 
 
 class WeightsModal(Screen):
@@ -358,8 +414,12 @@ class WeightsModal(Screen):
 
         # Build navigation positions for both patches
         self._positions: list[tuple[int, int, int, str]] = []  # (patch, axis, weight, feature)
+        self._position_index: dict[tuple[int, int, int], int] = {}  # (patch, axis, weight) -> idx
         self._build_positions()
 
+        # Last text pushed to each weights row Label, keyed by widget id
+        self._rendered_rows: dict[str, str] = {}
+
     def _build_positions(self) -> None:
         """Build flat list of all weight positions for Tab navigation."""
         self._positions = []
@@ -369,6 +429,12 @@ class WeightsModal(Screen):
                 for weight_idx, feature in enumerate(axis.feature_names()):
                     self._positions.append((patch_idx, axis_idx, weight_idx, feature))
 
+        # Reverse lookup so Tab navigation doesn't rescan the list
+        self._position_index = {
+            (patch, axis, weight): idx
+            for idx, (patch, axis, weight, _) in enumerate(self._positions)
+        }
+
     def _get_current_weights(self) -> TerrainWeights:
         """Get the currently selected patch's weights."""
         return self.weights_a if self.selected_patch == 0 else self.weights_b
@@ -393,14 +459,8 @@ class WeightsModal(Screen):
 
     def _flat_index(self) -> int:
         """Get flat index in _positions for current selection."""
-        for i, (patch, axis, weight, _) in enumerate(self._positions):
-            if (
-                patch == self.selected_patch
-                and axis == self.selected_axis
-                and weight == self.selected_weight
-            ):
-                return i
-        return 0
+        key = (self.selected_patch, self.selected_axis, self.selected_weight)
+        return self._position_index.get(key, 0)
 
     def _set_from_flat_index(self, idx: int) -> None:
         """Set selection from flat index."""
@@ -463,34 +523,26 @@ class WeightsModal(Screen):
         self._refresh_weights()
 
     def _refresh_weights(self) -> None:
-        """Refresh the weights display for both patches."""
-        # Determine selection for each patch
-        sel_a_axis = self.selected_axis if self.selected_patch == 0 else -1
-        sel_a_weight = self.selected_weight if self.selected_patch == 0 else -1
-        sel_b_axis = self.selected_axis if self.selected_patch == 1 else -1
-        sel_b_weight = self.selected_weight if self.selected_patch == 1 else -1
-
-        # Update Patch A
-        self.query_one("#a-shape", Label).update(
-            format_weights_row(self.weights_a.shape, 0, sel_a_axis, sel_a_weight)
-        )
-        self.query_one("#a-craft", Label).update(
-            format_weights_row(self.weights_a.craft, 1, sel_a_axis, sel_a_weight)
-        )
-        self.query_one("#a-space", Label).update(
-            format_weights_row(self.weights_a.space, 2, sel_a_axis, sel_a_weight)
-        )
+        """
+        Refresh the weights display for both patches.
 
-        # Update Patch B
-        self.query_one("#b-shape", Label).update(
-            format_weights_row(self.weights_b.shape, 0, sel_b_axis, sel_b_weight)
-        )
-        self.query_one("#b-craft", Label).update(
-            format_weights_row(self.weights_b.craft, 1, sel_b_axis, sel_b_weight)
-        )
-        self.query_one("#b-space", Label).update(
-            format_weights_row(self.weights_b.space, 2, sel_b_axis, sel_b_weight)
-        )
+        Rows are only pushed to their Label when the rendered text changed, so a
+        Tab or j/k press repaints just the rows it touched.
+        """
+        for patch_idx, (prefix, weights) in enumerate(
+            (("a", self.weights_a), ("b", self.weights_b))
+        ):
+            # Rows for the other patch have no selected chip
+            sel_axis = self.selected_axis if self.selected_patch == patch_idx else -1
+            sel_weight = self.selected_weight if self.selected_patch == patch_idx else -1
+            axes = (("shape", weights.shape), ("craft", weights.craft), ("space", weights.space))
+
+            for axis_idx, (axis_name, axis) in enumerate(axes):
+                row = format_weights_row(axis, axis_idx, sel_axis, sel_weight)
+                row_id = f"{prefix}-{axis_name}"
+                if self._rendered_rows.get(row_id) != row:
+                    self._rendered_rows[row_id] = row
+                    self.query_one(f"#{row_id}", Label).update(row)
 
     def action_close_modal(self) -> None:
         """Close the modal and trigger callback."""
@@ -530,16 +582,17 @@ class WeightsModal(Screen):
 
     def action_reset_weights(self) -> None:
         """Reset current patch's weights to defaults."""
-        defaults = create_default_terrain_weights()
+        # Copy the shared defaults so later edits never write back into them
+        defaults = DEFAULT_TERRAIN_WEIGHTS
         if self.selected_patch == 0:
-            self.weights_a.shape = defaults.shape
-            self.weights_a.craft = defaults.craft
-            self.weights_a.space = defaults.space
+            self.weights_a.shape = defaults.shape.copy()
+            self.weights_a.craft = defaults.craft.copy()
+            self.weights_a.space = defaults.space.copy()
             self.notify("Patch A weights reset")
         else:
-            self.weights_b.shape = defaults.shape
-            self.weights_b.craft = defaults.craft
-            self.weights_b.space = defaults.space
+            self.weights_b.shape = defaults.shape.copy()
+            self.weights_b.craft = defaults.craft.copy()
+            self.weights_b.space = defaults.space.copy()
             self.notify("Patch B weights reset")
         self._build_positions()
         self._refresh_weights()
@@ -585,52 +638,15 @@ class FeatureSaturationDisplay(Vertical):
         yield Label(f"  Total analyzed:     {feat.total_syllables:,}", classes="feat-row")
         yield Label("", classes="feat-row")
 
-        # Group features by category
-        onset_features = ["starts_with_vowel", "starts_with_cluster", "starts_with_heavy_cluster"]
-        internal_features = [
-            "contains_plosive",
-            "contains_fricative",
-            "contains_liquid",
-            "contains_nasal",
-        ]
-        nucleus_features = ["short_vowel", "long_vowel"]
-        coda_features = ["ends_with_vowel", "ends_with_nasal", "ends_with_stop"]
-
-        yield Label("  Onset:", classes="feat-label")
-        for name in onset_features:
-            fs = feat.by_name[name]
-            short_name = name.replace("starts_with_", "").replace("_", " ")
-            yield Label(
-                f"    {short_name:18} {fs.true_count:>6,} ({fs.true_percentage:5.1f}%)",
-                classes="feat-row",
-            )
-
-        yield Label("  Internal:", classes="feat-label")
-        for name in internal_features:
-            fs = feat.by_name[name]
-            short_name = name.replace("contains_", "").replace("_", " ")
-            yield Label(
-                f"    {short_name:18} {fs.true_count:>6,} ({fs.true_percentage:5.1f}%)",
-                classes="feat-row",
-            )
-
-        yield Label("  Nucleus:", classes="feat-label")
-        for name in nucleus_features:
-            fs = feat.by_name[name]
-            short_name = name.replace("_", " ")
-            yield Label(
-                f"    {short_name:18} {fs.true_count:>6,} ({fs.true_percentage:5.1f}%)",
-                classes="feat-row",
-            )
-
-        yield Label("  Coda:", classes="feat-label")
-        for name in coda_features:
-            fs = feat.by_name[name]
-            short_name = name.replace("ends_with_", "").replace("_", " ")
-            yield Label(
-                f"    {short_name:18} {fs.true_count:>6,} ({fs.true_percentage:5.1f}%)",
-                classes="feat-row",
-            )
+        # Group features by category (headings and row prefixes shared by both patches)
+        for heading, rows in _FEATURE_GROUPS:
+            yield Label(heading, classes="feat-label")
+            for name, prefix in rows:
+                fs = feat.by_name[name]
+                yield Label(
+                    f"{prefix}{fs.true_count:>6,} ({fs.true_percentage:5.1f}%)",
+                    classes="feat-row",
+                )
 
 
 class MetricsDisplay(Vertical):
@@ -734,77 +750,85 @@ class MetricsDisplay(Vertical):
             yield Label("(no corpus loaded)", classes="metrics-dim")
             return
 
+        # Section bodies never change after mount, so each is one multi-line
+        # Label rather than a Label per row
+
         # === INVENTORY METRICS ===
         inv = self.metrics.inventory
         yield Label("INVENTORY", classes="metrics-subheader")
-        yield Label(f"  Total syllables:    {inv.total_count:,}", classes="metrics-row")
-        yield Label(f"  Length min:         {inv.length_min}", classes="metrics-row")
-        yield Label(f"  Length max:         {inv.length_max}", classes="metrics-row")
-        yield Label(f"  Length mean:        {inv.length_mean:.2f}", classes="metrics-row")
-        yield Label(f"  Length median:      {inv.length_median:.1f}", classes="metrics-row")
-        yield Label(f"  Length std:         {inv.length_std:.2f}", classes="metrics-row")
+        rows = [
+            f"  Total syllables:    {inv.total_count:,}",
+            f"  Length min:         {inv.length_min}",
+            f"  Length max:         {inv.length_max}",
+            f"  Length mean:        {inv.length_mean:.2f}",
+            f"  Length median:      {inv.length_median:.1f}",
+            f"  Length std:         {inv.length_std:.2f}",
+        ]
 
         # Length distribution with percentages
         # Each count shown as both raw count and percentage of total inventory
         dist_str = "  Length dist:        "
         dist_parts = [
             f"{length}:{count} ({count / inv.total_count * 100:.1f}%)"
-            for length, count in sorted(inv.length_distribution.items())
+            for length, count in inv.length_distribution.items()
         ]
-        yield Label(dist_str + ", ".join(dist_parts[:4]), classes="metrics-row")
+        rows.append(dist_str + ", ".join(dist_parts[:4]))
         if len(dist_parts) > 4:
-            yield Label(
-                "                      " + ", ".join(dist_parts[4:8]), classes="metrics-row"
-            )
+            rows.append("                      " + ", ".join(dist_parts[4:8]))
         if len(dist_parts) > 8:
-            yield Label("                      " + ", ".join(dist_parts[8:]), classes="metrics-row")
+            rows.append("                      " + ", ".join(dist_parts[8:]))
+        yield Label("\n".join(rows), classes="metrics-row", markup=False)
 
         # === FREQUENCY METRICS ===
         freq = self.metrics.frequency
         yield Label("FREQUENCY", classes="metrics-subheader")
-        yield Label(f"  Total occurrences:  {freq.total_occurrences:,}", classes="metrics-row")
-        yield Label(f"  Freq min:           {freq.freq_min:,}", classes="metrics-row")
-        yield Label(f"  Freq max:           {freq.freq_max:,}", classes="metrics-row")
-        yield Label(f"  Freq mean:          {freq.freq_mean:.2f}", classes="metrics-row")
-        yield Label(f"  Freq median:        {freq.freq_median:.1f}", classes="metrics-row")
-        yield Label(f"  Freq std:           {freq.freq_std:.2f}", classes="metrics-row")
-        yield Label(f"  Unique freq values: {freq.unique_freq_count:,}", classes="metrics-row")
 
         # Hapax rate: percentage of unique syllables that appear exactly once
         # High hapax rate indicates diverse vocabulary with many rare syllables
         hapax_rate = (freq.hapax_count / inv.total_count * 100) if inv.total_count > 0 else 0.0
-        yield Label(
-            f"  Hapax (freq=1):     {freq.hapax_count:,} ({hapax_rate:.1f}%)",
-            classes="metrics-row",
-        )
 
-        # Percentiles
-        yield Label("  Percentiles:", classes="metrics-row")
-        yield Label(
+        rows = [
+            f"  Total occurrences:  {freq.total_occurrences:,}",
+            f"  Freq min:           {freq.freq_min:,}",
+            f"  Freq max:           {freq.freq_max:,}",
+            f"  Freq mean:          {freq.freq_mean:.2f}",
+            f"  Freq median:        {freq.freq_median:.1f}",
+            f"  Freq std:           {freq.freq_std:.2f}",
+            f"  Unique freq values: {freq.unique_freq_count:,}",
+            f"  Hapax (freq=1):     {freq.hapax_count:,} ({hapax_rate:.1f}%)",
+            # Percentiles
+            "  Percentiles:",
             f"    P10={freq.percentile_10:,}  P25={freq.percentile_25:,}  "
             f"P50={freq.percentile_50:,}",
-            classes="metrics-row",
-        )
-        yield Label(
             f"    P75={freq.percentile_75:,}  P90={freq.percentile_90:,}  "
             f"P99={freq.percentile_99:,}",
-            classes="metrics-row",
-        )
+            "  Top 5 by frequency:",
+        ]
 
         # Top 5 syllables with percentage of total occurrences
         # Shows corpus concentration - how much a few syllables dominate
-        yield Label("  Top 5 by frequency:", classes="metrics-row")
         for syl, count in freq.top_10[:5]:
             pct_of_total = (
                 (count / freq.total_occurrences * 100) if freq.total_occurrences > 0 else 0.0
             )
-            yield Label(f"    {syl}: {count:,} ({pct_of_total:.1f}%)", classes="metrics-row")
+            rows.append(f"    {syl}: {count:,} ({pct_of_total:.1f}%)")
+        yield Label("\n".join(rows), classes="metrics-row", markup=False)
 
         # === FEATURE SATURATION + TERRAIN (side by side) ===
         with Horizontal(classes="feature-terrain-row"):
             yield FeatureSaturationDisplay(self.metrics)
             yield TerrainDisplay(self.metrics.terrain)
 
+    def update_terrain(self, metrics: CorpusShapeMetrics) -> None:
+        """
+        Show metrics whose terrain was recomputed, updating only the terrain widget.
+
+        Args:
+            metrics: Same metrics as displayed, with new terrain
+        """
+        self.metrics = metrics
+        self.query_one(TerrainDisplay).update_terrain(metrics.terrain)
+
 
 class AnalysisScreen(Screen):
     """
@@ -916,15 +940,19 @@ class AnalysisScreen(Screen):
         self.weights_a = create_default_terrain_weights()
         self.weights_b = create_default_terrain_weights()
 
-    def _recompute_terrain(self, new_exemplar_rng: bool = False) -> None:
+    def _recompute_terrain(self, new_exemplar_rng: bool = False) -> bool:
         """
         Recompute terrain metrics with current weights for each patch.
 
         Args:
             new_exemplar_rng: If True, create a fresh RNG for exemplar variety.
                               If False, reuses existing exemplars (deterministic).
+
+        Returns:
+            True if either patch's terrain changed and the display needs a refresh
         """
         exemplar_rng = random.Random() if new_exemplar_rng else None  # nosec B311
+        changed = False
 
         if self.feature_saturation_a and self.metrics_a:
             new_terrain = compute_terrain_metrics(
@@ -933,12 +961,9 @@ class AnalysisScreen(Screen):
                 annotated_data=self.annotated_data_a,
                 exemplar_rng=exemplar_rng,
             )
-            self.metrics_a = CorpusShapeMetrics(
-                inventory=self.metrics_a.inventory,
-                frequency=self.metrics_a.frequency,
-                feature_saturation=self.metrics_a.feature_saturation,
-                terrain=new_terrain,
-            )
+            if new_terrain != self.metrics_a.terrain:
+                self.metrics_a = replace(self.metrics_a, terrain=new_terrain)
+                changed = True
         if self.feature_saturation_b and self.metrics_b:
             new_terrain = compute_terrain_metrics(
                 self.feature_saturation_b,
@@ -946,33 +971,39 @@ class AnalysisScreen(Screen):
                 annotated_data=self.annotated_data_b,
                 exemplar_rng=exemplar_rng,
             )
-            self.metrics_b = CorpusShapeMetrics(
-                inventory=self.metrics_b.inventory,
-                frequency=self.metrics_b.frequency,
-                feature_saturation=self.metrics_b.feature_saturation,
-                terrain=new_terrain,
-            )
+            if new_terrain != self.metrics_b.terrain:
+                self.metrics_b = replace(self.metrics_b, terrain=new_terrain)
+                changed = True
+
+        return changed
 
     def _refresh_display(self) -> None:
-        """Refresh the screen with updated metrics."""
-        content = self.query_one("#analysis-content", Horizontal)
-        content.remove_children()
+        """
+        Refresh the screen after terrain was recomputed.
 
-        patch_a = Vertical(MetricsDisplay("A", self.metrics_a), classes="patch-metrics")
-        patch_b = Vertical(MetricsDisplay("B", self.metrics_b), classes="patch-metrics")
-        content.mount(patch_a, patch_b)
+        Only terrain changes after mount, so the existing MetricsDisplay widgets
+        rewrite their terrain labels in place instead of being rebuilt.
+        """
+        for display, metrics in (
+            (self._metrics_display_a, self.metrics_a),
+            (self._metrics_display_b, self.metrics_b),
+        ):
+            if metrics is not None:
+                display.update_terrain(metrics)
 
     def compose(self) -> ComposeResult:
         """Create analysis screen layout."""
         # Header
         yield Label("CORPUS SHAPE METRICS", id="analysis-header", classes="analysis-title")
 
-        # Main content: side-by-side metrics
+        # Main content: side-by-side metrics (kept for in-place terrain updates)
+        self._metrics_display_a = MetricsDisplay("A", self.metrics_a)
+        self._metrics_display_b = MetricsDisplay("B", self.metrics_b)
         with Horizontal(id="analysis-content"):
             with Vertical(classes="patch-metrics"):
-                yield MetricsDisplay("A", self.metrics_a)
+                yield self._metrics_display_a
             with Vertical(classes="patch-metrics"):
-                yield MetricsDisplay("B", self.metrics_b)
+                yield self._metrics_display_b
 
         # Footer
         yield Label(
@@ -989,8 +1020,9 @@ class AnalysisScreen(Screen):
         """Export metrics to a text file."""
         self.export_dir.mkdir(parents=True, exist_ok=True)
 
-        filename = generate_export_filename()
-        filepath = self.export_dir / filename
+        # One timestamp for both the filename and the export header
+        now = datetime.now()
+        filepath = self.export_dir / generate_export_filename(now)
 
         try:
             export_analysis_to_file(
@@ -999,6 +1031,7 @@ class AnalysisScreen(Screen):
                 metrics_b=self.metrics_b,
                 corpus_path_a=self.corpus_path_a,
                 corpus_path_b=self.corpus_path_b,
+                now=now,
             )
             self.notify(f"Exported to {filepath}", title="Export Complete", severity="information")
         except OSError as e:
@@ -1009,13 +1042,14 @@ class AnalysisScreen(Screen):
 
         def on_weights_closed() -> None:
             """Callback when weights modal closes."""
-            self._recompute_terrain()
-            self._refresh_display()
+            # Closing without edits leaves terrain as-is; skip the widget rebuild
+            if self._recompute_terrain():
+                self._refresh_display()
 
         self.app.push_screen(WeightsModal(self.weights_a, self.weights_b, on_weights_closed))
 
     def action_refresh_exemplars(self) -> None:
         """Resample exemplars with new RNG for variety."""
-        self._recompute_terrain(new_exemplar_rng=True)
-        self._refresh_display()
+        if self._recompute_terrain(new_exemplar_rng=True):
+            self._refresh_display()
         self.notify("Exemplars refreshed", severity="information")
@@ -3,20 +3,19 @@ Backend services for Syllable Walker TUI.
 
 This module contains service layers for corpus loading, configuration management,
 terrain weights, generation, and other backend operations.
+
+Corpus loaders are resolved lazily on first attribute access, so importing the
+TUI does not load the JSON/SQLite corpus readers until a corpus is selected.
 """
 
+from typing import TYPE_CHECKING, Any
+
 from build_tools.syllable_walk_tui.services.combiner_runner import CombinerResult, run_combiner
 from build_tools.syllable_walk_tui.services.config import (
     KeybindingConfig,
     load_config_file,
     load_keybindings,
 )
-from build_tools.syllable_walk_tui.services.corpus import (
-    get_corpus_info,
-    load_annotated_data,
-    load_corpus_data,
-    validate_corpus_directory,
-)
 from build_tools.syllable_walk_tui.services.exporter import (
     export_names_to_txt,
     export_sample_json,
@@ -43,6 +42,28 @@ from build_tools.syllable_walk_tui.services.terrain_weights import (
     load_terrain_weights,
 )
 
+if TYPE_CHECKING:
+    from build_tools.syllable_walk_tui.services.corpus import (
+        get_corpus_info,
+        load_annotated_data,
+        load_corpus_data,
+        validate_corpus_directory,
+    )
+
+_CORPUS_EXPORTS = frozenset(
+    {"get_corpus_info", "load_annotated_data", "load_corpus_data", "validate_corpus_directory"}
+)
+
+
+def __getattr__(name: str) -> Any:
+    """Import corpus loaders on first access."""
+    if name in _CORPUS_EXPORTS:
+        from build_tools.syllable_walk_tui.services import corpus
+
+        return getattr(corpus, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     # Config
     "KeybindingConfig",
@@ -21,6 +21,7 @@ For the base config without patch_bindings, use tui_common directly:
 
 from __future__ import annotations
 
+import logging
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -33,6 +34,8 @@ from build_tools.tui_common.services.config import (
 )
 from build_tools.tui_common.services.config import KeybindingConfig as BaseKeybindingConfig
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class KeybindingConfig(BaseKeybindingConfig):
@@ -135,9 +138,10 @@ def load_keybindings(config_path: Path | None = None) -> KeybindingConfig:
     # Check for conflicts (from shared module)
     conflicts = detect_conflicts(config)
     if conflicts:
-        print("Warning: Keybinding conflicts detected:")
-        for conflict in conflicts:
-            print(f"  - {conflict}")
+        logger.warning(
+            "Keybinding conflicts detected:\n%s",
+            "\n".join(f"  - {conflict}" for conflict in conflicts),
+        )
 
     return config
 
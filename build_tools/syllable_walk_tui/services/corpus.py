@@ -6,9 +6,47 @@ from normalized syllable extraction output directories.
 """
 
 import json
+import logging
+import os
 import sqlite3
+import stat
+import time
+from functools import lru_cache
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
+# Feature flag columns of the corpus.db ``syllables`` table, in annotator order
+FEATURE_COLUMNS: tuple[str, ...] = (
+    "starts_with_vowel",
+    "starts_with_cluster",
+    "starts_with_heavy_cluster",
+    "contains_plosive",
+    "contains_fricative",
+    "contains_liquid",
+    "contains_nasal",
+    "short_vowel",
+    "long_vowel",
+    "ends_with_vowel",
+    "ends_with_nasal",
+    "ends_with_stop",
+)
+
+# Corpus type and its required (syllables, frequencies) files, in detection order
+_CORPUS_LAYOUTS: tuple[tuple[str, tuple[str, str]], ...] = (
+    ("NLTK", ("nltk_syllables_unique.txt", "nltk_syllables_frequencies.json")),
+    ("Pyphen", ("pyphen_syllables_unique.txt", "pyphen_syllables_frequencies.json")),
+)
+_CORPUS_FILE_NAMES = frozenset(name for _, names in _CORPUS_LAYOUTS for name in names)
+
+# Directories modified this recently are re-probed instead of cached: a file added
+# within the same timestamp tick would not change the directory mtime again.
+_RECENT_CHANGE_NS = 2_000_000_000
+
+_ANNOTATED_QUERY = (
+    f"SELECT syllable, frequency, {', '.join(FEATURE_COLUMNS)} FROM syllables ORDER BY syllable"
+)
+
 
 def validate_corpus_directory(path: Path) -> tuple[bool, str, str]:
     """
@@ -35,37 +73,63 @@ def validate_corpus_directory(path: Path) -> tuple[bool, str, str]:
         (False, "", "Directory does not exist")
     """
     # Check directory exists
-    if not path.exists():
+    try:
+        dir_stat = path.stat()
+    except OSError:
         return (False, "", "Directory does not exist")
 
-    if not path.is_dir():
+    if not stat.S_ISDIR(dir_stat.st_mode):
         return (False, "", "Path is not a directory")
 
-    # Check for NLTK corpus
-    nltk_syllables = path / "nltk_syllables_unique.txt"
-    nltk_frequencies = path / "nltk_syllables_frequencies.json"
+    # Corpus files live directly in the directory, so its mtime changes whenever
+    # they are added, removed or renamed; unchanged directories reuse the last probe
+    if time.time_ns() - dir_stat.st_mtime_ns < _RECENT_CHANGE_NS:
+        return _probe_corpus_files(path)
+    return _probe_corpus_files_cached(path, dir_stat.st_mtime_ns)
+
 
-    if nltk_syllables.exists() and nltk_frequencies.exists():
-        # Validate both are files
-        if not nltk_syllables.is_file():
-            return (False, "", "nltk_syllables_unique.txt is not a file")
-        if not nltk_frequencies.is_file():
-            return (False, "", "nltk_syllables_frequencies.json is not a file")
+@lru_cache(maxsize=128)
+def _probe_corpus_files_cached(path: Path, mtime_ns: int) -> tuple[bool, str, str]:
+    """Cache :func:`_probe_corpus_files` per directory and modification time."""
+    return _probe_corpus_files(path)
 
-        return (True, "NLTK", "Valid NLTK corpus")
 
-    # Check for Pyphen corpus
-    pyphen_syllables = path / "pyphen_syllables_unique.txt"
-    pyphen_frequencies = path / "pyphen_syllables_frequencies.json"
+def _probe_corpus_files(path: Path) -> tuple[bool, str, str]:
+    """
+    Check an existing directory for NLTK or Pyphen corpus files.
+
+    Args:
+        path: Directory path to check
 
-    if pyphen_syllables.exists() and pyphen_frequencies.exists():
-        # Validate both are files
-        if not pyphen_syllables.is_file():
-            return (False, "", "pyphen_syllables_unique.txt is not a file")
-        if not pyphen_frequencies.is_file():
-            return (False, "", "pyphen_syllables_frequencies.json is not a file")
+    Returns:
+        Tuple of (is_valid, corpus_type, message) as for validate_corpus_directory
+    """
+    # One directory read instead of an exists/is_file stat pair per file
+    try:
+        with os.scandir(path) as it:
+            entries = {
+                entry.name: entry
+                for entry in it
+                if entry.name in _CORPUS_FILE_NAMES
+                # Broken symlinks do not count as present, as with Path.exists()
+                and (not entry.is_symlink() or os.path.exists(entry.path))
+            }
+    except OSError:
+        return (False, "", "Directory does not exist")
 
-        return (True, "Pyphen", "Valid Pyphen corpus")
+    # Directories are named after their extractor (e.g. 20260110_115601_pyphen), so
+    # check that layout first; the stable sort keeps the rest as the fallback order
+    suffix = path.name.rpartition("_")[2].lower()
+    layouts = sorted(_CORPUS_LAYOUTS, key=lambda layout: layout[0].lower() != suffix)
+
+    for corpus_type, file_names in layouts:
+        if all(name in entries for name in file_names):
+            # Validate both are files
+            for name in file_names:
+                if not entries[name].is_file():
+                    return (False, "", f"{name} is not a file")
+
+            return (True, corpus_type, f"Valid {corpus_type} corpus")
 
     # No valid corpus found
     return (
@@ -96,10 +160,25 @@ def get_corpus_info(path: Path) -> str:
     if not is_valid:
         return f"Invalid: {error}"
 
-    # Extract directory name for display
-    dir_name = path.name
+    return format_corpus_info(path, corpus_type)
+
+
+def format_corpus_info(path: Path, corpus_type: str | None) -> str:
+    """
+    Format the corpus display string for an already validated directory.
 
-    return f"{corpus_type} ({dir_name})"
+    Args:
+        path: Path to corpus directory
+        corpus_type: Corpus type from validate_corpus_directory()
+
+    Returns:
+        Short description string for UI display
+
+    Examples:
+        >>> format_corpus_info(Path("/path/to/20260110_115601_nltk"), "NLTK")
+        "NLTK (20260110_115601_nltk)"
+    """
+    return f"{corpus_type} ({path.name})"
 
 
 def load_corpus_data(path: Path) -> tuple[list[str], dict[str, int]]:
@@ -179,9 +258,10 @@ def load_corpus_data(path: Path) -> tuple[list[str], dict[str, int]]:
     missing_freqs = [s for s in syllables if s not in frequencies]
     if missing_freqs:
         # This is a warning, not a fatal error - some syllables might be legitimately rare
-        print(
-            f"Warning: {len(missing_freqs)} syllables missing frequency data "
-            f"(out of {len(syllables)} total)"
+        logger.warning(
+            "%d syllables missing frequency data (out of %d total)",
+            len(missing_freqs),
+            len(syllables),
         )
 
     return syllables, frequencies
@@ -209,7 +289,8 @@ def load_annotated_data_from_sqlite(db_path: Path) -> list[dict]:
 
     Performance Notes:
         - Much faster than JSON loading (<100ms vs 1-2s)
-        - Memory-efficient (loads on-demand)
+        - Rows with identical flags share one ``features`` dict, so treat the
+          returned feature dicts as read-only
         - Can be called on main thread without freezing UI
 
     Examples:
@@ -224,52 +305,53 @@ def load_annotated_data_from_sqlite(db_path: Path) -> list[dict]:
     try:
         # Open database in read-only mode
         conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-
-        # Query all syllables with features, ordered by syllable for determinism
-        cursor.execute("""
-            SELECT
-                syllable, frequency,
-                starts_with_vowel, starts_with_cluster, starts_with_heavy_cluster,
-                contains_plosive, contains_fricative, contains_liquid, contains_nasal,
-                short_vowel, long_vowel,
-                ends_with_vowel, ends_with_nasal, ends_with_stop
-            FROM syllables
-            ORDER BY syllable
-            """)
-
-        # Convert rows to the expected dictionary format
+        try:
+            # Ordered by syllable for determinism
+            rows = conn.execute(_ANNOTATED_QUERY).fetchall()
+        finally:
+            conn.close()
+
+        # Rows share one features dict per distinct flag combination. A corpus has
+        # tens of thousands of syllables but only a few hundred combinations, and
+        # the per-row dict dominated resident memory for each loaded patch.
+        shared_features: dict[tuple[int, ...], dict[str, bool]] = {}
         data = []
-        for row in cursor.fetchall():
-            data.append(
-                {
-                    "syllable": row["syllable"],
-                    "frequency": row["frequency"],
-                    "features": {
-                        "starts_with_vowel": bool(row["starts_with_vowel"]),
-                        "starts_with_cluster": bool(row["starts_with_cluster"]),
-                        "starts_with_heavy_cluster": bool(row["starts_with_heavy_cluster"]),
-                        "contains_plosive": bool(row["contains_plosive"]),
-                        "contains_fricative": bool(row["contains_fricative"]),
-                        "contains_liquid": bool(row["contains_liquid"]),
-                        "contains_nasal": bool(row["contains_nasal"]),
-                        "short_vowel": bool(row["short_vowel"]),
-                        "long_vowel": bool(row["long_vowel"]),
-                        "ends_with_vowel": bool(row["ends_with_vowel"]),
-                        "ends_with_nasal": bool(row["ends_with_nasal"]),
-                        "ends_with_stop": bool(row["ends_with_stop"]),
-                    },
-                }
-            )
-
-        conn.close()
+        for row in rows:
+            flags = row[2:]
+            features = shared_features.get(flags)
+            if features is None:
+                features = dict(zip(FEATURE_COLUMNS, map(bool, flags)))
+                shared_features[flags] = features
+            data.append({"syllable": row[0], "frequency": row[1], "features": features})
+
         return data
 
     except sqlite3.Error as e:
         raise sqlite3.Error(f"Error reading SQLite database {db_path}: {e}") from e
 
 
+def syllables_from_annotated(data: list[dict]) -> tuple[list[str], dict[str, int]]:
+    """
+    Derive the quick-load syllable list and frequency map from annotated rows.
+
+    Lets a SQLite-backed corpus skip :func:`load_corpus_data`, since corpus.db
+    already carries every syllable with its frequency.
+
+    Args:
+        data: Annotated entries as returned by :func:`load_annotated_data`
+
+    Returns:
+        Tuple of (syllables, frequencies) in the same shape as load_corpus_data
+
+    Examples:
+        >>> syllables_from_annotated([{"syllable": "ka", "frequency": 3, "features": {}}])
+        (['ka'], {'ka': 3})
+    """
+    syllables = [entry["syllable"] for entry in data]
+    frequencies = {entry["syllable"]: entry["frequency"] for entry in data}
+    return syllables, frequencies
+
+
 def load_annotated_data(path: Path) -> tuple[list[dict], dict[str, str]]:
     """
     Load phonetic feature annotations from a validated corpus directory.
@@ -345,8 +427,6 @@ def load_annotated_data(path: Path) -> tuple[list[dict], dict[str, str]]:
     db_path = path / "data" / "corpus.db"
     if db_path.exists():
         try:
-            import time
-
             start_time = time.time()
             data = load_annotated_data_from_sqlite(db_path)
             load_time_ms = int((time.time() - start_time) * 1000)
@@ -359,7 +439,7 @@ def load_annotated_data(path: Path) -> tuple[list[dict], dict[str, str]]:
             return data, metadata
         except Exception as e:
             # If SQLite fails, fall back to JSON
-            print(f"Warning: SQLite loading failed ({e}), falling back to JSON")
+            logger.warning("SQLite loading failed (%s), falling back to JSON", e)
 
     # Fall back to JSON loading (backwards compatibility)
     # Determine which annotated file to load based on corpus type
@@ -388,10 +468,8 @@ def load_annotated_data(path: Path) -> tuple[list[dict], dict[str, str]]:
     # Load the JSON file
     # Note: This is a potentially slow operation (1-2 seconds for 15MB files)
     # The caller should run this in a background worker to avoid blocking the UI
-    print(f"Loading from JSON (slower): {annotated_file.name}")
+    logger.info("Loading from JSON (slower): %s", annotated_file.name)
     try:
-        import time
-
         start_time = time.time()
         with open(annotated_file, encoding="utf-8") as f:
             annotated_data = json.load(f)
@@ -62,7 +62,8 @@ class InventoryMetrics:
         length_mean: Mean syllable length
         length_median: Median syllable length
         length_std: Standard deviation of syllable lengths
-        length_distribution: Count of syllables at each length {length: count}
+        length_distribution: Count of syllables at each length {length: count},
+            in ascending length order so displays can iterate it directly
     """
 
     total_count: int
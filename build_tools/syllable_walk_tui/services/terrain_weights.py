@@ -50,6 +50,11 @@ class AxisWeights:
 
     weights: dict[str, float] = field(default_factory=dict)
 
+    # Snapshot reused by as_tuple() until the next set()
+    _snapshot: tuple[tuple[str, float], ...] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def get(self, feature: str, default: float = 0.0) -> float:
         """Get weight for a feature, returning default if not defined."""
         return self.weights.get(feature, default)
@@ -57,6 +62,7 @@ class AxisWeights:
     def set(self, feature: str, value: float) -> None:
         """Set weight for a feature."""
         self.weights[feature] = value
+        self._snapshot = None
 
     def items(self):
         """Iterate over (feature, weight) pairs."""
@@ -66,6 +72,16 @@ class AxisWeights:
         """Get ordered list of feature names."""
         return list(self.weights.keys())
 
+    def as_tuple(self) -> tuple[tuple[str, float], ...]:
+        """Get ordered (feature, weight) pairs as a hashable snapshot (cached until set())."""
+        if self._snapshot is None:
+            self._snapshot = tuple(self.weights.items())
+        return self._snapshot
+
+    def copy(self) -> AxisWeights:
+        """Get an independent copy whose edits do not affect this instance."""
+        return AxisWeights(dict(self.weights))
+
     def __len__(self) -> int:
         """Return number of weights."""
         return len(self.weights)
@@ -4,8 +4,9 @@ This module provides a web-based interface for browsing name selections and
 exploring syllable walks using the standard library's http.server module.
 
 The server handles:
-- Serving the HTML interface (/)
-- Serving CSS styles (/styles.css)
+- Serving the HTML interface (/), with the run list embedded
+- Serving CSS styles (/styles.<hash>.css, plus the unhashed /styles.css)
+- Serving JavaScript (/app.<hash>.js)
 - Listing available pipeline runs (/api/runs)
 - Loading selection data (/api/runs/{id}/selections/{name_class})
 - Generating syllable walks (/api/walk)
@@ -32,7 +33,18 @@ from build_tools.syllable_walk_web.run_discovery import (
     get_run_by_id,
     get_selection_data,
 )
-from build_tools.syllable_walk_web.web_assets import CSS_CONTENT, HTML_TEMPLATE
+from build_tools.syllable_walk_web.web_assets import (
+    CSS_ASSET,
+    CSS_PATH,
+    HTML_CACHE_CONTROL,
+    IMMUTABLE_CACHE_CONTROL,
+    JS_ASSET,
+    JS_PATH,
+    REVALIDATE_CACHE_CONTROL,
+    StaticAsset,
+    maybe_not_modified,
+    render_html,
+)
 
 
 class SimplifiedWalkerHandler(BaseHTTPRequestHandler):
@@ -45,26 +57,70 @@ class SimplifiedWalkerHandler(BaseHTTPRequestHandler):
         walker: SyllableWalker instance (lazily initialized)
         current_run: Currently active RunInfo
         verbose: Whether to print progress messages
+        disable_nagle_algorithm: Set TCP_NODELAY so a body written after
+            the header flush is not held back waiting for an ACK
     """
 
     walker: SyllableWalker | None = None
     current_run: RunInfo | None = None
     verbose: bool = True
+    disable_nagle_algorithm = True
 
     def log_message(self, format: str, *args: Any) -> None:
         """Suppress default request logging to keep console clean."""
         pass
 
     def _send_response(
-        self, content: str, content_type: str = "text/html", status: int = 200
+        self, content: str, content_type: str = "text/html; charset=utf-8", status: int = 200
     ) -> None:
         """Send HTTP response with specified content and headers."""
+        encoded = content.encode("utf-8")
         try:
             self.send_response(status)
             self.send_header("Content-Type", content_type)
-            self.send_header("Content-Length", str(len(content.encode("utf-8"))))
+            self.send_header("Content-Length", str(len(encoded)))
+            self.end_headers()
+            self.wfile.write(encoded)
+        except (BrokenPipeError, ConnectionResetError, ConnectionAbortedError):
+            pass
+
+    def _send_static(self, asset: StaticAsset, cache_control: str) -> None:
+        """Send a pre-encoded static asset without re-encoding per request.
+
+        The best precompressed variant is chosen from the request's
+        Accept-Encoding header; no compression happens per request. If the
+        client's cached copy is still valid (If-None-Match/If-Modified-Since),
+        a bodyless 304 Not Modified is sent instead.
+
+        Args:
+            asset: Static asset with precomputed encodings and ETag
+            cache_control: Value for the Cache-Control header
+        """
+        body, encoding = asset.pick_encoding(self.headers.get("Accept-Encoding"))
+        etag = asset.etag_for(encoding)
+        try:
+            if maybe_not_modified(self.headers, etag, asset.last_modified):
+                self.send_response(304)
+                self.send_header("Cache-Control", cache_control)
+                self.send_header("ETag", etag)
+                if asset.last_modified is not None:
+                    self.send_header("Last-Modified", asset.last_modified)
+                self.send_header("Vary", "Accept-Encoding")
+                self.end_headers()
+                return
+
+            self.send_response(200)
+            self.send_header("Content-Type", asset.content_type)
+            self.send_header("Content-Length", str(len(body)))
+            if encoding != "identity":
+                self.send_header("Content-Encoding", encoding)
+            self.send_header("Vary", "Accept-Encoding")
+            self.send_header("Cache-Control", cache_control)
+            self.send_header("ETag", etag)
+            if asset.last_modified is not None:
+                self.send_header("Last-Modified", asset.last_modified)
             self.end_headers()
-            self.wfile.write(content.encode("utf-8"))
+            self.wfile.write(body)
         except (BrokenPipeError, ConnectionResetError, ConnectionAbortedError):
             pass
 
@@ -91,18 +147,26 @@ class SimplifiedWalkerHandler(BaseHTTPRequestHandler):
         """Handle GET requests for HTML, CSS, and API endpoints.
 
         Routes:
-            /: Serve main HTML interface
-            /styles.css: Serve CSS stylesheet
+            /: Serve main HTML interface (with the run list embedded)
+            /styles.<hash>.css: Serve CSS stylesheet (immutable, content-hashed)
+            /styles.css: Serve CSS stylesheet (always revalidated)
+            /app.<hash>.js: Serve JavaScript (immutable, content-hashed)
             /api/runs: List all available pipeline runs
             /api/runs/{id}/selections/{name_class}: Get selection data
         """
         path, query = self._parse_path()
 
         if path == "/":
-            self._send_response(HTML_TEMPLATE, content_type="text/html")
+            self._handle_index()
+
+        elif path == CSS_PATH:
+            self._send_static(CSS_ASSET, IMMUTABLE_CACHE_CONTROL)
 
         elif path == "/styles.css":
-            self._send_response(CSS_CONTENT, content_type="text/css")
+            self._send_static(CSS_ASSET, REVALIDATE_CACHE_CONTROL)
+
+        elif path == JS_PATH:
+            self._send_static(JS_ASSET, IMMUTABLE_CACHE_CONTROL)
 
         elif path == "/api/runs":
             self._handle_list_runs()
@@ -140,19 +204,38 @@ class SimplifiedWalkerHandler(BaseHTTPRequestHandler):
             except (BrokenPipeError, ConnectionResetError, ConnectionAbortedError):
                 pass
 
+    def _runs_payload(self) -> dict[str, Any]:
+        """Build the /api/runs response body.
+
+        Returns:
+            Dict with all discovered runs and the currently selected run name
+        """
+        runs = discover_runs()
+        return {
+            "runs": [r.to_dict() for r in runs],
+            "current_run": (
+                SimplifiedWalkerHandler.current_run.path.name
+                if SimplifiedWalkerHandler.current_run
+                else None
+            ),
+        }
+
+    def _handle_index(self) -> None:
+        """Handle GET / - serve the HTML shell with the run list embedded.
+
+        If run discovery fails, the shell is served without embedded data and
+        the page falls back to requesting /api/runs itself.
+        """
+        try:
+            initial_runs = json.dumps(self._runs_payload())
+        except Exception:
+            initial_runs = "null"
+        self._send_static(render_html(initial_runs), HTML_CACHE_CONTROL)
+
     def _handle_list_runs(self) -> None:
         """Handle GET /api/runs - list all available pipeline runs."""
         try:
-            runs = discover_runs()
-            response = {
-                "runs": [r.to_dict() for r in runs],
-                "current_run": (
-                    SimplifiedWalkerHandler.current_run.path.name
-                    if SimplifiedWalkerHandler.current_run
-                    else None
-                ),
-            }
-            self._send_json_response(response)
+            self._send_json_response(self._runs_payload())
         except Exception as e:
             self._send_error_response(f"Error discovering runs: {e}", status=500)
 
@@ -1,22 +1,79 @@
 """Static web assets for the simplified syllable walker web interface.
 
-This module contains HTML and CSS templates embedded as Python strings for the
+This module contains HTML, CSS and JavaScript embedded as Python strings for the
 simplified web interface that focuses on selections browsing and basic walks.
 
 The embedded assets provide:
 - HTML_TEMPLATE: Single-page application with selections browser and walk generator
+- JS_CONTENT: Client-side logic for run selection, selections browsing and walks
 - CSS_CONTENT: Minimal stylesheet using system preferences for dark/light mode
+
+The CSS and JS never change while the process runs, so their UTF-8 encodings
+and ETags are computed once at import time (CSS_BYTES, JS_BYTES and the
+matching *_ETAG constants) and served directly by the request handler. The
+HTML shell embeds the current run list; render_html() fills it in and caches
+the result for the last payload, so repeated page loads reuse one rendering.
+
+Compressed variants are also built once per payload: gzip always, Brotli when
+the optional ``brotli`` package is installed. CSS_ASSET, JS_ASSET and the
+rendered shell bundle the variants so the handler can pick one per request
+without re-compressing.
+
+Every asset carries a strong ETag, and BUILD_TIME serves as Last-Modified for
+the import-time assets; maybe_not_modified() evaluates conditional request
+headers so the handler can answer repeat visits with an empty 304 response.
+
+All served payloads are minified once at import (rcssmin/rjsmin when
+installed, otherwise a conservative line-based minifier); HTML_TEMPLATE,
+JS_CONTENT and CSS_CONTENT keep the readable sources.
+
+The stylesheet and script are also served from content-hashed URLs (CSS_PATH,
+JS_PATH) that the HTML shell links to, so they can be cached as immutable; the
+shell itself is private to the browser and always revalidated
+(HTML_CACHE_CONTROL) since its run list can change.
 """
 
+from __future__ import annotations
+
+import gzip
+import hashlib
+import re
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+from email.message import Message
+from email.utils import formatdate, parsedate_to_datetime
+from functools import lru_cache
+
+# Optional Brotli support (gzip is always available)
+try:
+    import brotli  # type: ignore[import-not-found, import-untyped]
+
+    BROTLI_AVAILABLE = True
+except ImportError:
+    brotli = None  # type: ignore[assignment]
+    BROTLI_AVAILABLE = False
+
+# Optional minifiers (a conservative line-based fallback is used otherwise)
+try:
+    import rcssmin  # type: ignore[import-not-found, import-untyped]
+except ImportError:
+    rcssmin = None  # type: ignore[assignment]
+
+try:
+    import rjsmin  # type: ignore[import-not-found, import-untyped]
+except ImportError:
+    rjsmin = None  # type: ignore[assignment]
+
 # HTML template for the simplified web interface
 HTML_TEMPLATE = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
-    <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Syllable Walker</title>
-    <link rel="stylesheet" href="/styles.css">
+    <link rel="stylesheet" href="__CSS_PATH__">
+    <script type="module" src="__JS_PATH__"></script>
 </head>
 <body>
     <div class="container">
@@ -27,7 +84,7 @@ HTML_TEMPLATE = """
 
         <section class="run-selector">
             <label for="run-select">Pipeline Run:</label>
-            <select id="run-select" onchange="selectRun()">
+            <select id="run-select">
                 <option value="">Loading runs...</option>
             </select>
             <span id="run-info" class="run-info"></span>
@@ -60,7 +117,7 @@ HTML_TEMPLATE = """
                         <option value="ritual">Ritual (Extreme)</option>
                     </select>
                 </div>
-                <button id="walk-btn" onclick="generateWalk()" disabled>Generate Walk</button>
+                <button id="walk-btn" disabled>Generate Walk</button>
             </div>
             <div id="walk-result" class="walk-result">
                 <p class="placeholder">Select a run first</p>
@@ -68,286 +125,361 @@ HTML_TEMPLATE = """
         </section>
     </div>
 
-    <script>
-        // State
-        let runs = [];
-        let currentRun = null;
-        let currentSelections = {};
-        let activeTab = null;
-
-        // Load available runs on page load
-        async function loadRuns() {
-            try {
-                const response = await fetch('/api/runs');
-                const data = await response.json();
-                runs = data.runs;
-                currentRun = data.current_run;
-
-                const select = document.getElementById('run-select');
-                select.innerHTML = '';
-
-                if (runs.length === 0) {
-                    select.innerHTML = '<option value="">No runs found</option>';
-                    return;
-                }
-
-                runs.forEach(run => {
-                    const option = document.createElement('option');
-                    option.value = run.path;
-                    option.textContent = run.display_name;
-                    option.dataset.runId = run.path.split('/').pop();
-                    select.appendChild(option);
-                });
-
-                // Select first run by default
-                if (runs.length > 0) {
-                    select.value = runs[0].path;
-                    await selectRun();
-                }
-            } catch (error) {
-                console.error('Error loading runs:', error);
-                document.getElementById('run-select').innerHTML =
-                    '<option value="">Error loading runs</option>';
-            }
-        }
+    <script id="initial-runs" type="application/json">__INITIAL_RUNS__</script>
+</body>
+</html>
+"""
 
-        // Handle run selection
-        async function selectRun() {
-            const select = document.getElementById('run-select');
-            const selectedOption = select.selectedOptions[0];
-            if (!selectedOption || !selectedOption.dataset.runId) return;
+# JavaScript for the simplified web interface (served separately so it can be
+# cached independently of the HTML shell)
+JS_CONTENT = """
+// State
+let runs = [];
+let currentRun = null;
+let currentSelections = {};
+let activeTab = null;
+
+// Elements looked up once; module scripts run after the document is parsed
+const EL = Object.freeze({
+    initialRuns: document.getElementById('initial-runs'),
+    runSelect: document.getElementById('run-select'),
+    runInfo: document.getElementById('run-info'),
+    selectionTabs: document.getElementById('selection-tabs'),
+    selectionContent: document.getElementById('selection-content'),
+    selectionMeta: document.getElementById('selection-meta'),
+    walkBtn: document.getElementById('walk-btn'),
+    walkResult: document.getElementById('walk-result'),
+    startSyllable: document.getElementById('start-syllable'),
+    walkProfile: document.getElementById('walk-profile'),
+});
+
+// In-flight request controllers, so stale responses never reach the DOM
+let walkController = null;
+let tabController = null;
+
+// Abort the previous request held in a controller slot and start a new one
+function restartRequest(controller) {
+    if (controller) controller.abort();
+    return new AbortController();
+}
 
-            const runId = selectedOption.dataset.runId;
-            const runData = runs.find(r => r.path.endsWith(runId));
-            if (!runData) return;
+// Run deferred work once the browser has had a chance to paint the shell
+function afterPaint(callback) {
+    if ('requestIdleCallback' in window) {
+        requestIdleCallback(callback, {timeout: 200});
+    } else {
+        requestAnimationFrame(() => setTimeout(callback, 0));
+    }
+}
 
-            // Update run info
-            const infoEl = document.getElementById('run-info');
-            infoEl.textContent = `${runData.syllable_count.toLocaleString()} syllables`;
+// Load available runs on page load (embedded by the server; fetched as fallback)
+async function loadRuns() {
+    try {
+        const embedded = JSON.parse(EL.initialRuns.textContent);
+        const data = embedded || await (await fetch('/api/runs')).json();
+        runs = data.runs;
+        currentRun = data.current_run;
 
-            // Update selection tabs
-            updateSelectionTabs(runData);
+        const select = EL.runSelect;
+        select.innerHTML = '';
 
-            // Load walker for this run
-            await loadWalker(runId);
+        if (runs.length === 0) {
+            select.innerHTML = '<option value="">No runs found</option>';
+            return;
         }
 
-        // Update selection tabs based on available selections
-        function updateSelectionTabs(runData) {
-            const tabBar = document.getElementById('selection-tabs');
-            tabBar.innerHTML = '';
-            currentSelections = runData.selections;
-
-            const nameClasses = Object.keys(currentSelections);
-
-            if (nameClasses.length === 0) {
-                tabBar.innerHTML = '<span class="no-selections">No selections available</span>';
-                document.getElementById('selection-content').innerHTML =
-                    '<p class="placeholder">No selection files found for this run</p>';
-                document.getElementById('selection-meta').innerHTML = '';
-                return;
-            }
-
-            nameClasses.forEach((nameClass, index) => {
-                const tab = document.createElement('button');
-                tab.className = 'tab' + (index === 0 ? ' active' : '');
-                tab.textContent = formatNameClass(nameClass);
-                tab.onclick = () => selectTab(nameClass, runData.path.split('/').pop());
-                tabBar.appendChild(tab);
-            });
-
-            // Auto-select first tab
-            if (nameClasses.length > 0) {
-                selectTab(nameClasses[0], runData.path.split('/').pop());
-            }
+        runs.forEach(run => {
+            const option = document.createElement('option');
+            option.value = run.path;
+            option.textContent = run.display_name;
+            option.dataset.runId = run.path.split('/').pop();
+            select.appendChild(option);
+        });
+
+        // Select first run by default; its walker load waits until after first paint
+        if (runs.length > 0) {
+            select.value = runs[0].path;
+            afterPaint(selectRun);
         }
+    } catch (error) {
+        console.error('Error loading runs:', error);
+        EL.runSelect.innerHTML =
+            '<option value="">Error loading runs</option>';
+    }
+}
 
-        // Format name class for display
-        function formatNameClass(nameClass) {
-            return nameClass.split('_').map(w =>
-                w.charAt(0).toUpperCase() + w.slice(1)
-            ).join(' ');
-        }
+// Handle run selection
+async function selectRun() {
+    const select = EL.runSelect;
+    const selectedOption = select.selectedOptions[0];
+    if (!selectedOption || !selectedOption.dataset.runId) return;
+
+    const runId = selectedOption.dataset.runId;
+    const runData = runs.find(r => r.path.endsWith(runId));
+    if (!runData) return;
+
+    // Update run info
+    const infoEl = EL.runInfo;
+    infoEl.textContent = `${runData.syllable_count.toLocaleString()} syllables`;
+
+    // Update selection tabs
+    updateSelectionTabs(runData);
+
+    // Load walker for this run
+    await loadWalker(runId);
+}
+
+// Update selection tabs based on available selections
+function updateSelectionTabs(runData) {
+    const tabBar = EL.selectionTabs;
+    tabBar.innerHTML = '';
+    currentSelections = runData.selections;
+
+    const nameClasses = Object.keys(currentSelections);
+
+    if (nameClasses.length === 0) {
+        tabBar.innerHTML = '<span class="no-selections">No selections available</span>';
+        EL.selectionContent.innerHTML =
+            '<p class="placeholder">No selection files found for this run</p>';
+        EL.selectionMeta.innerHTML = '';
+        return;
+    }
+
+    nameClasses.forEach((nameClass, index) => {
+        const tab = document.createElement('button');
+        tab.className = 'tab' + (index === 0 ? ' active' : '');
+        tab.textContent = formatNameClass(nameClass);
+        tab.dataset.nameClass = nameClass;
+        tab.dataset.runId = runData.path.split('/').pop();
+        tabBar.appendChild(tab);
+    });
+
+    // Auto-select first tab
+    if (nameClasses.length > 0) {
+        selectTab(nameClasses[0], runData.path.split('/').pop());
+    }
+}
+
+// Format name class for display
+function formatNameClass(nameClass) {
+    return nameClass.split('_').map(w =>
+        w.charAt(0).toUpperCase() + w.slice(1)
+    ).join(' ');
+}
+
+// Handle tab selection
+async function selectTab(nameClass, runId) {
+    activeTab = nameClass;
 
-        // Handle tab selection
-        async function selectTab(nameClass, runId) {
-            activeTab = nameClass;
-
-            // Update tab styling
-            document.querySelectorAll('.tab').forEach(tab => {
-                tab.classList.remove('active');
-                if (tab.textContent === formatNameClass(nameClass)) {
-                    tab.classList.add('active');
-                }
-            });
-
-            // Load selection data
-            const contentEl = document.getElementById('selection-content');
-            const metaEl = document.getElementById('selection-meta');
-            contentEl.innerHTML = '<p class="loading">Loading...</p>';
-            metaEl.innerHTML = '';
-
-            try {
-                const response = await fetch(`/api/runs/${runId}/selections/${nameClass}`);
-                const data = await response.json();
-
-                if (data.error) {
-                    contentEl.innerHTML = `<p class="error">${data.error}</p>`;
-                    return;
-                }
-
-                // Render selections table
-                renderSelections(data);
-
-                // Render metadata
-                renderSelectionMeta(data.metadata);
-
-            } catch (error) {
-                contentEl.innerHTML = `<p class="error">Error: ${error.message}</p>`;
-            }
+    // Update tab styling
+    document.querySelectorAll('.tab').forEach(tab => {
+        tab.classList.remove('active');
+        if (tab.textContent === formatNameClass(nameClass)) {
+            tab.classList.add('active');
         }
+    });
+
+    // Load selection data
+    const contentEl = EL.selectionContent;
+    const metaEl = EL.selectionMeta;
+    contentEl.innerHTML = '<p class="loading">Loading...</p>';
+    metaEl.innerHTML = '';
+
+    tabController = restartRequest(tabController);
+    const {signal} = tabController;
+
+    try {
+        const response = await fetch(`/api/runs/${runId}/selections/${nameClass}`, {signal});
+        const data = await response.json();
 
-        // Render selections as a table
-        function renderSelections(data) {
-            const contentEl = document.getElementById('selection-content');
-            const selections = data.selections || [];
-
-            if (selections.length === 0) {
-                contentEl.innerHTML = '<p class="placeholder">No names in this selection</p>';
-                return;
-            }
-
-            let html = `
-                <table class="selections-table">
-                    <thead>
-                        <tr>
-                            <th>#</th>
-                            <th>Name</th>
-                            <th>Score</th>
-                            <th>Syllables</th>
-                        </tr>
-                    </thead>
-                    <tbody>
-            `;
-
-            selections.forEach((sel, idx) => {
-                const syllables = sel.syllables ? sel.syllables.join(' + ') : '-';
-                html += `
-                    <tr>
-                        <td class="rank">${idx + 1}</td>
-                        <td class="name">${sel.name}</td>
-                        <td class="score">${sel.score}</td>
-                        <td class="syllables">${syllables}</td>
-                    </tr>
-                `;
-            });
-
-            html += '</tbody></table>';
-            contentEl.innerHTML = html;
+        if (data.error) {
+            contentEl.innerHTML = `<p class="error">${data.error}</p>`;
+            return;
         }
 
-        // Render selection metadata
-        function renderSelectionMeta(meta) {
-            const metaEl = document.getElementById('selection-meta');
+        // Render selections table
+        renderSelections(data);
 
-            if (!meta) {
-                metaEl.innerHTML = '';
-                return;
-            }
+        // Render metadata
+        renderSelectionMeta(data.metadata);
 
-            const admitted = meta.admitted || 0;
-            const rejected = meta.rejected || 0;
-            const total = meta.total_evaluated || (admitted + rejected);
+    } catch (error) {
+        if (error.name === 'AbortError') return;
+        contentEl.innerHTML = `<p class="error">Error: ${error.message}</p>`;
+    }
+}
 
-            let html = `<span>${admitted} admitted / ${rejected} rejected (${total} evaluated)</span>`;
+// Render selections as a table
+function renderSelections(data) {
+    const contentEl = EL.selectionContent;
+    const selections = data.selections || [];
 
-            // Show rejection reasons if any
-            if (meta.rejection_reasons && Object.keys(meta.rejection_reasons).length > 0) {
-                const reasons = Object.entries(meta.rejection_reasons)
-                    .map(([reason, count]) => `${reason}: ${count}`)
-                    .join(', ');
-                html += `<span class="rejection-reasons">Rejections: ${reasons}</span>`;
-            }
+    if (selections.length === 0) {
+        contentEl.innerHTML = '<p class="placeholder">No names in this selection</p>';
+        return;
+    }
 
-            metaEl.innerHTML = html;
-        }
+    // Collect row fragments and join once instead of growing a string
+    const parts = [`
+        <table class="selections-table">
+            <thead>
+                <tr>
+                    <th>#</th>
+                    <th>Name</th>
+                    <th>Score</th>
+                    <th>Syllables</th>
+                </tr>
+            </thead>
+            <tbody>
+    `];
+
+    selections.forEach((sel, idx) => {
+        const syllables = sel.syllables ? sel.syllables.join(' + ') : '-';
+        parts.push(`
+            <tr>
+                <td class="rank">${idx + 1}</td>
+                <td class="name">${sel.name}</td>
+                <td class="score">${sel.score}</td>
+                <td class="syllables">${syllables}</td>
+            </tr>
+        `);
+    });
+
+    parts.push('</tbody></table>');
+    contentEl.innerHTML = parts.join('');
+}
 
-        // Load walker for the selected run
-        async function loadWalker(runId) {
-            const walkBtn = document.getElementById('walk-btn');
-            const resultEl = document.getElementById('walk-result');
+// Render selection metadata
+function renderSelectionMeta(meta) {
+    const metaEl = EL.selectionMeta;
 
-            walkBtn.disabled = true;
-            resultEl.innerHTML = '<p class="loading">Loading syllables...</p>';
+    if (!meta) {
+        metaEl.innerHTML = '';
+        return;
+    }
+
+    const admitted = meta.admitted || 0;
+    const rejected = meta.rejected || 0;
+    const total = meta.total_evaluated || (admitted + rejected);
 
-            try {
-                const response = await fetch('/api/select-run', {
-                    method: 'POST',
-                    headers: {'Content-Type': 'application/json'},
-                    body: JSON.stringify({run_id: runId})
-                });
+    let html = `<span>${admitted} admitted / ${rejected} rejected (${total} evaluated)</span>`;
 
-                const data = await response.json();
+    // Show rejection reasons if any
+    if (meta.rejection_reasons && Object.keys(meta.rejection_reasons).length > 0) {
+        const reasons = Object.entries(meta.rejection_reasons)
+            .map(([reason, count]) => `${reason}: ${count}`)
+            .join(', ');
+        html += `<span class="rejection-reasons">Rejections: ${reasons}</span>`;
+    }
+
+    metaEl.innerHTML = html;
+}
 
-                if (data.error) {
-                    resultEl.innerHTML = `<p class="error">${data.error}</p>`;
-                    return;
-                }
+// Load walker for the selected run
+async function loadWalker(runId) {
+    const walkBtn = EL.walkBtn;
+    const resultEl = EL.walkResult;
 
-                walkBtn.disabled = false;
-                resultEl.innerHTML = `<p class="ready">Ready (${data.syllable_count.toLocaleString()} syllables from ${data.source})</p>`;
+    // A walk from the previous run must not overwrite this run's status
+    if (walkController) walkController.abort();
 
-            } catch (error) {
-                resultEl.innerHTML = `<p class="error">Error: ${error.message}</p>`;
-            }
+    walkBtn.disabled = true;
+    resultEl.innerHTML = '<p class="loading">Loading syllables...</p>';
+
+    try {
+        const response = await fetch('/api/select-run', {
+            method: 'POST',
+            headers: {'Content-Type': 'application/json'},
+            body: JSON.stringify({run_id: runId})
+        });
+
+        const data = await response.json();
+
+        if (data.error) {
+            resultEl.innerHTML = `<p class="error">${data.error}</p>`;
+            return;
         }
 
-        // Generate a walk
-        async function generateWalk() {
-            const walkBtn = document.getElementById('walk-btn');
-            const resultEl = document.getElementById('walk-result');
-            const startInput = document.getElementById('start-syllable');
-            const profileSelect = document.getElementById('walk-profile');
-
-            walkBtn.disabled = true;
-            resultEl.innerHTML = '<p class="loading">Generating walk...</p>';
-
-            try {
-                const response = await fetch('/api/walk', {
-                    method: 'POST',
-                    headers: {'Content-Type': 'application/json'},
-                    body: JSON.stringify({
-                        start: startInput.value || null,
-                        profile: profileSelect.value,
-                        steps: 5
-                    })
-                });
-
-                const data = await response.json();
-
-                if (data.error) {
-                    resultEl.innerHTML = `<p class="error">${data.error}</p>`;
-                    walkBtn.disabled = false;
-                    return;
-                }
-
-                // Render walk
-                const path = data.walk.map(s => s.syllable).join(' &rarr; ');
-                resultEl.innerHTML = `<div class="walk-path">${path}</div>`;
-
-                walkBtn.disabled = false;
-
-            } catch (error) {
-                resultEl.innerHTML = `<p class="error">Error: ${error.message}</p>`;
-                walkBtn.disabled = false;
-            }
+        walkBtn.disabled = false;
+        resultEl.innerHTML = `<p class="ready">Ready (${data.syllable_count.toLocaleString()} syllables from ${data.source})</p>`;
+
+    } catch (error) {
+        resultEl.innerHTML = `<p class="error">Error: ${error.message}</p>`;
+    }
+}
+
+// Generate a walk
+async function generateWalk() {
+    const walkBtn = EL.walkBtn;
+    const resultEl = EL.walkResult;
+    const startInput = EL.startSyllable;
+    const profileSelect = EL.walkProfile;
+
+    walkController = restartRequest(walkController);
+    const {signal} = walkController;
+
+    walkBtn.disabled = true;
+    resultEl.innerHTML = '<p class="loading">Generating walk...</p>';
+
+    try {
+        const response = await fetch('/api/walk', {
+            method: 'POST',
+            headers: {'Content-Type': 'application/json'},
+            body: JSON.stringify({
+                start: startInput.value || null,
+                profile: profileSelect.value,
+                steps: 5
+            }),
+            signal
+        });
+
+        const data = await response.json();
+
+        if (data.error) {
+            resultEl.innerHTML = `<p class="error">${data.error}</p>`;
+            walkBtn.disabled = false;
+            return;
         }
 
-        // Initialize on page load
-        loadRuns();
-    </script>
-</body>
-</html>
+        // Render walk as text nodes so syllables are never parsed as HTML
+        const frag = document.createDocumentFragment();
+        const pathEl = document.createElement('div');
+        pathEl.className = 'walk-path';
+        data.walk.forEach(step => {
+            const syl = document.createElement('span');
+            syl.className = 'walk-syl';
+            syl.textContent = step.syllable;
+            pathEl.append(syl);
+        });
+        frag.append(pathEl);
+        resultEl.replaceChildren(frag);
+
+        walkBtn.disabled = false;
+
+    } catch (error) {
+        if (error.name === 'AbortError') return;
+        resultEl.innerHTML = `<p class="error">Error: ${error.message}</p>`;
+        walkBtn.disabled = false;
+    }
+}
+
+// Coalesce rapid run changes (e.g. arrowing through the list) into one load
+let runChangeTimer = null;
+function onRunChange() {
+    clearTimeout(runChangeTimer);
+    runChangeTimer = setTimeout(selectRun, 150);
+}
+
+// Wire up controls; tab clicks are delegated to the tab bar
+EL.runSelect.addEventListener('change', onRunChange);
+EL.walkBtn.addEventListener('click', generateWalk);
+EL.selectionTabs.addEventListener('click', event => {
+    const tab = event.target.closest('.tab');
+    if (tab) selectTab(tab.dataset.nameClass, tab.dataset.runId);
+});
+
+// Initialize on page load
+loadRuns();
 """
 
 # CSS stylesheet for the simplified web interface
@@ -617,6 +749,13 @@ section h2 {
     line-height: 1.8;
 }
 
+/* Arrow separators between walk syllables are drawn by CSS, not the script */
+.walk-path span + span::before {
+    content: "→";
+    margin: 0 0.4em;
+    color: var(--text-secondary);
+}
+
 /* Utility classes */
 .placeholder {
     color: var(--text-secondary);
@@ -657,3 +796,318 @@ section h2 {
     }
 }
 """
+
+
+_CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+_HTML_COMMENT_RE = re.compile(r"<!--.*?-->", re.DOTALL)
+
+
+def _strip_lines(text: str, comment_prefix: str | None = None) -> str:
+    """Strip indentation and drop blank lines, keeping line breaks.
+
+    Line breaks are preserved so statement boundaries (JavaScript automatic
+    semicolon insertion) and token separation are never changed.
+
+    Args:
+        text: Source text to minify
+        comment_prefix: If given, whole lines starting with this prefix
+            (after stripping) are dropped as comments
+
+    Returns:
+        Text with one non-empty, unindented line per source line
+    """
+    lines = []
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or (comment_prefix and line.startswith(comment_prefix)):
+            continue
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def minify_css(css: str) -> str:
+    """Minify a stylesheet, using rcssmin when it is installed.
+
+    Args:
+        css: Stylesheet source
+
+    Returns:
+        Minified stylesheet
+    """
+    if rcssmin is not None:
+        return str(rcssmin.cssmin(css))
+    return _strip_lines(_CSS_COMMENT_RE.sub("", css))
+
+
+def minify_js(js: str) -> str:
+    """Minify a script, using rjsmin when it is installed.
+
+    Args:
+        js: JavaScript source
+
+    Returns:
+        Minified script
+    """
+    if rjsmin is not None:
+        return str(rjsmin.jsmin(js))
+    return _strip_lines(js, comment_prefix="//")
+
+
+def minify_html(html: str) -> str:
+    """Minify an HTML document by removing comments and indentation.
+
+    Args:
+        html: HTML source (must not contain whitespace-sensitive elements
+            such as <pre> or <textarea>)
+
+    Returns:
+        Minified HTML
+    """
+    return _strip_lines(_HTML_COMMENT_RE.sub("", html))
+
+
+def _make_etag(payload: bytes) -> str:
+    """Return a strong, quoted ETag derived from the payload bytes."""
+    return '"' + hashlib.sha1(payload, usedforsecurity=False).hexdigest() + '"'
+
+
+# Last-Modified for every asset: they are fixed from the moment of import
+BUILD_TIMESTAMP = int(time.time())
+BUILD_TIME = formatdate(BUILD_TIMESTAMP, usegmt=True)
+
+# Cache-Control policies. Hashed URLs never change content, so browsers and
+# shared caches (proxies, CDNs) may keep them for a year. The shell embeds
+# this server's live run list, so shared caches must not store it and
+# browsers revalidate it by ETag on every load. Every static response also
+# sends "Vary: Accept-Encoding" so caches keep compressed variants apart.
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+HTML_CACHE_CONTROL = "private, no-cache"
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+# Minified, pre-encoded payloads and validators (computed once at import)
+CSS_BYTES = minify_css(CSS_CONTENT).encode("utf-8")
+CSS_ETAG = _make_etag(CSS_BYTES)
+
+JS_BYTES = minify_js(JS_CONTENT).encode("utf-8")
+JS_ETAG = _make_etag(JS_BYTES)
+
+# Content-hashed asset URLs linked from the HTML shell
+CSS_PATH = f"/styles.{CSS_ETAG[1:9]}.css"
+JS_PATH = f"/app.{JS_ETAG[1:9]}.js"
+
+# Minified shell; __INITIAL_RUNS__ is filled in per run list by render_html()
+HTML_CONTENT = minify_html(
+    HTML_TEMPLATE.replace("__CSS_PATH__", CSS_PATH).replace("__JS_PATH__", JS_PATH)
+)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison).
+
+    Args:
+        if_none_match: Raw If-None-Match header value
+        etag: Current strong, quoted ETag of the representation
+
+    Returns:
+        True if the header lists the ETag (or is "*")
+    """
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def maybe_not_modified(
+    request_headers: Mapping[str, str] | Message,
+    etag: str,
+    last_modified: str | None = BUILD_TIME,
+) -> bool:
+    """Decide whether a GET can be answered with 304 Not Modified.
+
+    If-None-Match takes precedence over If-Modified-Since, as required by
+    RFC 9110. Malformed If-Modified-Since dates are ignored, as is the header
+    altogether for representations without a Last-Modified date.
+
+    Args:
+        request_headers: Request headers (a mapping or the handler's message)
+        etag: Strong, quoted ETag of the representation being served
+        last_modified: HTTP-date of the representation's last change, or None
+
+    Returns:
+        True if the client's cached copy is still valid
+    """
+    if_none_match = request_headers.get("If-None-Match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, etag)
+
+    if_modified_since = request_headers.get("If-Modified-Since")
+    if if_modified_since is None or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError, IndexError):
+        return False
+    if since.tzinfo is None:
+        return False
+    return parsedate_to_datetime(last_modified) <= since
+
+
+def _accepted_encodings(accept_encoding: str | None) -> tuple[set[str], set[str]]:
+    """Parse an Accept-Encoding header into accepted and refused codings.
+
+    Codings listed with ``q=0`` are treated as explicitly refused, so a
+    ``*`` wildcard must not stand in for them.
+
+    Args:
+        accept_encoding: Raw header value, or None if the header was absent
+
+    Returns:
+        Tuple of (accepted, refused) sets of lower-cased coding names
+    """
+    accepted: set[str] = set()
+    refused: set[str] = set()
+    if not accept_encoding:
+        return accepted, refused
+
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if quality > 0:
+            accepted.add(coding)
+        else:
+            refused.add(coding)
+    return accepted, refused
+
+
+@dataclass(frozen=True)
+class StaticAsset:
+    """A static asset with all of its encodings precomputed.
+
+    Attributes:
+        content_type: Value for the Content-Type header
+        body: Uncompressed payload bytes
+        etag: Strong ETag of the uncompressed payload
+        gzip_body: Gzip-compressed payload, or None if not smaller than body
+        br_body: Brotli-compressed payload, or None if unavailable/not smaller
+        last_modified: HTTP-date for the Last-Modified header, or None for
+            generated content that is validated by ETag only
+    """
+
+    content_type: str
+    body: bytes
+    etag: str
+    gzip_body: bytes | None = None
+    br_body: bytes | None = None
+    last_modified: str | None = BUILD_TIME
+
+    @classmethod
+    def from_bytes(
+        cls, body: bytes, content_type: str, last_modified: str | None = BUILD_TIME
+    ) -> StaticAsset:
+        """Build an asset, compressing the payload once up front.
+
+        Args:
+            body: Uncompressed payload bytes
+            content_type: Value for the Content-Type header
+            last_modified: HTTP-date for Last-Modified, or None to omit it
+
+        Returns:
+            StaticAsset with gzip (and Brotli, if installed) variants
+        """
+        # mtime=0 keeps the gzip output deterministic across restarts
+        compressed = gzip.compress(body, compresslevel=9, mtime=0)
+        gzip_body = compressed if len(compressed) < len(body) else None
+
+        br_body: bytes | None = None
+        if brotli is not None:
+            compressed = brotli.compress(body, quality=11)
+            br_body = compressed if len(compressed) < len(body) else None
+
+        return cls(
+            content_type=content_type,
+            body=body,
+            etag=_make_etag(body),
+            gzip_body=gzip_body,
+            br_body=br_body,
+            last_modified=last_modified,
+        )
+
+    def pick_encoding(self, accept_encoding: str | None) -> tuple[bytes, str]:
+        """Select the smallest variant the client accepts.
+
+        Args:
+            accept_encoding: Raw Accept-Encoding request header, or None
+
+        Returns:
+            Tuple of (payload bytes, content coding), where the coding is
+            "br", "gzip", or "identity"
+        """
+        accepted, refused = _accepted_encodings(accept_encoding)
+        if self.br_body is not None and "br" in accepted:
+            return self.br_body, "br"
+        if self.gzip_body is not None and (
+            "gzip" in accepted or ("*" in accepted and "gzip" not in refused)
+        ):
+            return self.gzip_body, "gzip"
+        return self.body, "identity"
+
+    def etag_for(self, encoding: str) -> str:
+        """Return the ETag for one encoded variant.
+
+        Each content coding is a distinct representation, so compressed
+        variants get a suffixed ETag derived from the base one.
+
+        Args:
+            encoding: Content coding returned by pick_encoding()
+
+        Returns:
+            Strong, quoted ETag for that variant
+        """
+        if encoding == "identity":
+            return self.etag
+        return f'{self.etag[:-1]}-{encoding}"'
+
+
+# Precompressed assets served by the request handler
+CSS_ASSET = StaticAsset.from_bytes(CSS_BYTES, "text/css; charset=utf-8")
+JS_ASSET = StaticAsset.from_bytes(JS_BYTES, "application/javascript; charset=utf-8")
+
+
+@lru_cache(maxsize=1)
+def render_html(initial_runs_json: str = "null") -> StaticAsset:
+    """Render the HTML shell with the run list embedded.
+
+    Embedding the /api/runs payload saves the page a round trip on load.
+    The last rendering is cached, so page loads with an unchanged run list
+    reuse the same bytes, compressed variants, and ETag. The rendered shell
+    has no Last-Modified date and is validated by ETag only.
+
+    Args:
+        initial_runs_json: JSON-encoded /api/runs payload, or "null" to make
+            the page fetch /api/runs itself
+
+    Returns:
+        StaticAsset for the rendered shell
+    """
+    # "<" only occurs inside JSON strings, where \u003c is equivalent; this
+    # keeps "</script>" in run names from terminating the embedding element
+    safe_json = initial_runs_json.replace("<", "\\u003c")
+    html = HTML_CONTENT.replace("__INITIAL_RUNS__", safe_json)
+    return StaticAsset.from_bytes(
+        html.encode("utf-8"), "text/html; charset=utf-8", last_modified=None
+    )
@@ -189,11 +189,9 @@ class DirectoryBrowserScreen(ModalScreen[Path | None]):
     # -------------------------------------------------------------------------
     # Modal styling
     # -------------------------------------------------------------------------
-    CSS = """
-    DirectoryBrowserScreen {
-        align: center middle;
-    }
-
+    # Layout rules shared with subclasses. Type selectors only match the exact
+    # screen class, so each subclass prepends its own root rule to these.
+    BROWSER_CSS = """
     #browser-container {
         width: 80;
         height: 30;
@@ -255,6 +253,12 @@ class DirectoryBrowserScreen(ModalScreen[Path | None]):
     }
     """
 
+    CSS = """
+    DirectoryBrowserScreen {
+        align: center middle;
+    }
+    """ + BROWSER_CSS
+
     def __init__(
         self,
         title: str = "Select Directory",
@@ -172,6 +172,8 @@ class SeedInput(Static):
             self.value = value
         # User input defaults to -1 (random mode)
         self.user_input = -1
+        # Seed value label, kept from compose for per-keystroke updates
+        self._seed_display: Label | None = None
 
     def compose(self) -> ComposeResult:
         """
@@ -189,7 +191,8 @@ class SeedInput(Static):
             id="seed-input",
         )
         yield Label("->", classes="arrow")
-        yield Label(f"{self.value}", classes="seed-used-value", id="seed-used")
+        self._seed_display = Label(f"{self.value}", classes="seed-used-value", id="seed-used")
+        yield self._seed_display
 
     def action_random(self) -> None:
         """
@@ -254,12 +257,10 @@ class SeedInput(Static):
         Update the 'Using:' display with actual seed value.
 
         Called after seed changes to sync the UI.
+        Does nothing if the label has not been composed yet.
         """
-        try:
-            display = self.query_one("#seed-used", Label)
-            display.update(f"{self.value}")
-        except Exception:  # nosec B110 - Safe widget query failure
-            pass
+        if self._seed_display is not None:
+            self._seed_display.update(f"{self.value}")
 
 
 class RadioOption(Static):
@@ -296,6 +297,10 @@ class RadioOption(Static):
         by calling :meth:`set_selected` on each.
     """
 
+    # Focusable for keyboard navigation; declared on the class so the focus
+    # chain includes every option from construction, with no mount handler
+    can_focus = True
+
     # -------------------------------------------------------------------------
     # Widget-level bindings for selection
     # -------------------------------------------------------------------------
@@ -383,14 +388,6 @@ class RadioOption(Static):
         self.description = description
         self.is_selected = is_selected
 
-    def on_mount(self) -> None:
-        """
-        Configure widget after mounting.
-
-        Makes the widget focusable for keyboard navigation.
-        """
-        self.can_focus = True
-
     def render(self):
         """
         Render the option as text with Rich markup.
@@ -78,6 +78,10 @@ class FloatSlider(Static):
         - ``.slider-suffix``: Suffix text (auto width, muted color)
     """
 
+    # Focusable for keyboard navigation; focus state highlights the value
+    # display. Declared on the class so no mount handler is needed
+    can_focus = True
+
     # -------------------------------------------------------------------------
     # Widget-level bindings for parameter adjustment
     # These don't interfere with app-level bindings (q, a, v, etc.)
@@ -183,6 +187,10 @@ class FloatSlider(Static):
         self.step = step
         self.precision = precision
         self.suffix = suffix or ""
+        # Value display format, e.g. "[{:.1f}]" for precision 1
+        self._value_format = f"[{{:.{precision}f}}]"
+        # Value label, kept from compose for per-keystroke updates
+        self._value_display: Label | None = None
 
     def compose(self) -> ComposeResult:
         """
@@ -195,23 +203,14 @@ class FloatSlider(Static):
         """
         yield Label(f"{self.label_text}:", classes="slider-label")
         # Format value with specified precision in brackets
-        format_str = f"[{{:.{self.precision}f}}]"
-        yield Label(
-            format_str.format(self.value),
+        self._value_display = Label(
+            self._value_format.format(self.value),
             classes="slider-value",
             id="value-display",
         )
+        yield self._value_display
         yield Label(self.suffix, classes="slider-suffix")
 
-    def on_mount(self) -> None:
-        """
-        Configure widget after mounting.
-
-        Makes the widget focusable for keyboard navigation.
-        Focus state is used to highlight the value display.
-        """
-        self.can_focus = True
-
     def action_increment(self) -> None:
         """
         Increment value by step, clamped to max.
@@ -257,11 +256,7 @@ class FloatSlider(Static):
         Update the displayed value label.
 
         Called after value changes to sync the UI.
-        Silently handles cases where widget isn't mounted yet.
+        Does nothing if the label has not been composed yet.
         """
-        try:
-            display = self.query_one("#value-display", Label)
-            format_str = f"[{{:.{self.precision}f}}]"
-            display.update(format_str.format(self.value))
-        except Exception:  # nosec B110 - Widget may not be mounted yet
-            pass
+        if self._value_display is not None:
+            self._value_display.update(self._value_format.format(self.value))
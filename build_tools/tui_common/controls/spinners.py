@@ -86,6 +86,10 @@ class IntSpinner(Static):
         - ``.spinner-suffix``: Suffix text (auto width, muted color)
     """
 
+    # Focusable for keyboard navigation; focus state highlights the value
+    # display. Declared on the class so no mount handler is needed
+    can_focus = True
+
     # -------------------------------------------------------------------------
     # Widget-level bindings for parameter adjustment
     # These don't interfere with app-level bindings (q, a, v, etc.)
@@ -190,6 +194,9 @@ class IntSpinner(Static):
         self.max_val = max_val
         self.step = step
         self.suffix_fn = suffix_fn
+        # Value and suffix labels, kept from compose for per-keystroke updates
+        self._value_display: Label | None = None
+        self._suffix_display: Label | None = None
 
     def compose(self) -> ComposeResult:
         """
@@ -201,19 +208,14 @@ class IntSpinner(Static):
             Label widgets for label, value display, and optional suffix
         """
         yield Label(f"{self.label_text}:", classes="spinner-label")
-        yield Label(f"[{self.value:2d}]", classes="spinner-value", id="value-display")
+        self._value_display = Label(
+            f"[{self.value:2d}]", classes="spinner-value", id="value-display"
+        )
+        yield self._value_display
         # Generate initial suffix if function provided
         suffix_text = self.suffix_fn(self.value) if self.suffix_fn else ""
-        yield Label(suffix_text, classes="spinner-suffix", id="suffix-display")
-
-    def on_mount(self) -> None:
-        """
-        Configure widget after mounting.
-
-        Makes the widget focusable for keyboard navigation.
-        Focus state is used to highlight the value display.
-        """
-        self.can_focus = True
+        self._suffix_display = Label(suffix_text, classes="spinner-suffix", id="suffix-display")
+        yield self._suffix_display
 
     def action_increment(self) -> None:
         """
@@ -262,15 +264,11 @@ class IntSpinner(Static):
         Update the displayed value and suffix labels.
 
         Called after value changes to sync the UI.
-        Silently handles cases where widget isn't mounted yet.
+        Does nothing if the labels have not been composed yet.
         """
-        try:
-            # Update value display
-            display = self.query_one("#value-display", Label)
-            display.update(f"[{self.value:2d}]")
-            # Update suffix if function provided
-            if self.suffix_fn:
-                suffix = self.query_one("#suffix-display", Label)
-                suffix.update(self.suffix_fn(self.value))
-        except Exception:  # nosec B110 - Widget may not be mounted yet
-            pass
+        if self._value_display is None or self._suffix_display is None:
+            return
+        self._value_display.update(f"[{self.value:2d}]")
+        # Update suffix if function provided
+        if self.suffix_fn:
+            self._suffix_display.update(self.suffix_fn(self.value))
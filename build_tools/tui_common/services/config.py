@@ -52,6 +52,7 @@ By default, configuration is loaded from:
 
 from __future__ import annotations
 
+import logging
 import sys
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -74,6 +75,8 @@ else:
         TOMLI_AVAILABLE = False
         tomli = None  # type: ignore
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class KeybindingConfig:
@@ -305,7 +308,7 @@ def load_config_file(config_path: Path | None = None) -> dict[str, Any] | None:
         with open(config_path, "rb") as f:
             return tomli.load(f)
     except Exception as e:
-        print(f"Warning: Failed to load config from {config_path}: {e}")
+        logger.warning("Failed to load config from %s: %s", config_path, e)
         return None
 
 
@@ -383,8 +386,9 @@ def load_keybindings(config_path: Path | None = None) -> KeybindingConfig:
     # Check for conflicts and warn user
     conflicts = detect_conflicts(config)
     if conflicts:
-        print("Warning: Keybinding conflicts detected:")
-        for conflict in conflicts:
-            print(f"  - {conflict}")
+        logger.warning(
+            "Keybinding conflicts detected:\n%s",
+            "\n".join(f"  - {conflict}" for conflict in conflicts),
+        )
 
     return config
@@ -182,6 +182,19 @@ class TestPipelineTuiAppTabSwitching:
             tabbed = app.query_one(TabbedContent)
             assert tabbed.active == "history"
 
+    @pytest.mark.asyncio
+    async def test_tab_container_cached_on_mount(self) -> None:
+        """Test tab switching reuses the container found on mount."""
+        app = PipelineTuiApp()
+
+        async with app.run_test():
+            assert app._tabs is app.query_one(TabbedContent)
+            with patch.object(app, "query_one", side_effect=AssertionError) as mock_query:
+                app.action_tab_history()
+                app.action_tab_configure()
+            mock_query.assert_not_called()
+            assert app._tabs.active == "configure"
+
 
 class TestPipelineTuiAppRunPipeline:
     """Tests for pipeline execution action."""
@@ -4,9 +4,11 @@ Tests for syllable_walk_tui.core.actions module.
 Tests the action helper functions for patch validation, panel updates, and navigation.
 """
 
+import logging
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+from build_tools.syllable_walk_tui.core import actions
 from build_tools.syllable_walk_tui.core.actions import (
     PatchValidationResult,
     compute_metrics_for_patch,
@@ -49,7 +51,7 @@ class TestValidatePatchReady:
         mock_app = MagicMock()
         mock_patch = MagicMock()
         mock_patch.is_ready_for_generation.return_value = False
-        mock_app.state.patch_a = mock_patch
+        mock_app.get_patch.side_effect = {"A": mock_patch}.__getitem__
 
         result = validate_patch_ready(mock_app, "A")
 
@@ -63,7 +65,7 @@ class TestValidatePatchReady:
         mock_app = MagicMock()
         mock_patch = MagicMock()
         mock_patch.is_ready_for_generation.return_value = True
-        mock_app.state.patch_a = mock_patch
+        mock_app.get_patch.side_effect = {"A": mock_patch}.__getitem__
 
         result = validate_patch_ready(mock_app, "A")
 
@@ -77,8 +79,7 @@ class TestValidatePatchReady:
         mock_patch_a = MagicMock()
         mock_patch_b = MagicMock()
         mock_patch_b.is_ready_for_generation.return_value = True
-        mock_app.state.patch_a = mock_patch_a
-        mock_app.state.patch_b = mock_patch_b
+        mock_app.get_patch.side_effect = {"A": mock_patch_a, "B": mock_patch_b}.__getitem__
 
         result = validate_patch_ready(mock_app, "B")
 
@@ -89,7 +90,7 @@ class TestValidatePatchReady:
         mock_app = MagicMock()
         mock_patch = MagicMock()
         mock_patch.is_ready_for_generation.return_value = False
-        mock_app.state.patch_a = mock_patch
+        mock_app.get_patch.side_effect = {"A": mock_patch}.__getitem__
 
         result = validate_patch_ready(mock_app, "A")
 
@@ -101,7 +102,7 @@ class TestValidatePatchReady:
         mock_app = MagicMock()
         mock_patch = MagicMock()
         mock_patch.is_ready_for_generation.return_value = False
-        mock_app.state.patch_b = mock_patch
+        mock_app.get_patch.side_effect = {"B": mock_patch}.__getitem__
 
         result = validate_patch_ready(mock_app, "B")
 
@@ -123,16 +124,16 @@ class TestUpdateCombinerPanel:
 
         mock_panel.update_output.assert_called_once_with(meta_output)
 
-    def test_handles_query_exception_gracefully(self, capsys):
+    def test_handles_query_exception_gracefully(self, caplog):
         """Test that exceptions are caught and logged."""
         mock_app = MagicMock()
         mock_app.query_one.side_effect = Exception("Widget not found")
+        caplog.set_level(logging.DEBUG, logger=actions.__name__)
 
         # Should not raise
         update_combiner_panel(mock_app, "A", {})
 
-        captured = capsys.readouterr()
-        assert "Warning" in captured.out
+        assert "Could not update combiner panel" in caplog.text
 
     def test_uses_lowercase_patch_name_in_query(self):
         """Test that lowercase patch name is used in widget ID."""
@@ -161,16 +162,16 @@ class TestUpdateSelectorPanel:
 
         mock_panel.update_output.assert_called_once_with(meta_output, names)
 
-    def test_handles_query_exception_gracefully(self, capsys):
+    def test_handles_query_exception_gracefully(self, caplog):
         """Test that exceptions are caught and logged."""
         mock_app = MagicMock()
         mock_app.query_one.side_effect = Exception("Widget not found")
+        caplog.set_level(logging.DEBUG, logger=actions.__name__)
 
         # Should not raise
         update_selector_panel(mock_app, "B", {}, [])
 
-        captured = capsys.readouterr()
-        assert "Warning" in captured.out
+        assert "Could not update selector panel" in caplog.text
 
 
 class TestComputeMetricsForPatch:
@@ -254,7 +255,7 @@ class TestGetInitialBrowseDir:
         corpus_dir = tmp_path / "corpus"
         corpus_dir.mkdir()
         mock_patch.corpus_dir = corpus_dir
-        mock_app.state.patch_a = mock_patch
+        mock_app.get_patch.side_effect = {"A": mock_patch}.__getitem__
 
         result = get_initial_browse_dir(mock_app, "A")
 
@@ -265,7 +266,7 @@ class TestGetInitialBrowseDir:
         mock_app = MagicMock()
         mock_patch = MagicMock()
         mock_patch.corpus_dir = None
-        mock_app.state.patch_a = mock_patch
+        mock_app.get_patch.side_effect = {"A": mock_patch}.__getitem__
 
         last_browse = tmp_path / "last"
         last_browse.mkdir()
@@ -280,7 +281,7 @@ class TestGetInitialBrowseDir:
         mock_app = MagicMock()
         mock_patch = MagicMock()
         mock_patch.corpus_dir = None
-        mock_app.state.patch_a = mock_patch
+        mock_app.get_patch.side_effect = {"A": mock_patch}.__getitem__
         mock_app.state.last_browse_dir = None
 
         result = get_initial_browse_dir(mock_app, "A")
@@ -288,6 +289,34 @@ class TestGetInitialBrowseDir:
         # Result should be a Path (either _working/output or home directory)
         assert isinstance(result, Path)
 
+    def test_working_output_points_at_repo_root(self):
+        """Test the default corpus dir sits beside build_tools/ at the repo root."""
+        assert (
+            actions.WORKING_OUTPUT_DIR.parent.parent == Path(actions.__file__).resolve().parents[3]
+        )
+        assert actions.WORKING_OUTPUT_DIR.parts[-2:] == ("_working", "output")
+
+    def test_fallback_probed_once(self, tmp_path):
+        """Test the _working/output existence check is not repeated per call."""
+        mock_app = MagicMock()
+        mock_app.get_patch.side_effect = {"A": MagicMock(corpus_dir=None)}.__getitem__
+        mock_app.state.last_browse_dir = None
+        working_output = tmp_path / "output"
+        working_output.mkdir()
+
+        actions._default_browse_dir.cache_clear()
+        try:
+            with patch.object(actions, "WORKING_OUTPUT_DIR", working_output):
+                first = get_initial_browse_dir(mock_app, "A")
+                working_output.rmdir()
+                second = get_initial_browse_dir(mock_app, "A")
+            info = actions._default_browse_dir.cache_info()
+        finally:
+            actions._default_browse_dir.cache_clear()
+
+        assert first == second == working_output
+        assert (info.misses, info.hits) == (1, 1)
+
 
 class TestOpenDatabaseForPatch:
     """Tests for open_database_for_patch function."""
@@ -297,7 +326,7 @@ class TestOpenDatabaseForPatch:
         mock_app = MagicMock()
         mock_patch = MagicMock()
         mock_patch.corpus_dir = None
-        mock_app.state.patch_a = mock_patch
+        mock_app.get_patch.side_effect = {"A": mock_patch}.__getitem__
 
         open_database_for_patch(mock_app, "A")
 
@@ -312,7 +341,7 @@ class TestOpenDatabaseForPatch:
         corpus_dir = tmp_path / "corpus"
         corpus_dir.mkdir()
         mock_patch.corpus_dir = corpus_dir
-        mock_app.state.patch_a = mock_patch
+        mock_app.get_patch.side_effect = {"A": mock_patch}.__getitem__
 
         open_database_for_patch(mock_app, "A")
 
@@ -331,7 +360,7 @@ class TestOpenDatabaseForPatch:
         db_path = data_dir / "corpus.db"
         db_path.touch()
         mock_patch.corpus_dir = corpus_dir
-        mock_app.state.patch_a = mock_patch
+        mock_app.get_patch.side_effect = {"A": mock_patch}.__getitem__
 
         with patch("build_tools.syllable_walk_tui.modules.database.DatabaseScreen") as mock_screen:
             open_database_for_patch(mock_app, "A")
@@ -0,0 +1,176 @@
+"""
+Tests for syllable_walk_tui.core.handlers module.
+
+Tests the parameter change routing for patch spinner and slider widgets.
+"""
+
+import random
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from build_tools.syllable_walk_tui.core import handlers
+from build_tools.syllable_walk_tui.core.state import AppState
+
+
+def _make_app() -> MagicMock:
+    """Create a mock app with real state and no pending profile updates."""
+    app = MagicMock()
+    app.state = AppState()
+    app.get_patch.side_effect = {"A": app.state.patch_a, "B": app.state.patch_b}.__getitem__
+    app.get_combiner.side_effect = {
+        "A": app.state.combiner_a,
+        "B": app.state.combiner_b,
+    }.__getitem__
+    app.get_selector.side_effect = {
+        "A": app.state.selector_a,
+        "B": app.state.selector_b,
+    }.__getitem__
+    app._updating_from_profile = False
+    app._pending_profile_updates = 0
+    return app
+
+
+class TestHandleIntSpinnerChanged:
+    """Tests for handle_int_spinner_changed routing."""
+
+    @pytest.mark.parametrize(
+        ("widget_id", "attr"),
+        [
+            ("min-length-A", "min_length"),
+            ("max-length-A", "max_length"),
+            ("walk-length-A", "walk_length"),
+            ("neighbors-A", "neighbor_limit"),
+            ("walk-count-A", "walk_count"),
+        ],
+    )
+    def test_sets_plain_parameters(self, widget_id, attr):
+        """Test non-profile parameters update state without leaving the profile."""
+        app = _make_app()
+
+        with patch.object(handlers, "switch_to_custom_mode") as mock_switch:
+            handlers.handle_int_spinner_changed(app, widget_id, 7)
+
+        assert getattr(app.state.patch_a, attr) == 7
+        mock_switch.assert_not_called()
+
+    def test_max_flips_switches_to_custom(self):
+        """Test max flips is a profile parameter."""
+        app = _make_app()
+
+        with patch.object(handlers, "switch_to_custom_mode") as mock_switch:
+            handlers.handle_int_spinner_changed(app, "max-flips-B", 3)
+
+        assert app.state.patch_b.max_flips == 3
+        mock_switch.assert_called_once_with(app, "B", app.state.patch_b)
+
+    def test_profile_update_consumes_pending_count(self):
+        """Test updates caused by a profile change do not switch to custom."""
+        app = _make_app()
+        app._updating_from_profile = True
+        app._pending_profile_updates = 1
+
+        with patch.object(handlers, "switch_to_custom_mode") as mock_switch:
+            handlers.handle_int_spinner_changed(app, "max-flips-A", 1)
+
+        mock_switch.assert_not_called()
+        assert app._updating_from_profile is False
+        assert app._pending_profile_updates == 0
+
+    def test_unknown_parameter_is_ignored(self):
+        """Test unrecognized patch widget ids leave state untouched."""
+        app = _make_app()
+        before = app.state.patch_a.walk_length
+
+        handlers.handle_int_spinner_changed(app, "unknown-A", 9)
+        handlers.handle_int_spinner_changed(app, "walk-length-C", 9)
+
+        assert app.state.patch_a.walk_length == before
+
+
+class TestHandleFloatSliderChanged:
+    """Tests for handle_float_slider_changed routing."""
+
+    @pytest.mark.parametrize(
+        ("widget_id", "attr"),
+        [("temperature-A", "temperature"), ("freq-weight-A", "frequency_weight")],
+    )
+    def test_profile_parameters_switch_to_custom(self, widget_id, attr):
+        """Test both slider parameters update state and switch to custom."""
+        app = _make_app()
+
+        with patch.object(handlers, "switch_to_custom_mode") as mock_switch:
+            handlers.handle_float_slider_changed(app, widget_id, 1.5)
+
+        assert getattr(app.state.patch_a, attr) == 1.5
+        mock_switch.assert_called_once_with(app, "A", app.state.patch_a)
+
+
+class TestHandleSeedChanged:
+    """Tests for handle_seed_changed routing."""
+
+    def test_reseeds_patch_rng(self):
+        """Test a seed change stores the seed and a matching deterministic RNG."""
+        app = _make_app()
+
+        handlers.handle_seed_changed(app, "seed-B", 1234)
+
+        assert app.state.patch_b.seed == 1234
+        assert app.state.patch_b.rng.random() == random.Random(1234).random()
+
+    def test_non_patch_seed_is_ignored(self):
+        """Test ids other than seed-A/seed-B leave both patches untouched."""
+        app = _make_app()
+        before = (app.state.patch_a.seed, app.state.patch_b.seed)
+
+        handlers.handle_seed_changed(app, "seed-C", 1234)
+        handlers.handle_seed_changed(app, "walk-seed-A", 1234)
+        handlers.handle_seed_changed(app, "seed", 1234)
+
+        assert (app.state.patch_a.seed, app.state.patch_b.seed) == before
+
+
+class TestParsePatchWidgetId:
+    """Tests for parse_patch_widget_id."""
+
+    def test_splits_param_and_patch(self):
+        """Test multi-part stems keep their inner hyphens."""
+        assert handlers.parse_patch_widget_id("min-length-A") == ("min-length", "A")
+        assert handlers.parse_patch_widget_id("temperature-B") == ("temperature", "B")
+
+    @pytest.mark.parametrize("widget_id", ["temperature", "min-length-C", "combiner-count-a"])
+    def test_rejects_non_patch_ids(self, widget_id):
+        """Test IDs without an A/B patch suffix are rejected."""
+        assert handlers.parse_patch_widget_id(widget_id) is None
+
+    def test_results_are_cached(self):
+        """Test repeated events for one widget reuse the parsed ID."""
+        handlers.parse_patch_widget_id.cache_clear()
+
+        handlers.parse_patch_widget_id("walk-length-A")
+        handlers.parse_patch_widget_id("walk-length-A")
+
+        info = handlers.parse_patch_widget_id.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
+
+
+class TestHandleProfileSelected:
+    """Tests for walk profile selection routing."""
+
+    def test_updates_named_patch(self):
+        """Test selecting a profile updates only the patch in the widget id."""
+        app = _make_app()
+
+        handlers.handle_profile_selected(app, "profile-goblin-B", "goblin")
+
+        assert app.state.patch_b.current_profile == "goblin"
+        assert app.state.patch_a.current_profile != "goblin"
+
+    def test_unknown_patch_suffix_is_ignored(self):
+        """Test widget ids without an A/B suffix leave both patches untouched."""
+        app = _make_app()
+        before = (app.state.patch_a.current_profile, app.state.patch_b.current_profile)
+
+        handlers.handle_profile_selected(app, "profile-goblin-C", "goblin")
+
+        assert (app.state.patch_a.current_profile, app.state.patch_b.current_profile) == before
@@ -4,6 +4,7 @@ Tests for syllable_walk_tui.core.ui_updates module.
 Tests the UI status update helper functions that display corpus loading progress.
 """
 
+import logging
 from unittest.mock import MagicMock
 
 import pytest
@@ -11,6 +12,13 @@ import pytest
 from build_tools.syllable_walk_tui.core import ui_updates
 
 
+def _make_app() -> MagicMock:
+    """Create a mock app with an empty status label cache."""
+    app = MagicMock()
+    app._status_labels = {}
+    return app
+
+
 class TestGetCorpusPrefix:
     """Tests for _get_corpus_prefix helper."""
 
@@ -28,12 +36,76 @@ class TestGetCorpusPrefix:
         assert ui_updates._get_corpus_prefix("Pyphen") == "pyphen"
 
 
+class TestStatusText:
+    """Tests for shared status text helpers."""
+
+    def test_header_lists_quick_load_files(self):
+        """Test the shared header has the corpus name and quick-load files."""
+        header = ui_updates._status_header("corpus_info", "Pyphen")
+
+        assert header.split("\n") == [
+            "corpus_info",
+            ui_updates.SEPARATOR,
+            "✓ pyphen_syllables_unique.txt",
+            "✓ pyphen_syllables_frequencies.json",
+        ]
+
+    def test_sqlite_header_omits_quick_load_files(self):
+        """Test a corpus read only from corpus.db does not list the unread files."""
+        header = ui_updates._status_header("corpus_info", "Pyphen", True)
+
+        assert header.split("\n") == ["corpus_info", ui_updates.SEPARATOR]
+
+    def test_header_is_reused_across_phases(self):
+        """Test each corpus header is built once and shared by later phases."""
+        ui_updates._status_header.cache_clear()
+
+        ui_updates._status_text("corpus_info", "nltk", "loading")
+        ui_updates._status_text("corpus_info", "nltk", "ready")
+
+        info = ui_updates._status_header.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
+
+    def test_status_text_appends_tail_lines(self):
+        """Test phase-specific lines follow the header."""
+        text = ui_updates._status_text("corpus_info", None, "tail one", "tail two")
+
+        assert text.endswith("nltk_syllables_frequencies.json\ntail one\ntail two")
+
+
+class TestGetStatusLabel:
+    """Tests for _get_status_label helper."""
+
+    def test_caches_label_after_first_query(self):
+        """Test the label is queried once and reused for later updates."""
+        mock_app = _make_app()
+        mock_label = MagicMock()
+        mock_app.query_one.return_value = mock_label
+
+        first = ui_updates._get_status_label(mock_app, "A")
+        second = ui_updates._get_status_label(mock_app, "A")
+
+        assert first is second is mock_label
+        mock_app.query_one.assert_called_once()
+        assert mock_app._status_labels == {"A": mock_label}
+
+    def test_caches_per_patch(self):
+        """Test each patch gets its own cached label."""
+        mock_app = _make_app()
+        label_a, label_b = MagicMock(), MagicMock()
+        mock_app.query_one.side_effect = [label_a, label_b]
+
+        assert ui_updates._get_status_label(mock_app, "A") is label_a
+        assert ui_updates._get_status_label(mock_app, "B") is label_b
+        assert mock_app.query_one.call_count == 2
+
+
 class TestUpdateCorpusStatusQuickLoad:
     """Tests for update_corpus_status_quick_load function."""
 
     def test_updates_status_label_with_file_list(self):
         """Test that status label is updated with correct file list."""
-        mock_app = MagicMock()
+        mock_app = _make_app()
         mock_label = MagicMock()
         mock_app.query_one.return_value = mock_label
 
@@ -57,7 +129,7 @@ class TestUpdateCorpusStatusQuickLoad:
 
     def test_updates_css_classes(self):
         """Test that CSS classes are updated correctly."""
-        mock_app = MagicMock()
+        mock_app = _make_app()
         mock_label = MagicMock()
         mock_app.query_one.return_value = mock_label
 
@@ -66,16 +138,16 @@ class TestUpdateCorpusStatusQuickLoad:
         mock_label.remove_class.assert_called_once_with("corpus-status")
         mock_label.add_class.assert_called_once_with("corpus-status-valid")
 
-    def test_handles_query_exception_gracefully(self, capsys):
+    def test_handles_query_exception_gracefully(self, caplog):
         """Test that exceptions are caught and logged."""
-        mock_app = MagicMock()
+        mock_app = _make_app()
         mock_app.query_one.side_effect = Exception("Widget not found")
+        caplog.set_level(logging.DEBUG, logger=ui_updates.__name__)
 
         # Should not raise
         ui_updates.update_corpus_status_quick_load(mock_app, "A", "corpus_info", "pyphen")
 
-        captured = capsys.readouterr()
-        assert "Warning" in captured.out
+        assert "Could not update status label" in caplog.text
 
 
 class TestUpdateCorpusStatusLoading:
@@ -83,7 +155,7 @@ class TestUpdateCorpusStatusLoading:
 
     def test_shows_loading_indicator(self):
         """Test that loading indicator is shown."""
-        mock_app = MagicMock()
+        mock_app = _make_app()
         mock_label = MagicMock()
         mock_app.query_one.return_value = mock_label
 
@@ -99,7 +171,7 @@ class TestUpdateCorpusStatusLoading:
 
     def test_uses_correct_prefix_for_nltk(self):
         """Test that nltk prefix is used for nltk corpus."""
-        mock_app = MagicMock()
+        mock_app = _make_app()
         mock_label = MagicMock()
         mock_app.query_one.return_value = mock_label
 
@@ -108,16 +180,30 @@ class TestUpdateCorpusStatusLoading:
         call_arg = mock_label.update.call_args[0][0]
         assert "nltk_syllables" in call_arg
 
-    def test_handles_query_exception_gracefully(self, capsys):
+    def test_sqlite_corpus_shows_database_loading(self):
+        """Test the corpus.db path names the database, not the skipped files."""
+        mock_app = _make_app()
+        mock_label = MagicMock()
+        mock_app.query_one.return_value = mock_label
+
+        ui_updates.update_corpus_status_loading(
+            mock_app, "A", "corpus_info", "pyphen", from_db=True
+        )
+
+        assert mock_label.update.call_args[0][0] == "\n".join(
+            ["corpus_info", ui_updates.SEPARATOR, "⏳ corpus.db (loading...)"]
+        )
+
+    def test_handles_query_exception_gracefully(self, caplog):
         """Test that exceptions are caught and logged."""
-        mock_app = MagicMock()
+        mock_app = _make_app()
         mock_app.query_one.side_effect = Exception("Widget not found")
+        caplog.set_level(logging.DEBUG, logger=ui_updates.__name__)
 
         # Should not raise
         ui_updates.update_corpus_status_loading(mock_app, "A", "corpus_info", "pyphen")
 
-        captured = capsys.readouterr()
-        assert "Warning" in captured.out
+        assert "Could not update status label" in caplog.text
 
 
 class TestUpdateCorpusStatusReady:
@@ -125,7 +211,7 @@ class TestUpdateCorpusStatusReady:
 
     def test_shows_sqlite_source(self):
         """Test SQLite source is displayed correctly."""
-        mock_app = MagicMock()
+        mock_app = _make_app()
         mock_label = MagicMock()
         mock_app.query_one.return_value = mock_label
 
@@ -145,9 +231,51 @@ class TestUpdateCorpusStatusReady:
         assert "150ms" in call_arg
         assert "1,000 syllables" in call_arg
 
+    def test_full_ready_text(self):
+        """Test the ready label is the shared header plus source and count lines."""
+        mock_app = _make_app()
+        mock_label = MagicMock()
+        mock_app.query_one.return_value = mock_label
+
+        ui_updates.update_corpus_status_ready(
+            mock_app, "B", "NLTK (run)", "NLTK", 42, "json", 7, "nltk_syllables_annotated.json"
+        )
+
+        assert mock_label.update.call_args[0][0] == "\n".join(
+            [
+                "NLTK (run)",
+                ui_updates.SEPARATOR,
+                "✓ nltk_syllables_unique.txt",
+                "✓ nltk_syllables_frequencies.json",
+                "✓ nltk_syllables_annotated.json (7ms, JSON)",
+                ui_updates.SEPARATOR,
+                "Ready: 42 syllables",
+            ]
+        )
+
+    def test_sqlite_corpus_ready_text(self):
+        """Test the corpus.db path lists only the database it actually read."""
+        mock_app = _make_app()
+        mock_label = MagicMock()
+        mock_app.query_one.return_value = mock_label
+
+        ui_updates.update_corpus_status_ready(
+            mock_app, "A", "corpus_info", "pyphen", 1000, "sqlite", 150, from_db=True
+        )
+
+        assert mock_label.update.call_args[0][0] == "\n".join(
+            [
+                "corpus_info",
+                ui_updates.SEPARATOR,
+                "✓ corpus.db (150ms, SQLite)",
+                ui_updates.SEPARATOR,
+                "Ready: 1,000 syllables",
+            ]
+        )
+
     def test_shows_json_source(self):
         """Test JSON source is displayed correctly."""
-        mock_app = MagicMock()
+        mock_app = _make_app()
         mock_label = MagicMock()
         mock_app.query_one.return_value = mock_label
 
@@ -169,7 +297,7 @@ class TestUpdateCorpusStatusReady:
 
     def test_uses_default_file_name_when_not_provided(self):
         """Test that default file name is used when not provided."""
-        mock_app = MagicMock()
+        mock_app = _make_app()
         mock_label = MagicMock()
         mock_app.query_one.return_value = mock_label
 
@@ -187,18 +315,18 @@ class TestUpdateCorpusStatusReady:
         call_arg = mock_label.update.call_args[0][0]
         assert "annotated.json" in call_arg
 
-    def test_handles_query_exception_gracefully(self, capsys):
+    def test_handles_query_exception_gracefully(self, caplog):
         """Test that exceptions are caught and logged."""
-        mock_app = MagicMock()
+        mock_app = _make_app()
         mock_app.query_one.side_effect = Exception("Widget not found")
+        caplog.set_level(logging.DEBUG, logger=ui_updates.__name__)
 
         # Should not raise
         ui_updates.update_corpus_status_ready(
             mock_app, "A", "corpus_info", "pyphen", 500, "sqlite", 150
         )
 
-        captured = capsys.readouterr()
-        assert "Warning" in captured.out
+        assert "Could not update status label" in caplog.text
 
 
 class TestUpdateCorpusStatusError:
@@ -206,7 +334,7 @@ class TestUpdateCorpusStatusError:
 
     def test_shows_error_message(self):
         """Test that error message is displayed."""
-        mock_app = MagicMock()
+        mock_app = _make_app()
         mock_label = MagicMock()
         mock_app.query_one.return_value = mock_label
 
@@ -222,9 +350,23 @@ class TestUpdateCorpusStatusError:
         assert "Error:" in call_arg
         assert "File not found" in call_arg
 
+    def test_sqlite_corpus_error_names_database(self):
+        """Test a failed corpus.db load marks the database rather than the JSON file."""
+        mock_app = _make_app()
+        mock_label = MagicMock()
+        mock_app.query_one.return_value = mock_label
+
+        ui_updates.update_corpus_status_error(
+            mock_app, "A", "corpus_info", "pyphen", "locked", from_db=True
+        )
+
+        call_arg = mock_label.update.call_args[0][0]
+        assert "✗ corpus.db" in call_arg
+        assert "pyphen_syllables" not in call_arg
+
     def test_truncates_long_error_messages(self):
         """Test that long error messages are truncated."""
-        mock_app = MagicMock()
+        mock_app = _make_app()
         mock_label = MagicMock()
         mock_app.query_one.return_value = mock_label
 
@@ -238,7 +380,7 @@ class TestUpdateCorpusStatusError:
 
     def test_switches_to_error_css_class(self):
         """Test that CSS classes indicate error state."""
-        mock_app = MagicMock()
+        mock_app = _make_app()
         mock_label = MagicMock()
         mock_app.query_one.return_value = mock_label
 
@@ -249,7 +391,7 @@ class TestUpdateCorpusStatusError:
 
     def test_handles_query_exception_silently(self):
         """Test that exceptions are caught silently."""
-        mock_app = MagicMock()
+        mock_app = _make_app()
         mock_app.query_one.side_effect = Exception("Widget not found")
 
         # Should not raise - exception is silently ignored
@@ -263,7 +405,7 @@ class TestUpdateCorpusStatusNotAnnotated:
 
     def test_shows_annotator_instruction(self):
         """Test that instruction to run annotator is shown."""
-        mock_app = MagicMock()
+        mock_app = _make_app()
         mock_label = MagicMock()
         mock_app.query_one.return_value = mock_label
 
@@ -279,7 +421,7 @@ class TestUpdateCorpusStatusNotAnnotated:
 
     def test_handles_query_exception_silently(self):
         """Test that exceptions are caught silently."""
-        mock_app = MagicMock()
+        mock_app = _make_app()
         mock_app.query_one.side_effect = Exception("Widget not found")
 
         # Should not raise - exception is silently ignored
@@ -316,13 +458,13 @@ class TestUpdateCenterCorpusLabel:
 
         mock_label.remove_class.assert_called_once_with("output-placeholder")
 
-    def test_handles_query_exception_gracefully(self, capsys):
+    def test_handles_query_exception_gracefully(self, caplog):
         """Test that exceptions are caught and logged."""
         mock_app = MagicMock()
         mock_app.query_one.side_effect = Exception("Widget not found")
+        caplog.set_level(logging.DEBUG, logger=ui_updates.__name__)
 
         # Should not raise
         ui_updates.update_center_corpus_label(mock_app, "A", "dir_name", "pyphen")
 
-        captured = capsys.readouterr()
-        assert "Warning" in captured.out
+        assert "Could not update center corpus label" in caplog.text
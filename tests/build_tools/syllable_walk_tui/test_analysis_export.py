@@ -0,0 +1,116 @@
+"""
+Tests for syllable_walk_tui.modules.analyzer.exporter module.
+
+Tests the corpus shape metrics text export.
+"""
+
+from datetime import datetime
+from pathlib import Path
+
+from build_tools.syllable_walk_tui.modules.analyzer import exporter
+from build_tools.syllable_walk_tui.modules.analyzer.exporter import (
+    export_analysis_to_file,
+    format_analysis_export,
+    format_frequency_metrics,
+    format_inventory_metrics,
+    format_patch_metrics,
+    format_terrain_metrics,
+    generate_export_filename,
+)
+from build_tools.syllable_walk_tui.services.metrics import (
+    TerrainMetrics,
+    compute_frequency_metrics,
+    compute_inventory_metrics,
+)
+
+
+class TestSectionFormatters:
+    """Tests for the per-section text formatters."""
+
+    def test_inventory_block(self):
+        """Test the inventory block starts with its heading and ends with the distribution."""
+        lines = format_inventory_metrics(compute_inventory_metrics(["ka", "kra", "ti"])).split("\n")
+
+        assert lines[0] == "INVENTORY"
+        assert lines[-1] == "  Length dist:        2:2 (66.7%), 3:1 (33.3%)"
+
+    def test_private_helpers_append_to_buffer(self):
+        """Test the buffer helpers extend existing content instead of replacing it."""
+        out = ["existing"]
+
+        exporter._format_inventory_metrics(compute_inventory_metrics(["ka", "kra", "ti"]), out)
+
+        assert out[0] == "existing"
+        assert out[1] == "INVENTORY"
+        assert all("\n" not in line for line in out)
+
+    def test_top_frequency_percentages(self):
+        """Test top syllables show their share of total occurrences."""
+        text = format_frequency_metrics(compute_frequency_metrics({"ka": 3, "ti": 1}), 2)
+
+        assert text.split("\n")[-2:] == ["    ka: 3 (75.0%)", "    ti: 1 (25.0%)"]
+
+    def test_terrain_bars_clamp_scores(self):
+        """Test bars stay 30 chars wide for scores outside 0.0-1.0."""
+        terrain = TerrainMetrics(-0.2, 0.5, 1.4, "ROUND", "BALANCED", "DENSE")
+
+        lines = format_terrain_metrics(terrain).split("\n")
+
+        bars = [line.split()[0] for line in lines if line.lstrip()[:1] in ("█", "░")]
+        assert bars == ["░" * 30, "█" * 15 + "░" * 15, "█" * 30]
+
+    def test_terrain_deltas_are_signed(self):
+        """Test each bar ends with its signed offset from the 0.5 center."""
+        terrain = TerrainMetrics(0.25, 0.5, 0.875, "ROUND", "BALANCED", "DENSE")
+
+        lines = format_terrain_metrics(terrain).split("\n")
+
+        deltas = [line.split()[-1] for line in lines if line.lstrip()[:1] in ("█", "░")]
+        assert deltas == ["-0.250", "+0.000", "+0.375"]
+
+    def test_patch_without_metrics(self):
+        """Test an unloaded patch shows its header and placeholder only."""
+        text = format_patch_metrics("B", None, Path("/corpora/20260101_000000_nltk"))
+
+        assert text.split("\n") == [
+            "=" * 50,
+            "PATCH B",
+            "=" * 50,
+            "Corpus: 20260101_000000_nltk",
+            "",
+            "(no corpus loaded)",
+        ]
+
+
+class TestFormatAnalysisExport:
+    """Tests for the complete two-patch export."""
+
+    def test_layout_without_metrics(self):
+        """Test header, both patches and footer are joined in order."""
+        lines = format_analysis_export(None, None).split("\n")
+
+        assert lines[0] == "CORPUS SHAPE METRICS EXPORT"
+        assert lines[1].startswith("Generated: ")
+        assert lines[3:7] == ["=" * 50, "PATCH A", "=" * 50, "(no corpus loaded)"]
+        assert lines[7:12] == ["", "=" * 50, "PATCH B", "=" * 50, "(no corpus loaded)"]
+        assert lines[-2] == "Export generated by Syllable Walker TUI"
+
+    def test_header_and_filename_share_timestamp(self, tmp_path):
+        """Test one passed-in time stamps both the filename and the header."""
+        now = datetime(2026, 1, 18, 14, 30, 22)
+
+        filepath = tmp_path / generate_export_filename(now)
+        export_analysis_to_file(filepath, None, None, now=now)
+
+        assert filepath.name == "corpus_metrics_20260118_143022.txt"
+        assert filepath.read_text(encoding="utf-8").split("\n")[1] == (
+            "Generated: 2026-01-18 14:30:22"
+        )
+
+    def test_file_is_utf8_with_lf_endings(self, tmp_path):
+        """Test the export file holds the formatted text as UTF-8 bytes."""
+        filepath = export_analysis_to_file(tmp_path / "export.txt", None, None)
+
+        data = filepath.read_bytes()
+        assert b"\r\n" not in data
+        assert data.decode("utf-8").startswith("CORPUS SHAPE METRICS EXPORT\n")
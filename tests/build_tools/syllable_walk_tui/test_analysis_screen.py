@@ -0,0 +1,258 @@
+"""
+Tests for syllable_walk_tui.modules.analyzer.screen module.
+
+Tests the terrain weights editor rendering and refresh behavior.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from textual.app import App
+from textual.widgets import Label
+
+from build_tools.syllable_walk_tui.modules.analyzer import screen
+from build_tools.syllable_walk_tui.modules.analyzer.screen import (
+    BAR_WIDTH,
+    AnalysisScreen,
+    MetricsDisplay,
+    TerrainDisplay,
+    WeightsModal,
+    format_weights_row,
+    render_terrain_bar,
+)
+from build_tools.syllable_walk_tui.services.metrics import compute_corpus_shape_metrics
+from build_tools.syllable_walk_tui.services.terrain_weights import (
+    DEFAULT_TERRAIN_WEIGHTS,
+    AxisWeights,
+    create_default_terrain_weights,
+)
+
+
+class TestRenderTerrainBar:
+    """Tests for terrain bar rendering."""
+
+    @pytest.mark.parametrize(
+        ("score", "filled"),
+        [(0.0, 0), (0.5, 15), (0.99, 29), (1.0, 30), (-0.3, 0), (1.7, 30)],
+    )
+    def test_bar_fill_is_clamped(self, score, filled):
+        """Test bars are always full width with the fill clamped to the range."""
+        bar = render_terrain_bar(score, "LABEL").split()[0]
+
+        assert bar == "█" * filled + "░" * (BAR_WIDTH - filled)
+
+    def test_label_and_delta_follow_bar(self):
+        """Test the label is padded and the signed delta comes last."""
+        assert render_terrain_bar(0.625, "JAGGED").endswith(" JAGGED   +0.125")
+
+
+class TestFormatWeightsRow:
+    """Tests for weight row rendering."""
+
+    def test_highlights_only_selected_chip(self):
+        """Test the selected chip is reversed when its axis is selected."""
+        axis = AxisWeights({"contains_liquid": -0.8, "contains_plosive": 0.6})
+
+        assert format_weights_row(axis, 1, 1, 1) == "    liq:-0.8  [reverse]plo:+0.6[/reverse]"
+        assert format_weights_row(axis, 0, 1, 1) == "    liq:-0.8  plo:+0.6"
+
+    def test_rows_are_cached_by_weight_values(self):
+        """Test equal weights and selection reuse the rendered row."""
+        screen._render_weights_row.cache_clear()
+
+        format_weights_row(AxisWeights({"contains_nasal": 0.5}), 0, 0, 0)
+        format_weights_row(AxisWeights({"contains_nasal": 0.5}), 0, 0, 0)
+        format_weights_row(AxisWeights({"contains_nasal": 0.6}), 0, 0, 0)
+
+        info = screen._render_weights_row.cache_info()
+        assert (info.hits, info.misses) == (1, 2)
+
+    def test_as_tuple_snapshots_weights(self):
+        """Test the snapshot keeps order and does not track later edits."""
+        axis = AxisWeights({"short_vowel": -0.5, "long_vowel": 0.2})
+        snapshot = axis.as_tuple()
+
+        axis.set("short_vowel", 0.1)
+
+        assert snapshot == (("short_vowel", -0.5), ("long_vowel", 0.2))
+
+    def test_as_tuple_is_reused_until_set(self):
+        """Test repeated snapshots share one tuple and set() refreshes it."""
+        axis = AxisWeights({"short_vowel": -0.5})
+        first = axis.as_tuple()
+
+        assert axis.as_tuple() is first
+        axis.set("short_vowel", 0.3)
+        assert axis.as_tuple() == (("short_vowel", 0.3),)
+        assert axis == AxisWeights({"short_vowel": 0.3})
+
+
+class TestWeightsModalNavigation:
+    """Tests for WeightsModal Tab navigation positions."""
+
+    def test_flat_index_round_trips_every_position(self):
+        """Test every position maps back to its own flat index."""
+        modal = WeightsModal(create_default_terrain_weights(), create_default_terrain_weights())
+
+        for idx in range(len(modal._positions)):
+            modal._set_from_flat_index(idx)
+            assert modal._flat_index() == idx
+
+    def test_tab_wraps_from_last_to_first(self):
+        """Test Tab past Patch B's last weight returns to Patch A's first."""
+        modal = WeightsModal(create_default_terrain_weights(), create_default_terrain_weights())
+        modal._set_from_flat_index(len(modal._positions) - 1)
+
+        with patch.object(modal, "_refresh_weights"):
+            modal.action_next_weight()
+
+        assert (modal.selected_patch, modal.selected_axis, modal.selected_weight) == (0, 0, 0)
+
+
+class TestWeightsModalRefresh:
+    """Tests for WeightsModal only repainting changed rows."""
+
+    @pytest.mark.asyncio
+    async def test_tab_updates_only_touched_rows(self):
+        """Test moving the selection within an axis repaints just that row."""
+        app: App[None] = App()
+
+        async with app.run_test() as pilot:
+            modal = WeightsModal(create_default_terrain_weights(), create_default_terrain_weights())
+            await app.push_screen(modal)
+            await pilot.pause()
+
+            with patch.object(Label, "update", autospec=True) as mock_update:
+                modal.action_next_weight()
+
+            assert [call.args[0].id for call in mock_update.call_args_list] == ["a-shape"]
+
+    @pytest.mark.asyncio
+    async def test_weight_change_is_rendered(self):
+        """Test adjusting a weight updates the row text shown for it."""
+        app: App[None] = App()
+
+        async with app.run_test() as pilot:
+            weights_a = create_default_terrain_weights()
+            modal = WeightsModal(weights_a, create_default_terrain_weights())
+            await app.push_screen(modal)
+            await pilot.pause()
+
+            modal.action_increase_weight()
+
+            expected = format_weights_row(weights_a.shape, 0, 0, 0)
+            assert modal._rendered_rows["a-shape"] == expected
+            assert str(modal.query_one("#a-shape", Label).render()).strip() == (
+                expected.replace("[reverse]", "").replace("[/reverse]", "").strip()
+            )
+
+
+class TestMetricsDisplaySections:
+    """Tests for the static inventory and frequency sections."""
+
+    @pytest.mark.asyncio
+    async def test_each_section_body_is_one_label(self):
+        """Test inventory and frequency rows render as one multi-line label each."""
+        screen_ = TestAnalysisScreenRecomputeTerrain._make_screen()
+        app: App[None] = App()
+
+        async with app.run_test() as pilot:
+            await app.push_screen(screen_)
+            await pilot.pause()
+            display = screen_.query_one(MetricsDisplay)
+            bodies = [
+                str(label.render())
+                for label in display.query(Label)
+                if label.has_class("metrics-row") and "\n" in str(label.render())
+            ]
+
+            assert len(bodies) == 2
+            assert "Total syllables:" in bodies[0] and "Length dist:" in bodies[0]
+            assert "Total occurrences:" in bodies[1] and "    kat: 3 (60.0%)" in bodies[1]
+
+
+class TestAnalysisScreenRecomputeTerrain:
+    """Tests for recomputing terrain after weight edits."""
+
+    @staticmethod
+    def _make_screen() -> AnalysisScreen:
+        """Create a screen with Patch A metrics from a tiny annotated corpus."""
+        names = ("contains_plosive", "ends_with_stop", "contains_liquid", "ends_with_vowel")
+        annotated = [
+            {"syllable": "kat", "frequency": 3, "features": {names[0]: True, names[1]: True}},
+            {"syllable": "la", "frequency": 2, "features": {names[2]: True, names[3]: True}},
+        ]
+        syllables: list[str] = ["kat", "la"]
+        frequencies: dict[str, int] = {"kat": 3, "la": 2}
+        metrics = compute_corpus_shape_metrics(syllables, frequencies, annotated)
+        return AnalysisScreen(metrics_a=metrics, annotated_data_a=annotated)
+
+    def test_unchanged_weights_keep_metrics(self):
+        """Test closing the weights editor without edits reports no change."""
+        screen_ = self._make_screen()
+        before = screen_.metrics_a
+
+        assert screen_._recompute_terrain() is False
+        assert screen_.metrics_a is before
+
+    def test_weight_edit_replaces_only_terrain(self):
+        """Test a weight change swaps terrain and keeps the other metrics."""
+        screen_ = self._make_screen()
+        before = screen_.metrics_a
+        assert before is not None
+        screen_.weights_a.shape.set("contains_plosive", 5.0)
+
+        assert screen_._recompute_terrain() is True
+        assert screen_.metrics_a is not None
+        assert screen_.metrics_a.terrain != before.terrain
+        assert screen_.metrics_a.inventory is before.inventory
+        assert screen_.metrics_a.feature_saturation is before.feature_saturation
+
+    @pytest.mark.asyncio
+    async def test_refresh_updates_terrain_in_place(self):
+        """Test a terrain refresh rewrites labels without remounting displays."""
+        screen_ = self._make_screen()
+        app: App[None] = App()
+
+        async with app.run_test() as pilot:
+            await app.push_screen(screen_)
+            await pilot.pause()
+            display = screen_.query_one(MetricsDisplay)
+            terrain = screen_.query_one(TerrainDisplay)
+            labels_before = list(terrain.query(Label))
+
+            screen_.weights_a.shape.set("contains_plosive", 5.0)
+            assert screen_._recompute_terrain()
+            screen_._refresh_display()
+            await pilot.pause()
+
+            assert screen_.query_one(MetricsDisplay) is display
+            assert list(terrain.query(Label)) == labels_before
+            bar, _ = terrain._axis_labels["shape"]
+            assert screen_.metrics_a is not None
+            expected = render_terrain_bar(
+                screen_.metrics_a.terrain.shape_score, screen_.metrics_a.terrain.shape_label
+            )
+            assert str(bar.render()).strip() == expected.strip()
+            assert display.metrics is screen_.metrics_a
+
+
+class TestWeightsModalReset:
+    """Tests for resetting a patch's weights to defaults."""
+
+    def test_reset_restores_defaults_without_sharing_them(self):
+        """Test reset copies the shared defaults so later edits stay local."""
+        weights_a = create_default_terrain_weights()
+        weights_a.shape.set("contains_plosive", 5.0)
+        modal = WeightsModal(weights_a, create_default_terrain_weights())
+
+        with (
+            patch.object(modal, "_refresh_weights"),
+            patch.object(modal, "notify"),
+        ):
+            modal.action_reset_weights()
+        weights_a.shape.set("contains_plosive", 9.0)
+
+        assert DEFAULT_TERRAIN_WEIGHTS.shape.get("contains_plosive") != 9.0
+        assert weights_a.craft == DEFAULT_TERRAIN_WEIGHTS.craft
+        assert weights_a.craft is not DEFAULT_TERRAIN_WEIGHTS.craft
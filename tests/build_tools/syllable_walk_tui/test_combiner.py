@@ -24,6 +24,7 @@ class TestCombinerEventHandlers:
         async with app.run_test():
             event = IntSpinner.Changed(value=3, widget_id="combiner-syllables-a")
             app.on_int_spinner_changed(event)
+            app._flush_params()
 
             assert app.state.combiner_a.syllables == 3
 
@@ -37,6 +38,7 @@ class TestCombinerEventHandlers:
         async with app.run_test():
             event = IntSpinner.Changed(value=4, widget_id="combiner-syllables-b")
             app.on_int_spinner_changed(event)
+            app._flush_params()
 
             assert app.state.combiner_b.syllables == 4
 
@@ -50,6 +52,7 @@ class TestCombinerEventHandlers:
         async with app.run_test():
             event = IntSpinner.Changed(value=5000, widget_id="combiner-count-a")
             app.on_int_spinner_changed(event)
+            app._flush_params()
 
             assert app.state.combiner_a.count == 5000
 
@@ -63,6 +66,7 @@ class TestCombinerEventHandlers:
         async with app.run_test():
             event = IntSpinner.Changed(value=20000, widget_id="combiner-count-b")
             app.on_int_spinner_changed(event)
+            app._flush_params()
 
             assert app.state.combiner_b.count == 20000
 
@@ -76,6 +80,7 @@ class TestCombinerEventHandlers:
         async with app.run_test():
             event = FloatSlider.Changed(value=0.5, widget_id="combiner-freq-weight-a")
             app.on_float_slider_changed(event)
+            app._flush_params()
 
             assert app.state.combiner_a.frequency_weight == 0.5
 
@@ -89,6 +94,7 @@ class TestCombinerEventHandlers:
         async with app.run_test():
             event = FloatSlider.Changed(value=0.8, widget_id="combiner-freq-weight-b")
             app.on_float_slider_changed(event)
+            app._flush_params()
 
             assert app.state.combiner_b.frequency_weight == 0.8
 
@@ -102,6 +108,7 @@ class TestCombinerEventHandlers:
         async with app.run_test():
             event = SeedInput.Changed(value=12345, widget_id="combiner-seed-a")
             app.on_seed_changed(event)
+            app._flush_params()
 
             assert app.state.combiner_a.seed == 12345
 
@@ -115,6 +122,7 @@ class TestCombinerEventHandlers:
         async with app.run_test():
             event = SeedInput.Changed(value=99999, widget_id="combiner-seed-b")
             app.on_seed_changed(event)
+            app._flush_params()
 
             assert app.state.combiner_b.seed == 99999
 
@@ -133,6 +141,7 @@ class TestCombinerEventHandlers:
             # Update combiner_b
             event_b = IntSpinner.Changed(value=4, widget_id="combiner-syllables-b")
             app.on_int_spinner_changed(event_b)
+            app._flush_params()
 
             # Verify they're independent
             assert app.state.combiner_a.syllables == 3
@@ -163,6 +172,7 @@ class TestCombinerEventHandlers:
 
             event = IntSpinner.Changed(value=3, widget_id="combiner-syllables-a")
             app.on_int_spinner_changed(event)
+            app._flush_params()
 
             assert app.state.combiner_a.syllable_mode == "exact"
 
@@ -305,7 +305,7 @@ quit = ["x"]
         # Default tab bindings (section missing from file)
         assert config.tab_bindings == defaults.tab_bindings
 
-    def test_load_config_with_conflicts_shows_warning(self, tmp_path):
+    def test_load_config_with_conflicts_shows_warning(self, tmp_path, caplog):
         """Test that config with conflicts still loads but shows warning."""
         config_file = tmp_path / "keybindings.toml"
         config_file.write_text("""
@@ -314,8 +314,11 @@ quit = ["q"]
 help = ["q"]
 """)  # Conflict!
 
-        # Config loads but conflicts are printed
-        config = load_keybindings(config_file)
+        # Config loads but conflicts are logged
+        with caplog.at_level("WARNING"):
+            config = load_keybindings(config_file)
+
+        assert "Keybinding conflicts detected" in caplog.text
 
         # Should still return the config (conflicts are warnings, not errors)
         assert isinstance(config, KeybindingConfig)
@@ -5,12 +5,21 @@ Tests for corpus selection, database actions, metrics computation, and walk gene
 """
 
 import json
+import os
+import sqlite3
+from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 from textual.widgets import Label
 
 from build_tools.syllable_walk_tui.core import SyllableWalkerApp
+from build_tools.syllable_walk_tui.services import corpus
+from build_tools.syllable_walk_tui.services.corpus import (
+    FEATURE_COLUMNS,
+    load_annotated_data_from_sqlite,
+    syllables_from_annotated,
+)
 
 
 class TestCorpusSelectionFlow:
@@ -261,3 +270,246 @@ class TestGenerateWalks:
 
             # Outputs should still be empty
             assert app.state.patch_a.outputs == []
+
+
+class TestLoadAnnotatedDataFromSqlite:
+    """Tests for loading annotated syllables from corpus.db."""
+
+    @staticmethod
+    def _write_db(db_path, rows):
+        """Create a minimal syllables table with the given (syllable, freq, flags) rows."""
+        columns = ", ".join(f"{name} INTEGER" for name in FEATURE_COLUMNS)
+        placeholders = ", ".join("?" * (len(FEATURE_COLUMNS) + 2))
+        conn = sqlite3.connect(db_path)
+        conn.execute(f"CREATE TABLE syllables (syllable TEXT, frequency INTEGER, {columns})")
+        conn.executemany(
+            f"INSERT INTO syllables (syllable, frequency, {', '.join(FEATURE_COLUMNS)}) "
+            f"VALUES ({placeholders})",
+            [(syllable, freq, *flags) for syllable, freq, flags in rows],
+        )
+        conn.commit()
+        conn.close()
+
+    def test_rows_match_annotated_format(self, tmp_path):
+        """Test rows come back ordered by syllable with boolean feature flags."""
+        vowel = (1,) + (0,) * (len(FEATURE_COLUMNS) - 1)
+        plain = (0,) * len(FEATURE_COLUMNS)
+        db_path = tmp_path / "corpus.db"
+        self._write_db(db_path, [("ka", 3, plain), ("an", 7, vowel)])
+
+        data = load_annotated_data_from_sqlite(db_path)
+
+        assert [entry["syllable"] for entry in data] == ["an", "ka"]
+        assert data[0]["frequency"] == 7
+        assert list(data[0]["features"]) == list(FEATURE_COLUMNS)
+        assert data[0]["features"]["starts_with_vowel"] is True
+        assert not any(data[1]["features"].values())
+
+    def test_identical_flags_share_features_dict(self, tmp_path):
+        """Test rows with the same feature flags reuse a single dict."""
+        plain = (0,) * len(FEATURE_COLUMNS)
+        nasal = tuple(int(name == "ends_with_nasal") for name in FEATURE_COLUMNS)
+        db_path = tmp_path / "corpus.db"
+        self._write_db(db_path, [("ka", 1, plain), ("ri", 1, plain), ("on", 1, nasal)])
+
+        data = load_annotated_data_from_sqlite(db_path)
+        by_syllable = {entry["syllable"]: entry["features"] for entry in data}
+
+        assert by_syllable["ka"] is by_syllable["ri"]
+        assert by_syllable["on"] is not by_syllable["ka"]
+        assert json.loads(json.dumps(data)) == data
+
+    def test_missing_database_raises(self, tmp_path):
+        """Test a missing corpus.db raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            load_annotated_data_from_sqlite(tmp_path / "corpus.db")
+
+
+class TestLoadWarningsAreLogged:
+    """Tests that load-time warnings go to the module logger, not stdout."""
+
+    def test_missing_frequencies_logged(self, tmp_path, caplog, capsys):
+        """Test syllables without frequency data produce a logged warning."""
+        corpus_dir = tmp_path / "20260101_000000_nltk"
+        corpus_dir.mkdir()
+        (corpus_dir / "nltk_syllables_unique.txt").write_text("ka\nri\n")
+        (corpus_dir / "nltk_syllables_frequencies.json").write_text('{"ka": 2}')
+
+        with caplog.at_level("WARNING", logger=corpus.__name__):
+            syllables, _ = corpus.load_corpus_data(corpus_dir)
+
+        assert syllables == ["ka", "ri"]
+        assert "1 syllables missing frequency data (out of 2 total)" in caplog.text
+        assert capsys.readouterr().out == ""
+
+    def test_sqlite_fallback_logged(self, tmp_path, caplog, capsys):
+        """Test a broken corpus.db logs the fallback before loading JSON."""
+        corpus_dir = tmp_path / "20260101_000000_nltk"
+        (corpus_dir / "data").mkdir(parents=True)
+        (corpus_dir / "nltk_syllables_unique.txt").write_text("ka\n")
+        (corpus_dir / "nltk_syllables_frequencies.json").write_text('{"ka": 2}')
+        (corpus_dir / "data" / "corpus.db").write_text("not a database")
+        (corpus_dir / "data" / "nltk_syllables_annotated.json").write_text(
+            '[{"syllable": "ka", "frequency": 2, "features": {}}]'
+        )
+
+        with caplog.at_level("WARNING", logger=corpus.__name__):
+            _, metadata = corpus.load_annotated_data(corpus_dir)
+
+        assert metadata["source"] == "json"
+        assert "SQLite loading failed" in caplog.text
+        assert capsys.readouterr().out == ""
+
+
+class TestSyllablesFromAnnotated:
+    """Tests for deriving quick-load data from annotated rows."""
+
+    def test_matches_quick_load_shape(self):
+        """Test rows become a syllable list and a frequency map in row order."""
+        data = [
+            {"syllable": "an", "frequency": 7, "features": {}},
+            {"syllable": "ka", "frequency": 3, "features": {}},
+        ]
+
+        assert syllables_from_annotated(data) == (["an", "ka"], {"an": 7, "ka": 3})
+
+
+class TestValidateCorpusDirectoryCache:
+    """Tests for the modification-time keyed corpus validation cache."""
+
+    @staticmethod
+    def _settled_corpus(root):
+        """Create an NLTK corpus whose directory mtime is well in the past."""
+        corpus_dir = root / "20260110_115601_nltk"
+        corpus_dir.mkdir()
+        (corpus_dir / "nltk_syllables_unique.txt").write_text("ka\n", encoding="utf-8")
+        (corpus_dir / "nltk_syllables_frequencies.json").write_text('{"ka": 1}', encoding="utf-8")
+        os.utime(corpus_dir, ns=(1_000_000_000, 1_000_000_000))
+        return corpus_dir
+
+    def test_unchanged_directory_reuses_probe(self, tmp_path):
+        """Test repeated validation of a settled directory probes its files once."""
+        corpus_dir = self._settled_corpus(tmp_path)
+        corpus._probe_corpus_files_cached.cache_clear()
+
+        with patch.object(corpus, "_probe_corpus_files", wraps=corpus._probe_corpus_files) as probe:
+            first = corpus.validate_corpus_directory(corpus_dir)
+            second = corpus.validate_corpus_directory(corpus_dir)
+
+        assert first == second == (True, "NLTK", "Valid NLTK corpus")
+        probe.assert_called_once_with(corpus_dir)
+
+    def test_directory_change_invalidates(self, tmp_path):
+        """Test removing a corpus file is seen once the directory mtime moves."""
+        corpus_dir = self._settled_corpus(tmp_path)
+        corpus._probe_corpus_files_cached.cache_clear()
+        assert corpus.validate_corpus_directory(corpus_dir)[0] is True
+
+        (corpus_dir / "nltk_syllables_frequencies.json").unlink()
+
+        assert corpus.validate_corpus_directory(corpus_dir)[0] is False
+
+    def test_recently_modified_directory_is_not_cached(self, tmp_path):
+        """Test a directory changed just now is probed on every call."""
+        corpus_dir = tmp_path / "20260110_115601_nltk"
+        corpus_dir.mkdir()
+        corpus._probe_corpus_files_cached.cache_clear()
+
+        assert corpus.validate_corpus_directory(corpus_dir)[0] is False
+        (corpus_dir / "nltk_syllables_unique.txt").write_text("ka\n", encoding="utf-8")
+        (corpus_dir / "nltk_syllables_frequencies.json").write_text('{"ka": 1}', encoding="utf-8")
+
+        assert corpus.validate_corpus_directory(corpus_dir)[0] is True
+        assert corpus._probe_corpus_files_cached.cache_info().currsize == 0
+
+    def test_missing_and_file_paths(self, tmp_path):
+        """Test non-directories are rejected before any probing."""
+        file_path = tmp_path / "file.txt"
+        file_path.write_text("x", encoding="utf-8")
+
+        assert corpus.validate_corpus_directory(tmp_path / "missing") == (
+            False,
+            "",
+            "Directory does not exist",
+        )
+        assert corpus.validate_corpus_directory(file_path) == (False, "", "Path is not a directory")
+
+    def test_format_corpus_info_matches_get_corpus_info(self, tmp_path):
+        """Test the validated-path formatter matches the validating helper."""
+        corpus_dir = self._settled_corpus(tmp_path)
+
+        assert corpus.format_corpus_info(corpus_dir, "NLTK") == corpus.get_corpus_info(corpus_dir)
+
+
+class TestProbeCorpusFiles:
+    """Tests for the single-pass corpus file probe."""
+
+    def test_detects_pyphen_corpus(self, tmp_path):
+        """Test a directory with only Pyphen files is a Pyphen corpus."""
+        (tmp_path / "pyphen_syllables_unique.txt").write_text("ka\n", encoding="utf-8")
+        (tmp_path / "pyphen_syllables_frequencies.json").write_text("{}", encoding="utf-8")
+        (tmp_path / "notes.txt").write_text("unrelated", encoding="utf-8")
+
+        assert corpus._probe_corpus_files(tmp_path) == (True, "Pyphen", "Valid Pyphen corpus")
+
+    def test_prefers_nltk_when_both_present(self, tmp_path):
+        """Test NLTK is detected first when both layouts are present."""
+        for prefix in ("nltk", "pyphen"):
+            (tmp_path / f"{prefix}_syllables_unique.txt").write_text("ka\n", encoding="utf-8")
+            (tmp_path / f"{prefix}_syllables_frequencies.json").write_text("{}", encoding="utf-8")
+
+        assert corpus._probe_corpus_files(tmp_path)[1] == "NLTK"
+
+    def test_directory_name_picks_layout_first(self, tmp_path):
+        """Test a *_pyphen directory holding both layouts validates as Pyphen."""
+        corpus_dir = tmp_path / "20260110_115601_pyphen"
+        corpus_dir.mkdir()
+        for prefix in ("nltk", "pyphen"):
+            (corpus_dir / f"{prefix}_syllables_unique.txt").write_text("ka\n", encoding="utf-8")
+            (corpus_dir / f"{prefix}_syllables_frequencies.json").write_text("{}", encoding="utf-8")
+
+        assert corpus._probe_corpus_files(corpus_dir)[1] == "Pyphen"
+
+    def test_misnamed_directory_falls_back(self, tmp_path):
+        """Test a directory name that disagrees with its files still validates."""
+        corpus_dir = tmp_path / "20260110_115601_pyphen"
+        corpus_dir.mkdir()
+        (corpus_dir / "nltk_syllables_unique.txt").write_text("ka\n", encoding="utf-8")
+        (corpus_dir / "nltk_syllables_frequencies.json").write_text("{}", encoding="utf-8")
+
+        assert corpus._probe_corpus_files(corpus_dir) == (True, "NLTK", "Valid NLTK corpus")
+
+    def test_rejects_directory_in_place_of_file(self, tmp_path):
+        """Test a required name that is a directory is reported as not a file."""
+        (tmp_path / "nltk_syllables_unique.txt").mkdir()
+        (tmp_path / "nltk_syllables_frequencies.json").write_text("{}", encoding="utf-8")
+
+        assert corpus._probe_corpus_files(tmp_path) == (
+            False,
+            "",
+            "nltk_syllables_unique.txt is not a file",
+        )
+
+    def test_broken_symlink_counts_as_missing(self, tmp_path):
+        """Test a dangling symlink is treated like an absent file."""
+        (tmp_path / "nltk_syllables_unique.txt").symlink_to(tmp_path / "gone.txt")
+        (tmp_path / "nltk_syllables_frequencies.json").write_text("{}", encoding="utf-8")
+
+        is_valid, corpus_type, message = corpus._probe_corpus_files(tmp_path)
+
+        assert (is_valid, corpus_type) == (False, "")
+        assert message.startswith("No corpus files found")
+
+    def test_single_directory_read(self, tmp_path):
+        """Test the probe lists the directory once instead of statting each file."""
+        (tmp_path / "nltk_syllables_unique.txt").write_text("ka\n", encoding="utf-8")
+        (tmp_path / "nltk_syllables_frequencies.json").write_text("{}", encoding="utf-8")
+
+        with (
+            patch.object(corpus.os, "scandir", wraps=os.scandir) as mock_scandir,
+            patch.object(Path, "exists") as mock_exists,
+        ):
+            assert corpus._probe_corpus_files(tmp_path)[0] is True
+
+        mock_scandir.assert_called_once_with(tmp_path)
+        mock_exists.assert_not_called()
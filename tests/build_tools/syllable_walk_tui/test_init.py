@@ -0,0 +1,37 @@
+"""
+Tests for syllable_walk_tui package attributes.
+
+Tests the lazily resolved __version__ attribute.
+"""
+
+from importlib.metadata import PackageNotFoundError
+from unittest.mock import patch
+
+import pytest
+
+import build_tools.syllable_walk_tui as syllable_walk_tui
+import pipeworks_name_generation
+
+
+class TestVersion:
+    """Tests for the module-level __version__ lookup."""
+
+    def test_version_from_metadata(self) -> None:
+        """Test __version__ comes from the installed distribution metadata."""
+        with patch("importlib.metadata.version", return_value="9.9.9") as mock_version:
+            assert syllable_walk_tui.__version__ == "9.9.9"
+
+        mock_version.assert_called_once_with("pipeworks-name-generation")
+
+    def test_version_falls_back_to_source_tree(self) -> None:
+        """Test __version__ uses the in-tree package version when not installed."""
+        with patch(
+            "importlib.metadata.version",
+            side_effect=PackageNotFoundError("pipeworks-name-generation"),
+        ):
+            assert syllable_walk_tui.__version__ == pipeworks_name_generation.__version__
+
+    def test_unknown_attribute_raises(self) -> None:
+        """Test other missing attributes still raise AttributeError."""
+        with pytest.raises(AttributeError, match="no_such_attribute"):
+            syllable_walk_tui.no_such_attribute  # noqa: B018
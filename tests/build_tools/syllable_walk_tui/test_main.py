@@ -4,6 +4,8 @@ Tests for syllable_walk_tui entry point.
 Tests the main() function and exception handling.
 """
 
+import subprocess
+import sys
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -19,7 +21,7 @@ class TestMain:
         mock_app = MagicMock()
 
         with patch(
-            "build_tools.syllable_walk_tui.__main__.SyllableWalkerApp",
+            "build_tools.syllable_walk_tui.core.SyllableWalkerApp",
             return_value=mock_app,
         ):
             result = main()
@@ -30,7 +32,7 @@ class TestMain:
     def test_main_returns_130_on_keyboard_interrupt(self) -> None:
         """Test that main returns 130 on KeyboardInterrupt."""
         with patch(
-            "build_tools.syllable_walk_tui.__main__.SyllableWalkerApp",
+            "build_tools.syllable_walk_tui.core.SyllableWalkerApp",
             side_effect=KeyboardInterrupt(),
         ):
             result = main()
@@ -40,7 +42,7 @@ class TestMain:
     def test_main_returns_1_on_exception(self, capsys: pytest.CaptureFixture[str]) -> None:
         """Test that main returns 1 on general exception."""
         with patch(
-            "build_tools.syllable_walk_tui.__main__.SyllableWalkerApp",
+            "build_tools.syllable_walk_tui.core.SyllableWalkerApp",
             side_effect=RuntimeError("Test error"),
         ):
             result = main()
@@ -54,7 +56,7 @@ class TestMain:
         mock_app = MagicMock()
 
         with patch(
-            "build_tools.syllable_walk_tui.__main__.SyllableWalkerApp",
+            "build_tools.syllable_walk_tui.core.SyllableWalkerApp",
             return_value=mock_app,
         ):
             # args are currently unused but should be accepted
@@ -68,7 +70,7 @@ class TestMain:
         mock_app.run.side_effect = KeyboardInterrupt()
 
         with patch(
-            "build_tools.syllable_walk_tui.__main__.SyllableWalkerApp",
+            "build_tools.syllable_walk_tui.core.SyllableWalkerApp",
             return_value=mock_app,
         ):
             result = main()
@@ -81,7 +83,7 @@ class TestMain:
         mock_app.run.side_effect = RuntimeError("Runtime failure")
 
         with patch(
-            "build_tools.syllable_walk_tui.__main__.SyllableWalkerApp",
+            "build_tools.syllable_walk_tui.core.SyllableWalkerApp",
             return_value=mock_app,
         ):
             result = main()
@@ -89,3 +91,15 @@ class TestMain:
         assert result == 1
         captured = capsys.readouterr()
         assert "Error: Runtime failure" in captured.err
+
+    def test_importing_entry_point_does_not_load_app(self) -> None:
+        """Test the app module is only imported when main() runs."""
+        code = (
+            "import sys, build_tools.syllable_walk_tui.__main__; "
+            "print('build_tools.syllable_walk_tui.core' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "False"
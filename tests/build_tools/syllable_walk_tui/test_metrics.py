@@ -149,6 +149,12 @@ class TestInventoryMetrics:
         assert metrics.length_max == 5
         assert metrics.length_distribution == {1: 1, 2: 1, 3: 1, 4: 1, 5: 1}
 
+    def test_length_distribution_in_ascending_order(self):
+        """Test lengths are stored sorted so displays can skip sorting."""
+        metrics = compute_inventory_metrics(["strax", "a", "kran", "ka", "kra", "ki"])
+
+        assert list(metrics.length_distribution) == [1, 2, 3, 4, 5]
+
     def test_empty_list_raises_error(self):
         """Test that empty syllable list raises ValueError."""
         with pytest.raises(ValueError, match="empty"):
@@ -7,8 +7,12 @@ Tests for PatchPanel, CombinerPanel, and SelectorPanel widgets.
 import pytest
 from textual.widgets import Label
 
+from build_tools.syllable_walk_tui.controls import ProfileOption
+from build_tools.syllable_walk_tui.core import app as app_module
+from build_tools.syllable_walk_tui.modules.analyzer import StatsPanel
 from build_tools.syllable_walk_tui.modules.generator import CombinerPanel, SelectorPanel
 from build_tools.syllable_walk_tui.modules.oscillator import OscillatorPanel
+from build_tools.syllable_walk_tui.modules.oscillator.panel import PARAM_SPECS, PROFILE_OPTIONS
 
 # Backward compatibility alias for tests
 PatchPanel = OscillatorPanel
@@ -41,6 +45,74 @@ class TestPatchPanel:
             # Check for corpus status label
             assert pilot.app.query_one("#corpus-status-A")
 
+    @pytest.mark.asyncio
+    async def test_compose_builds_controls_from_specs(self):
+        """Test every profile option and parameter spec becomes a patch widget."""
+        from textual.app import App
+
+        class TestApp(App):
+            def compose(self):
+                yield PatchPanel("B")
+
+        async with TestApp().run_test() as pilot:
+            for name, _, is_selected in PROFILE_OPTIONS:
+                option = pilot.app.query_one(f"#profile-{name}-B", ProfileOption)
+                assert option.is_selected is is_selected
+
+            for control_cls, id_stem, label, options in PARAM_SPECS:
+                control = pilot.app.query_one(f"#{id_stem}-B", control_cls)
+                assert control.label_text == label
+                assert control.value == options["value"]
+
+    @pytest.mark.asyncio
+    async def test_group_gaps_come_from_css(self):
+        """Test blank rows between control groups need no spacer widgets."""
+        from build_tools.syllable_walk_tui.core import SyllableWalkerApp
+
+        app = SyllableWalkerApp()
+
+        async with app.run_test(size=(200, 120)):
+            panel = app.query_one("#patch-a", PatchPanel)
+            assert not panel.query(".spacer")
+
+            status = app.query_one("#corpus-status-A").region
+            header = panel.query_one(".section-header").region
+            generate = app.query_one("#generate-A").region
+            output = app.query_one("#walks-output-A").region
+            seed = app.query_one("#seed-A").region
+            walk_count = app.query_one("#walk-count-A").region
+
+            # Rows between the bottom of one widget and the top of the next
+            assert header.y - status.bottom == 3
+            assert walk_count.y - seed.bottom == 1
+            assert output.y - generate.bottom == 2
+
+
+class TestStatsPanel:
+    """Tests for StatsPanel widget."""
+
+    @pytest.mark.asyncio
+    async def test_patch_sections_separated_by_css(self):
+        """Test both patch sections compose with a two-row gap and no spacers."""
+        from pathlib import Path
+
+        from textual.app import App
+
+        class TestApp(App):
+            CSS_PATH = Path(app_module.__file__).with_name("styles.tcss")
+
+            def compose(self):
+                yield StatsPanel()
+
+        app = TestApp()
+        async with app.run_test():
+            assert not app.query(".spacer")
+            output_a = app.query_one("#walks-output-A").region
+            header_b = app.query_one("#walks-header-B").region
+
+            assert app.query_one("#walks-corpus-B")
+            assert header_b.y - output_a.bottom == 2
+
 
 class TestCombinerPanel:
     """Tests for CombinerPanel widget (name generation)."""
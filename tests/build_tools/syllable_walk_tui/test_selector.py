@@ -22,6 +22,7 @@ class TestSelectorEventHandlers:
         async with app.run_test():
             event = IntSpinner.Changed(value=50, widget_id="selector-count-a")
             app.on_int_spinner_changed(event)
+            app._flush_params()
 
             assert app.state.selector_a.count == 50
 
@@ -35,6 +36,7 @@ class TestSelectorEventHandlers:
         async with app.run_test():
             event = IntSpinner.Changed(value=200, widget_id="selector-count-b")
             app.on_int_spinner_changed(event)
+            app._flush_params()
 
             assert app.state.selector_b.count == 200
 
@@ -108,6 +110,7 @@ class TestSelectorEventHandlers:
 
             event_b = IntSpinner.Changed(value=200, widget_id="selector-count-b")
             app.on_int_spinner_changed(event_b)
+            app._flush_params()
 
             assert app.state.selector_a.count == 50
             assert app.state.selector_b.count == 200
@@ -138,6 +141,7 @@ class TestSelectorEventHandlers:
             app.state.selector_a.count_mode = "unique"
             event = IntSpinner.Changed(value=120, widget_id="selector-count-a")
             app.on_int_spinner_changed(event)
+            app._flush_params()
 
             assert app.state.selector_a.count_mode == "manual"
 
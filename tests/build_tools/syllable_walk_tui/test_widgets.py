@@ -89,6 +89,24 @@ class TestCorpusBrowserScreen:
             assert screen.query_one("#select-button", Button)
             assert screen.query_one("#cancel-button", Button)
 
+    @pytest.mark.asyncio
+    async def test_shared_layout_applies_to_subclass(self, tmp_path):
+        """Test the browser layout shared from the base screen styles the corpus modal."""
+        screen = CorpusBrowserScreen(tmp_path)
+
+        from textual.app import App
+
+        class TestApp(App):
+            async def on_mount(self):
+                await self.push_screen(screen)
+
+        async with TestApp().run_test():
+            container = screen.query_one("#browser-container")
+            width, height = container.styles.width, container.styles.height
+            assert width is not None and height is not None
+            assert (width.value, height.value) == (80, 30)
+            assert screen.styles.align_horizontal == "center"
+
     @pytest.mark.asyncio
     async def test_initial_directory_set(self, tmp_path):
         """Test that browser starts at specified initial directory."""
@@ -6,7 +6,7 @@ Tests FloatSlider, IntSpinner, SeedInput, RadioOption, and DirectoryBrowserScree
 
 from pathlib import Path
 from typing import Any
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 from textual.app import App
@@ -136,6 +136,10 @@ class TestIntSpinner:
         assert "j" in binding_keys
         assert "k" in binding_keys
 
+    def test_focusable_before_mount(self):
+        """Test the widget is in the focus chain without a mount handler."""
+        assert IntSpinner("Test", 5, 1, 10).can_focus is True
+
 
 class TestIntSpinnerMessages:
     """Tests for IntSpinner message posting."""
@@ -244,6 +248,10 @@ class TestFloatSlider:
         assert "j" in binding_keys
         assert "k" in binding_keys
 
+    def test_focusable_before_mount(self):
+        """Test the widget is in the focus chain without a mount handler."""
+        assert FloatSlider("Test", 0.5, 0.0, 1.0).can_focus is True
+
 
 # =============================================================================
 # SeedInput Tests
@@ -354,6 +362,10 @@ class TestRadioOption:
 
         assert option.is_selected is False
 
+    def test_focusable_before_mount(self):
+        """Test options are in the focus chain without a mount handler."""
+        assert RadioOption("slow", "Thorough analysis").can_focus is True
+
     def test_set_selected_updates_state(self):
         """Test set_selected method updates selection state."""
         option = RadioOption("test", "Test option")
@@ -916,3 +928,54 @@ class TestControlsIntegration:
             # Now B should be selected, A deselected
             assert opt_a.is_selected is False
             assert opt_b.is_selected is True
+
+    @pytest.mark.asyncio
+    async def test_value_displays_update_without_dom_queries(self):
+        """Test value labels are updated through references kept from compose."""
+
+        class TestApp(App):
+            def compose(self):
+                yield IntSpinner(
+                    "Count",
+                    value=5,
+                    min_val=0,
+                    max_val=10,
+                    suffix_fn=lambda v: f"-> {v + 1}",
+                    id="spinner",
+                )
+                yield FloatSlider("Temp", value=0.5, min_val=0.0, max_val=1.0, id="slider")
+                yield SeedInput(value=7, id="seed")
+
+        async with TestApp().run_test() as pilot:
+            app = pilot.app
+            spinner = app.query_one("#spinner", IntSpinner)
+            slider = app.query_one("#slider", FloatSlider)
+            seed = app.query_one("#seed", SeedInput)
+
+            with (
+                patch.object(spinner, "query_one") as spinner_query,
+                patch.object(slider, "query_one") as slider_query,
+                patch.object(seed, "query_one") as seed_query,
+            ):
+                spinner.action_increment()
+                slider.action_increment()
+                seed._handle_input_change("42")
+
+            spinner_query.assert_not_called()
+            slider_query.assert_not_called()
+            seed_query.assert_not_called()
+            assert str(spinner.query_one("#value-display", Label).render()) == "[ 6]"
+            assert str(spinner.query_one("#suffix-display", Label).render()) == "-> 7"
+            assert str(slider.query_one("#value-display", Label).render()) == "[0.6]"
+            assert str(seed.query_one("#seed-used", Label).render()) == "42"
+
+    def test_display_update_before_compose_is_noop(self):
+        """Test value changes before compose do not fail."""
+        spinner = IntSpinner("Count", value=5, min_val=0, max_val=10)
+        slider = FloatSlider("Temp", value=0.5, min_val=0.0, max_val=1.0)
+
+        spinner.set_value(8)
+        slider.set_value(0.9)
+
+        assert spinner.value == 8
+        assert slider.value == 0.9
@@ -403,6 +403,28 @@ class TestDiscoverInputFiles:
         file_names = [f.name for f in files]
         assert file_names == ["a.txt", "b.txt", "c.txt"]
 
+    def test_discover_files_excludes_matching_directories(self, tmp_path: Path):
+        """Test that directories whose names match the pattern are skipped."""
+        (tmp_path / "file1.txt").touch()
+        (tmp_path / "folder.txt").mkdir()
+        (tmp_path / "folder.txt" / "nested.txt").touch()
+
+        flat = discover_input_files(tmp_path, pattern="*.txt")
+        nested = discover_input_files(tmp_path, pattern="*.txt", recursive=True)
+
+        assert [f.name for f in flat] == ["file1.txt"]
+        assert [f.name for f in nested] == ["file1.txt", "nested.txt"]
+
+    def test_discover_files_complex_pattern(self, tmp_path: Path):
+        """Test that non-suffix patterns still use glob matching."""
+        (tmp_path / "corpus_a.txt").touch()
+        (tmp_path / "corpus_b.txt").touch()
+        (tmp_path / "notes.txt").touch()
+
+        files = discover_input_files(tmp_path, pattern="corpus_?.txt")
+
+        assert [f.name for f in files] == ["corpus_a.txt", "corpus_b.txt"]
+
     def test_discover_files_nonexistent_directory(self, tmp_path: Path):
         """Test that FileNotFoundError is raised for nonexistent directory."""
         nonexistent = tmp_path / "nonexistent"
@@ -481,6 +503,24 @@ class TestFrequencyAnalyzer:
 
         assert loaded == frequencies
 
+    def test_save_frequencies_format_matches_stdlib(self, tmp_path: Path, monkeypatch):
+        """Test that saved JSON matches stdlib formatting with and without orjson."""
+        from build_tools.pyphen_syllable_normaliser import frequency
+
+        analyzer = FrequencyAnalyzer()
+        frequencies = {"ra": 162, "ka": 187, "mé": 145}
+        expected = json.dumps(frequencies, indent=2, sort_keys=True, ensure_ascii=False) + "\n"
+
+        output_file = tmp_path / "frequencies.json"
+        analyzer.save_frequencies(frequencies, output_file)
+        assert output_file.read_text(encoding="utf-8") == expected
+
+        # Force the stdlib fallback path
+        monkeypatch.setattr(frequency, "orjson", None)
+        fallback_file = tmp_path / "frequencies_stdlib.json"
+        analyzer.save_frequencies(frequencies, fallback_file)
+        assert fallback_file.read_text(encoding="utf-8") == expected
+
     def test_save_and_load_unique_syllables(self, tmp_path: Path):
         """Test saving and loading unique syllables."""
         analyzer = FrequencyAnalyzer()
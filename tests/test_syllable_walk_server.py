@@ -21,6 +21,17 @@ from build_tools.syllable_walk_web.server import (
     find_available_port,
     run_server,
 )
+from build_tools.syllable_walk_web.web_assets import (
+    CSS_ASSET,
+    CSS_PATH,
+    HTML_CACHE_CONTROL,
+    IMMUTABLE_CACHE_CONTROL,
+    JS_ASSET,
+    JS_PATH,
+    REVALIDATE_CACHE_CONTROL,
+    StaticAsset,
+    render_html,
+)
 
 # ============================================================
 # Fixtures
@@ -164,6 +175,10 @@ class TestSimplifiedWalkerHandlerAttributes:
         assert hasattr(SimplifiedWalkerHandler, "verbose")
         assert isinstance(SimplifiedWalkerHandler.verbose, bool)
 
+    def test_class_disables_nagle(self):
+        """Test handler sets TCP_NODELAY on accepted connections."""
+        assert SimplifiedWalkerHandler.disable_nagle_algorithm is True
+
 
 # ============================================================
 # Handler Method Tests
@@ -225,6 +240,75 @@ class TestResponseMethods:
         # Should not raise
         handler._send_response("test content")
 
+    def test_send_static_writes_identity_without_accept_encoding(self):
+        """Test _send_static writes uncompressed bytes and ETag by default."""
+        handler = MagicMock(spec=SimplifiedWalkerHandler)
+        handler.wfile = io.BytesIO()
+        handler.headers = {}
+        asset = StaticAsset.from_bytes(b"body { color: red; }" * 20, "text/css")
+
+        handler._send_static = SimplifiedWalkerHandler._send_static.__get__(
+            handler, SimplifiedWalkerHandler
+        )
+        handler._send_static(asset, "no-cache")
+
+        handler.send_response.assert_called_once_with(200)
+        handler.send_header.assert_any_call("Cache-Control", "no-cache")
+        handler.send_header.assert_any_call("Content-Length", str(len(asset.body)))
+        handler.send_header.assert_any_call("ETag", asset.etag)
+        handler.send_header.assert_any_call("Vary", "Accept-Encoding")
+        header_names = [c[0][0] for c in handler.send_header.call_args_list]
+        assert "Content-Encoding" not in header_names
+        assert handler.wfile.getvalue() == asset.body
+
+    def test_send_static_writes_gzip_when_accepted(self):
+        """Test _send_static serves the precompressed gzip variant."""
+        handler = MagicMock(spec=SimplifiedWalkerHandler)
+        handler.wfile = io.BytesIO()
+        handler.headers = {"Accept-Encoding": "gzip, deflate"}
+        asset = StaticAsset.from_bytes(b"body { color: red; }" * 20, "text/css")
+
+        handler._send_static = SimplifiedWalkerHandler._send_static.__get__(
+            handler, SimplifiedWalkerHandler
+        )
+        handler._send_static(asset, "no-cache")
+
+        handler.send_header.assert_any_call("Content-Encoding", "gzip")
+        handler.send_header.assert_any_call("ETag", asset.etag_for("gzip"))
+        assert handler.wfile.getvalue() == asset.gzip_body
+
+    def test_send_static_returns_304_for_matching_etag(self):
+        """Test _send_static short-circuits with 304 when If-None-Match matches."""
+        handler = MagicMock(spec=SimplifiedWalkerHandler)
+        handler.wfile = io.BytesIO()
+        handler.headers = {"If-None-Match": CSS_ASSET.etag}
+
+        handler._send_static = SimplifiedWalkerHandler._send_static.__get__(
+            handler, SimplifiedWalkerHandler
+        )
+        handler._send_static(CSS_ASSET, IMMUTABLE_CACHE_CONTROL)
+
+        handler.send_response.assert_called_once_with(304)
+        handler.send_header.assert_any_call("ETag", CSS_ASSET.etag)
+        handler.send_header.assert_any_call("Cache-Control", IMMUTABLE_CACHE_CONTROL)
+        handler.send_header.assert_any_call("Vary", "Accept-Encoding")
+        header_names = [c[0][0] for c in handler.send_header.call_args_list]
+        assert "Content-Length" not in header_names
+        assert handler.wfile.getvalue() == b""
+
+    def test_send_static_handles_broken_pipe(self):
+        """Test _send_static handles BrokenPipeError gracefully."""
+        handler = MagicMock(spec=SimplifiedWalkerHandler)
+        handler.headers = {}
+        handler.send_response.side_effect = BrokenPipeError()
+
+        handler._send_static = SimplifiedWalkerHandler._send_static.__get__(
+            handler, SimplifiedWalkerHandler
+        )
+
+        # Should not raise
+        handler._send_static(CSS_ASSET, IMMUTABLE_CACHE_CONTROL)
+
     def test_send_json_response(self):
         """Test _send_json_response serializes and sends JSON."""
         handler = MagicMock(spec=SimplifiedWalkerHandler)
@@ -268,32 +352,52 @@ class TestDoGET:
     """Test do_GET request handling."""
 
     def test_get_root_returns_html(self):
-        """Test GET / returns HTML page."""
+        """Test GET / routes to _handle_index."""
         handler = MagicMock(spec=SimplifiedWalkerHandler)
         handler.path = "/"
         handler._parse_path = MagicMock(return_value=("/", {}))
-        handler._send_response = MagicMock()
+        handler._handle_index = MagicMock()
 
         handler.do_GET = SimplifiedWalkerHandler.do_GET.__get__(handler, SimplifiedWalkerHandler)
         handler.do_GET()
 
-        handler._send_response.assert_called_once()
-        call_args = handler._send_response.call_args
-        assert call_args[1]["content_type"] == "text/html"
+        handler._handle_index.assert_called_once()
 
     def test_get_styles_returns_css(self):
         """Test GET /styles.css returns CSS."""
         handler = MagicMock(spec=SimplifiedWalkerHandler)
         handler.path = "/styles.css"
         handler._parse_path = MagicMock(return_value=("/styles.css", {}))
-        handler._send_response = MagicMock()
+        handler._send_static = MagicMock()
 
         handler.do_GET = SimplifiedWalkerHandler.do_GET.__get__(handler, SimplifiedWalkerHandler)
         handler.do_GET()
 
-        handler._send_response.assert_called_once()
-        call_args = handler._send_response.call_args
-        assert call_args[1]["content_type"] == "text/css"
+        handler._send_static.assert_called_once_with(CSS_ASSET, REVALIDATE_CACHE_CONTROL)
+
+    def test_get_hashed_styles_is_immutable(self):
+        """Test GET of the content-hashed stylesheet URL uses immutable caching."""
+        handler = MagicMock(spec=SimplifiedWalkerHandler)
+        handler.path = CSS_PATH
+        handler._parse_path = MagicMock(return_value=(CSS_PATH, {}))
+        handler._send_static = MagicMock()
+
+        handler.do_GET = SimplifiedWalkerHandler.do_GET.__get__(handler, SimplifiedWalkerHandler)
+        handler.do_GET()
+
+        handler._send_static.assert_called_once_with(CSS_ASSET, IMMUTABLE_CACHE_CONTROL)
+
+    def test_get_hashed_script_is_immutable(self):
+        """Test GET of the content-hashed script URL uses immutable caching."""
+        handler = MagicMock(spec=SimplifiedWalkerHandler)
+        handler.path = JS_PATH
+        handler._parse_path = MagicMock(return_value=(JS_PATH, {}))
+        handler._send_static = MagicMock()
+
+        handler.do_GET = SimplifiedWalkerHandler.do_GET.__get__(handler, SimplifiedWalkerHandler)
+        handler.do_GET()
+
+        handler._send_static.assert_called_once_with(JS_ASSET, IMMUTABLE_CACHE_CONTROL)
 
     def test_get_unknown_path_returns_404(self):
         """Test GET unknown path returns 404."""
@@ -556,6 +660,9 @@ class TestHandleListRuns:
             MagicMock(to_dict=MagicMock(return_value={"id": "run2"})),
         ]
 
+        handler._runs_payload = SimplifiedWalkerHandler._runs_payload.__get__(
+            handler, SimplifiedWalkerHandler
+        )
         handler._handle_list_runs = SimplifiedWalkerHandler._handle_list_runs.__get__(
             handler, SimplifiedWalkerHandler
         )
@@ -578,6 +685,9 @@ class TestHandleListRuns:
         handler = MagicMock(spec=SimplifiedWalkerHandler)
         handler._send_json_response = MagicMock()
 
+        handler._runs_payload = SimplifiedWalkerHandler._runs_payload.__get__(
+            handler, SimplifiedWalkerHandler
+        )
         handler._handle_list_runs = SimplifiedWalkerHandler._handle_list_runs.__get__(
             handler, SimplifiedWalkerHandler
         )
@@ -596,6 +706,9 @@ class TestHandleListRuns:
         handler = MagicMock(spec=SimplifiedWalkerHandler)
         handler._send_error_response = MagicMock()
 
+        handler._runs_payload = SimplifiedWalkerHandler._runs_payload.__get__(
+            handler, SimplifiedWalkerHandler
+        )
         handler._handle_list_runs = SimplifiedWalkerHandler._handle_list_runs.__get__(
             handler, SimplifiedWalkerHandler
         )
@@ -610,6 +723,40 @@ class TestHandleListRuns:
         assert "Discovery failed" in str(handler._send_error_response.call_args)
 
 
+class TestHandleIndex:
+    """Test _handle_index method."""
+
+    def test_handle_index_embeds_runs(self):
+        """Test _handle_index renders the shell with the run list embedded."""
+        SimplifiedWalkerHandler.current_run = None
+
+        handler = MagicMock(spec=SimplifiedWalkerHandler)
+        handler._send_static = MagicMock()
+        handler._runs_payload = MagicMock(return_value={"runs": [], "current_run": None})
+        handler._handle_index = SimplifiedWalkerHandler._handle_index.__get__(
+            handler, SimplifiedWalkerHandler
+        )
+
+        handler._handle_index()
+
+        expected = render_html(json.dumps({"runs": [], "current_run": None}))
+        handler._send_static.assert_called_once_with(expected, HTML_CACHE_CONTROL)
+        assert b'"current_run": null' in expected.body
+
+    def test_handle_index_falls_back_when_discovery_fails(self):
+        """Test _handle_index serves the shell without data on discovery errors."""
+        handler = MagicMock(spec=SimplifiedWalkerHandler)
+        handler._send_static = MagicMock()
+        handler._runs_payload = MagicMock(side_effect=Exception("Discovery failed"))
+        handler._handle_index = SimplifiedWalkerHandler._handle_index.__get__(
+            handler, SimplifiedWalkerHandler
+        )
+
+        handler._handle_index()
+
+        handler._send_static.assert_called_once_with(render_html("null"), HTML_CACHE_CONTROL)
+
+
 class TestHandleGetSelection:
     """Test _handle_get_selection method."""
 
@@ -0,0 +1,353 @@
+"""Tests for the syllable walker web interface static assets.
+
+This module tests the pre-encoded asset constants in web_assets:
+- UTF-8 payloads match the source templates
+- ETags are strong, quoted, and stable for identical content
+- Precompressed variants and Accept-Encoding negotiation
+- Conditional request evaluation (If-None-Match / If-Modified-Since)
+- Import-time minification of served payloads
+"""
+
+import gzip
+import json
+import re
+from email.utils import formatdate
+
+import pytest
+
+from build_tools.syllable_walk_web import web_assets
+from build_tools.syllable_walk_web.web_assets import (
+    BUILD_TIME,
+    BUILD_TIMESTAMP,
+    CSS_ASSET,
+    CSS_BYTES,
+    CSS_CONTENT,
+    CSS_ETAG,
+    CSS_PATH,
+    HTML_CACHE_CONTROL,
+    HTML_CONTENT,
+    HTML_TEMPLATE,
+    IMMUTABLE_CACHE_CONTROL,
+    JS_ASSET,
+    JS_BYTES,
+    JS_CONTENT,
+    JS_ETAG,
+    JS_PATH,
+    StaticAsset,
+    _accepted_encodings,
+    _make_etag,
+    maybe_not_modified,
+    minify_css,
+    minify_html,
+    minify_js,
+    render_html,
+)
+
+
+class TestEncodedAssets:
+    """Test pre-encoded asset payloads."""
+
+    def test_html_bytes_match_rendered_template(self):
+        """Test the shell template has all placeholders filled except run data."""
+        assert "__CSS_PATH__" in HTML_TEMPLATE and "__JS_PATH__" in HTML_TEMPLATE
+        assert "__CSS_PATH__" not in HTML_CONTENT
+        assert "__JS_PATH__" not in HTML_CONTENT
+        assert "__INITIAL_RUNS__" in HTML_CONTENT
+
+    def test_html_links_hashed_assets(self):
+        """Test the shell links the content-hashed stylesheet and script URLs."""
+        assert f'href="{CSS_PATH}"' in HTML_CONTENT
+        assert f'<script type="module" src="{JS_PATH}"></script>' in HTML_CONTENT
+        assert CSS_PATH == f"/styles.{CSS_ETAG[1:9]}.css"
+        assert JS_PATH == f"/app.{JS_ETAG[1:9]}.js"
+
+    def test_html_has_no_inline_script(self):
+        """Test the script lives in JS_CONTENT rather than inline in the shell."""
+        assert "<script>" not in HTML_CONTENT
+        assert "async function loadRuns()" in JS_CONTENT
+        assert JS_BYTES == minify_js(JS_CONTENT).encode("utf-8")
+        assert JS_ASSET.body == JS_BYTES
+        assert JS_ASSET.content_type == "application/javascript; charset=utf-8"
+
+    def test_js_aborts_superseded_requests(self):
+        """Test walk and selection fetches are cancellable and ignore aborts."""
+        assert "new AbortController()" in JS_CONTENT
+        assert "signal" in JS_CONTENT
+        assert JS_CONTENT.count("error.name === 'AbortError'") == 2
+        assert ".then(" not in JS_CONTENT
+
+    def test_js_renders_walk_without_html_parsing(self):
+        """Test walk syllables are inserted as text nodes, not HTML."""
+        assert "document.createDocumentFragment()" in JS_CONTENT
+        assert "syl.textContent = step.syllable" in JS_CONTENT
+        assert "resultEl.replaceChildren(frag)" in JS_CONTENT
+        assert "&rarr;" not in JS_CONTENT
+
+    def test_walk_separators_drawn_by_css(self):
+        """Test walk arrows come from a CSS pseudo-element, not script text."""
+        assert "\\u2192" not in JS_CONTENT
+        assert ".walk-path span + span::before" in CSS_CONTENT
+        assert 'content: "\u2192"' in CSS_CONTENT
+
+    def test_selection_rows_joined_once(self):
+        """Test selection table rows are collected and joined, not appended."""
+        assert "parts.push(`" in JS_CONTENT
+        assert "contentEl.innerHTML = parts.join('')" in JS_CONTENT
+
+    def test_initial_run_selection_deferred_past_first_paint(self):
+        """Test the startup walker load is scheduled instead of run during parse."""
+        assert "afterPaint(selectRun)" in JS_CONTENT
+        assert "requestIdleCallback" in JS_CONTENT
+        assert "await selectRun()" not in JS_CONTENT
+
+    def test_element_map_ids_exist_in_shell(self):
+        """Test every cached element id is present in the HTML shell."""
+        ids = re.findall(r"document\.getElementById\('([\w-]+)'\)", JS_CONTENT)
+        assert ids
+        assert JS_CONTENT.count("document.getElementById(") == len(set(ids))
+        for element_id in ids:
+            assert f'id="{element_id}"' in HTML_TEMPLATE
+
+    def test_shell_has_no_inline_handlers(self):
+        """Test controls are wired with addEventListener instead of attributes."""
+        for attribute in ("onclick=", "onchange=", ".onclick"):
+            assert attribute not in HTML_TEMPLATE
+            assert attribute not in JS_CONTENT
+        assert "EL.walkBtn.addEventListener('click', generateWalk)" in JS_CONTENT
+        assert "EL.selectionTabs.addEventListener('click'" in JS_CONTENT
+
+    def test_run_changes_are_debounced(self):
+        """Test run select changes are coalesced before loading a walker."""
+        assert "EL.runSelect.addEventListener('change', onRunChange)" in JS_CONTENT
+        assert "setTimeout(selectRun, 150)" in JS_CONTENT
+        assert "clearTimeout(runChangeTimer)" in JS_CONTENT
+
+    def test_payloads_are_clean_utf8(self):
+        """Test served text decodes as UTF-8 and has no double-encoded arrows."""
+        assert CSS_ASSET.content_type == "text/css; charset=utf-8"
+        for payload in (CSS_BYTES, JS_BYTES, render_html().body):
+            text = payload.decode("utf-8")
+            assert "\u00e2\u2020" not in text
+        assert "\u2192".encode() in CSS_BYTES
+
+    def test_css_bytes_are_minified_content(self):
+        """Test CSS_BYTES is the UTF-8 encoding of the minified CSS_CONTENT."""
+        assert CSS_BYTES == minify_css(CSS_CONTENT).encode("utf-8")
+        assert len(CSS_BYTES) < len(CSS_CONTENT.encode("utf-8"))
+
+
+class TestEtags:
+    """Test precomputed ETag validators."""
+
+    def test_etags_are_quoted(self):
+        """Test ETags are strong validators wrapped in double quotes."""
+        for etag in (render_html().etag, CSS_ETAG, JS_ETAG):
+            assert etag.startswith('"') and etag.endswith('"')
+            assert not etag.startswith("W/")
+
+    def test_etag_is_deterministic(self):
+        """Test identical payloads produce identical ETags."""
+        assert _make_etag(CSS_BYTES) == CSS_ETAG
+        assert _make_etag(b"a") == _make_etag(b"a")
+        assert _make_etag(b"a") != _make_etag(b"b")
+
+
+class TestCachePolicies:
+    """Test Cache-Control policies for shared caches."""
+
+    def test_hashed_assets_are_publicly_cacheable(self):
+        """Test content-hashed URLs may be stored by proxies and CDNs."""
+        directives = {d.strip() for d in IMMUTABLE_CACHE_CONTROL.split(",")}
+        assert {"public", "immutable", "max-age=31536000"} <= directives
+
+    def test_shell_is_kept_out_of_shared_caches(self):
+        """Test the run-list shell is browser-private and always revalidated."""
+        directives = {d.strip() for d in HTML_CACHE_CONTROL.split(",")}
+        assert directives == {"private", "no-cache"}
+
+
+class TestAcceptedEncodings:
+    """Test Accept-Encoding header parsing."""
+
+    def test_missing_header(self):
+        """Test that an absent header accepts nothing."""
+        assert _accepted_encodings(None) == (set(), set())
+        assert _accepted_encodings("") == (set(), set())
+
+    def test_parses_codings_and_quality(self):
+        """Test coding names are normalized and q=0 codings are dropped."""
+        accepted, refused = _accepted_encodings("GZip, br;q=0, deflate;q=0.5")
+        assert accepted == {"gzip", "deflate"}
+        assert refused == {"br"}
+
+    def test_invalid_quality_is_refused(self):
+        """Test malformed q values are treated as refusal."""
+        assert _accepted_encodings("gzip;q=abc") == (set(), {"gzip"})
+
+
+class TestStaticAsset:
+    """Test precompressed StaticAsset variants."""
+
+    def test_module_assets_wrap_encoded_payloads(self):
+        """Test CSS_ASSET carries the pre-encoded bytes."""
+        assert CSS_ASSET.body == CSS_BYTES
+        assert CSS_ASSET.etag == CSS_ETAG
+
+    def test_gzip_variant_round_trips(self):
+        """Test gzip variant decompresses to the original body."""
+        assert CSS_ASSET.gzip_body is not None
+        assert gzip.decompress(CSS_ASSET.gzip_body) == CSS_BYTES
+        assert len(CSS_ASSET.gzip_body) < len(CSS_BYTES)
+
+    def test_gzip_variant_is_deterministic(self):
+        """Test compressing the same bytes twice gives identical output."""
+        first = StaticAsset.from_bytes(CSS_BYTES, "text/css")
+        second = StaticAsset.from_bytes(CSS_BYTES, "text/css")
+        assert first.gzip_body == second.gzip_body
+
+    def test_incompressible_payload_skips_gzip(self):
+        """Test tiny payloads that do not shrink keep only the raw body."""
+        asset = StaticAsset.from_bytes(b"x", "text/plain")
+        assert asset.gzip_body is None
+        assert asset.pick_encoding("gzip") == (b"x", "identity")
+
+    def test_pick_encoding_prefers_gzip_when_accepted(self):
+        """Test gzip is chosen when accepted and Brotli is unavailable."""
+        asset = StaticAsset(
+            content_type="text/css", body=b"raw", etag='"e"', gzip_body=b"gz", br_body=None
+        )
+        assert asset.pick_encoding("gzip, br") == (b"gz", "gzip")
+        assert asset.pick_encoding("*") == (b"gz", "gzip")
+        assert asset.pick_encoding("identity") == (b"raw", "identity")
+        assert asset.pick_encoding(None) == (b"raw", "identity")
+
+    def test_wildcard_does_not_override_refused_gzip(self):
+        """Test "*" does not select gzip when gzip is explicitly refused."""
+        asset = StaticAsset(
+            content_type="text/css", body=b"raw", etag='"e"', gzip_body=b"gz", br_body=None
+        )
+        assert asset.pick_encoding("gzip;q=0, *") == (b"raw", "identity")
+
+    def test_pick_encoding_prefers_brotli(self):
+        """Test Brotli is chosen over gzip when both are accepted."""
+        asset = StaticAsset(
+            content_type="text/css", body=b"raw", etag='"e"', gzip_body=b"gz", br_body=b"br"
+        )
+        assert asset.pick_encoding("gzip, br") == (b"br", "br")
+        assert asset.pick_encoding("gzip") == (b"gz", "gzip")
+
+    def test_etag_for_variants(self):
+        """Test each encoding gets a distinct strong ETag."""
+        asset = StaticAsset(content_type="text/css", body=b"raw", etag='"abc"')
+        assert asset.etag_for("identity") == '"abc"'
+        assert asset.etag_for("gzip") == '"abc-gzip"'
+        assert asset.etag_for("br") == '"abc-br"'
+
+    def test_without_brotli_no_br_variant(self, monkeypatch: pytest.MonkeyPatch):
+        """Test Brotli variant is omitted when the package is not installed."""
+        monkeypatch.setattr(web_assets, "brotli", None)
+        asset = StaticAsset.from_bytes(CSS_BYTES, "text/css")
+        assert asset.br_body is None
+
+
+class TestMaybeNotModified:
+    """Test conditional request evaluation."""
+
+    def test_no_conditional_headers(self):
+        """Test plain requests are never considered not-modified."""
+        assert maybe_not_modified({}, '"abc"') is False
+
+    def test_if_none_match_exact(self):
+        """Test a matching ETag yields 304."""
+        assert maybe_not_modified({"If-None-Match": '"abc"'}, '"abc"') is True
+        assert maybe_not_modified({"If-None-Match": '"xyz"'}, '"abc"') is False
+
+    def test_if_none_match_list_weak_and_star(self):
+        """Test ETag lists, weak validators, and wildcard all match."""
+        assert maybe_not_modified({"If-None-Match": '"x", W/"abc"'}, '"abc"') is True
+        assert maybe_not_modified({"If-None-Match": "*"}, '"abc"') is True
+
+    def test_if_none_match_takes_precedence(self):
+        """Test a non-matching ETag wins over a fresh If-Modified-Since."""
+        headers = {"If-None-Match": '"old"', "If-Modified-Since": BUILD_TIME}
+        assert maybe_not_modified(headers, '"abc"') is False
+
+    def test_if_modified_since(self):
+        """Test dates at or after the build time yield 304."""
+        assert maybe_not_modified({"If-Modified-Since": BUILD_TIME}, '"abc"') is True
+        earlier = formatdate(BUILD_TIMESTAMP - 3600, usegmt=True)
+        assert maybe_not_modified({"If-Modified-Since": earlier}, '"abc"') is False
+
+    def test_if_modified_since_malformed(self):
+        """Test unparseable dates are ignored."""
+        assert maybe_not_modified({"If-Modified-Since": "yesterday"}, '"abc"') is False
+
+
+class TestMinification:
+    """Test import-time minifiers (line-based fallback path)."""
+
+    def test_minify_css_fallback(self, monkeypatch: pytest.MonkeyPatch):
+        """Test CSS fallback drops comments, indentation, and blank lines."""
+        monkeypatch.setattr(web_assets, "rcssmin", None)
+        css = "/* ===== Banner ===== */\n.a {\n    color: red;\n}\n\n.b { margin: 0; }\n"
+        assert minify_css(css) == ".a {\ncolor: red;\n}\n.b { margin: 0; }"
+
+    def test_minify_js_fallback(self, monkeypatch: pytest.MonkeyPatch):
+        """Test JS fallback keeps line breaks but drops comment lines."""
+        monkeypatch.setattr(web_assets, "rjsmin", None)
+        js = "// State\nlet a = 1\n    let b = 'x // y';\n\nfoo();\n"
+        assert minify_js(js) == "let a = 1\nlet b = 'x // y';\nfoo();"
+
+    def test_minify_html(self):
+        """Test HTML minifier drops comments and indentation."""
+        html = "<div>\n    <!-- populated later -->\n    <p>Hi</p>\n</div>\n"
+        assert minify_html(html) == "<div>\n<p>Hi</p>\n</div>"
+
+    def test_served_html_is_minified(self):
+        """Test the served shell has no comments or indentation."""
+        assert "<!--" not in HTML_CONTENT
+        assert "\n    " not in HTML_CONTENT
+        assert len(HTML_CONTENT) < len(HTML_TEMPLATE)
+
+
+class TestRenderHtml:
+    """Test server-side embedding of the run list."""
+
+    def test_render_embeds_json(self):
+        """Test the run payload is embedded in the initial-runs element."""
+        payload = json.dumps({"runs": [{"path": "/x/run1"}], "current_run": None})
+        html = render_html(payload).body.decode("utf-8")
+
+        assert f'<script id="initial-runs" type="application/json">{payload}</script>' in html
+        assert "__INITIAL_RUNS__" not in html
+
+    def test_render_default_is_null(self):
+        """Test the default render embeds null so the page fetches /api/runs."""
+        html = render_html().body.decode("utf-8")
+        assert '<script id="initial-runs" type="application/json">null</script>' in html
+
+    def test_render_escapes_script_terminators(self):
+        """Test "</script>" inside the payload cannot close the element."""
+        payload = json.dumps({"runs": [{"display_name": "</script><b>x"}]})
+        html = render_html(payload).body.decode("utf-8")
+
+        assert "</script><b>" not in html
+        embedded = html.split('type="application/json">')[1].split("</script>")[0]
+        assert json.loads(embedded) == json.loads(payload)
+
+    def test_render_declares_charset_in_header(self):
+        """Test the charset comes from Content-Type rather than a meta tag."""
+        asset = render_html()
+        assert asset.content_type == "text/html; charset=utf-8"
+        assert "<meta charset" not in asset.body.decode("utf-8")
+        assert not asset.body.startswith(b"\xef\xbb\xbf")
+
+    def test_render_is_cached_per_payload(self):
+        """Test identical payloads reuse the same rendered asset."""
+        assert render_html('{"runs": []}') is render_html('{"runs": []}')
+
+    def test_rendered_shell_has_no_last_modified(self):
+        """Test the generated shell relies on its ETag only."""
+        asset = render_html()
+        assert asset.last_modified is None
+        assert maybe_not_modified({"If-Modified-Since": BUILD_TIME}, asset.etag, None) is False